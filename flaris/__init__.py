@@ -1,6 +1,14 @@
 """The flaris subpackage provides the core functionality for the game."""
+from flaris.batch import *  # noqa: F401,F403
+from flaris.commands import *  # noqa: F401,F403
 from flaris.component import *  # noqa: F401,F403
 from flaris.entity import *  # noqa: F401,F403
+from flaris.fields import *  # noqa: F401,F403
 from flaris.game import *  # noqa: F401,F403
+from flaris.physics import *  # noqa: F401,F403
+from flaris.profiler import *  # noqa: F401,F403
+from flaris.scheduler import *  # noqa: F401,F403
+from flaris.spatial import *  # noqa: F401,F403
 from flaris.system import *  # noqa: F401,F403
 from flaris.transform import *  # noqa: F401,F403
+from flaris.world import *  # noqa: F401,F403
@@ -0,0 +1,135 @@
+"""Implements the `Batch` class."""
+from __future__ import annotations
+
+from typing import Dict, Iterator, List, TYPE_CHECKING, Union
+
+import numpy as np
+
+from .component import ComponentError
+
+if TYPE_CHECKING:
+    from .entity import Entity
+    from .fields import ComponentArray
+    from .world import Archetype
+
+__all__ = ["Batch", "FieldView"]
+
+Index = Union[slice, np.ndarray]
+Slots = Dict[type, np.ndarray]
+
+
+def _index(slots: np.ndarray) -> Index:
+    """Return a slice if the slots are consecutive, or else the slots."""
+    if len(slots) and slots[-1] - slots[0] == len(slots) - 1 and np.all(
+            np.diff(slots) == 1):
+        return slice(int(slots[0]), int(slots[-1]) + 1)
+    return slots
+
+
+class FieldView:  # pylint: disable=too-few-public-methods
+    """The fields of one component type for every entity in a batch.
+
+    Reading a field returns a NumPy array with one row per entity in the batch.
+    Assigning an array to a field writes each row back to the components. The
+    returned arrays may be copies, so in-place operations only take effect when
+    the result is assigned back to the field; augmented assignments such as
+    `view.position += offset` do this automatically.
+    """
+
+    __slots__ = ("_array", "_index")
+
+    def __init__(self, array: ComponentArray, index: Index):
+        """Initialize the view.
+
+        Args:
+            array: The array that stores the fields.
+            index: A slice or an array of the rows that store the fields of the
+                components in the batch.
+        """
+        object.__setattr__(self, "_array", array)
+        object.__setattr__(self, "_index", index)
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        """Return the values of a field for each entity in the batch."""
+        if name not in self._array.fields:
+            raise AttributeError(f"Components have no field named '{name}'.")
+        return self._array[name][self._index]
+
+    def __setattr__(self, name: str, value: np.ndarray) -> None:
+        """Store the values of a field for each entity in the batch."""
+        if name not in self._array.fields:
+            raise AttributeError(f"Components have no field named '{name}'.")
+        self._array[name][self._index] = value
+        self._array.modified(name, self._index)
+
+
+class Batch:
+    """The array-backed fields of a group of entities.
+
+    A batch contains every entity in a world that has a component of each of
+    a given set of types. Indexing a batch with one of those types returns a
+    `FieldView` of that type's fields. Row i of every field belongs to the
+    i-th entity of `Batch.entities`.
+
+    A batch is only valid until entities are next added to or removed from
+    the world, or gain or lose components.
+
+    Example:
+        >>> from flaris import ArrayComponent, Entity, Field, World
+        >>> class Timer(ArrayComponent):
+        ...     remaining = Field()
+        ...     def __init__(self, seconds):
+        ...         self.remaining = seconds
+        >>> class Bomb(Entity):
+        ...     def __init__(self):
+        ...         super().__init__()
+        ...         self.timer = Timer(3)
+        >>> world = World()
+        >>> world.add(Bomb())
+        >>> batch = world.batch(Timer)
+        >>> batch[Timer].remaining -= 0.5
+        >>> [bomb.timer.remaining for bomb in batch.entities]
+        [2.5]
+    """
+
+    def __init__(self, archetypes: List[Archetype], slots: Slots):
+        """Initialize the batch.
+
+        Args:
+            archetypes: The archetypes whose entities are in the batch.
+            slots: A dictionary that maps component types to the rows of
+                `ArrayComponent.ARRAY` that store the fields of each component
+                of that type, in entity order.
+        """
+        self._archetypes = archetypes
+        self._views = {
+            component_type: FieldView(component_type.ARRAY, _index(rows))
+            for component_type, rows in slots.items()
+        }
+        self._length = sum(len(archetype) for archetype in archetypes)
+
+    def __len__(self) -> int:
+        """Return the number of entities in the batch."""
+        return self._length
+
+    def __getitem__(self, component_type: type) -> FieldView:
+        """Return the fields of a component type for each entity."""
+        if component_type not in self._views:
+            raise ComponentError(
+                f"Expected one of {list(self._views)} but got {component_type}."
+            )
+        return self._views[component_type]
+
+    def rows(self, component_type: type) -> Index:
+        """Return the rows that store the fields of a component type.
+
+        The rows index `component_type.ARRAY`, in entity order. They're a slice
+        if the rows are consecutive, and an array of row indices otherwise.
+        """
+        return self[component_type]._index  # pylint: disable=protected-access
+
+    @property
+    def entities(self) -> Iterator[Entity]:
+        """Return an iterator over the entities in the batch."""
+        for archetype in self._archetypes:
+            yield from archetype.entities
@@ -0,0 +1,89 @@
+"""Implements the `CommandBuffer` class."""
+from __future__ import annotations
+
+from typing import Iterator, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .component import Component
+    from .entity import Entity
+
+__all__ = ["CommandBuffer"]
+
+SPAWN = "spawn"
+DESPAWN = "despawn"
+ATTACH = "attach"
+DETACH = "detach"
+
+Command = Tuple[str, "Entity", Optional[str], Optional["Component"]]
+
+
+class CommandBuffer:
+    """A queue of structural changes to apply to a world at a later time.
+
+    Adding or removing entities, and attaching or removing components, changes
+    which systems an entity belongs to. Systems record these changes while they
+    step, and the world applies them together once the frame's systems are done
+    iterating.
+
+    Example:
+        >>> from flaris import Entity, World
+        >>> world = World()
+        >>> world.commands.spawn(Entity())
+        >>> len(world)
+        0
+        >>> world.flush()
+        >>> len(world)
+        1
+    """
+
+    def __init__(self):
+        """Initialize an empty command buffer."""
+        self._commands: List[Command] = []
+
+    def __len__(self) -> int:
+        """Return the number of recorded commands."""
+        return len(self._commands)
+
+    def spawn(self, entity: Entity) -> None:
+        """Record that an entity should be added to the world.
+
+        Args:
+            entity: The entity to add.
+        """
+        self._commands.append((SPAWN, entity, None, None))
+
+    def despawn(self, entity: Entity) -> None:
+        """Record that an entity should be removed from the world.
+
+        Args:
+            entity: The entity to remove.
+        """
+        self._commands.append((DESPAWN, entity, None, None))
+
+    def attach(self, entity: Entity, name: str, component: Component) -> None:
+        """Record that a component should be attached to an entity.
+
+        Args:
+            entity: The entity to attach the component to.
+            name: The name of the attribute to store the component in.
+            component: The component to attach.
+        """
+        self._commands.append((ATTACH, entity, name, component))
+
+    def detach(self, entity: Entity, name: str) -> None:
+        """Record that a component should be removed from an entity.
+
+        Args:
+            entity: The entity to remove the component from.
+            name: The name of the attribute that stores the component.
+        """
+        self._commands.append((DETACH, entity, name, None))
+
+    def drain(self) -> Iterator[Command]:
+        """Remove and return the recorded commands in the order they were made.
+
+        Commands recorded while the returned commands are applied are kept for
+        the next call.
+        """
+        commands, self._commands = self._commands, []
+        return iter(commands)
@@ -1,29 +1,81 @@
 """Implements the `Component` class and the `ComponentError` exception."""
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Union
+from typing import Tuple, TYPE_CHECKING, Union
 
 if TYPE_CHECKING:
     from flaris.entity import Entity
 
 __all__ = ["Component", "ComponentError"]
 
+_BITS = {}
+_KEYS = {}
+
 
 class Component:  # pylint: disable=too-few-public-methods
     """Raw data for one aspect of an entity."""
 
+    __slots__ = ("_entity",)
+
+    def __new__(cls, *args, **kwargs):  # pylint: disable=unused-argument
+        """Construct a component that is not attached to an entity."""
+        component = super().__new__(cls)
+        object.__setattr__(component, "_entity", None)
+        return component
+
     @property
     def entity(self) -> Union[None, Entity]:
         """Return the entity that this component is attached to."""
-        if not hasattr(self, "_entity"):
-            self._entity = None
-        return self._entity
+        # The slot is assigned in `__new__`, which pylint doesn't follow.
+        return self._entity  # pylint: disable=no-member
 
     @entity.setter
     def entity(self, value) -> None:
         """Set the entity that this component is attached to."""
-        self._entity = value
+        # `object.__setattr__` is used so that frozen dataclasses, such as
+        # `Sprite`, can be attached to entities. See `Entity.__setattr__`.
+        object.__setattr__(self, "_entity", value)
 
 
 class ComponentError(Exception):
     """An exception raised when an entity lacks an expected component."""
+
+
+def component_mask(*component_types: type) -> int:
+    """Return a bitmask representing a set of component types.
+
+    Each component type is assigned its own bit the first time it is seen, so
+    an entity possesses a set of types if and only if its mask contains every
+    bit of the set's mask.
+
+    Args:
+        component_types: The component types to represent.
+
+    Returns:
+        An int with one bit set for each of the given component types.
+    """
+    mask = 0
+    for component_type in component_types:
+        if component_type not in _BITS:
+            _BITS[component_type] = 1 << len(_BITS)
+        mask |= _BITS[component_type]
+    return mask
+
+
+def component_keys(component_type: type) -> Tuple[type, ...]:
+    """Return the types that a component of the given type can be looked up by.
+
+    A component can be looked up by its own type and by any of its base classes
+    that subclass `Component`. The keys are computed once per type.
+
+    Args:
+        component_type: A subclass of `Component`.
+
+    Returns:
+        A tuple of component types in method resolution order.
+    """
+    if component_type not in _KEYS:
+        _KEYS[component_type] = tuple(
+            cls for cls in component_type.__mro__
+            if issubclass(cls, Component) and cls is not Component)
+    return _KEYS[component_type]
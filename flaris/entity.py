@@ -1,24 +1,52 @@
 """Implements the `Entity` class."""
-from typing import Any, Iterable
+from __future__ import annotations
 
-from .component import Component, ComponentError
+import collections
+from typing import Any, Generic, Iterable, Type, TYPE_CHECKING, TypeVar, Union
 
-__all__ = ["Entity"]
+from .component import (Component, ComponentError, component_keys,
+                        component_mask)
+
+if TYPE_CHECKING:
+    from .world import World
+
+__all__ = ["Entity", "EntityPool"]
 
 
 class Entity:
     """A collection of components representing a particular object.
 
     You should use this as the base class for all game objects.
+
+    The bookkeeping attributes of `Entity` are stored in slots. Subclasses that
+    are created and destroyed frequently can declare `__slots__` for their
+    components as well, so that instances don't need a `__dict__`:
+
+        >>> from flaris import Transform
+        >>> class Bullet(Entity):
+        ...     __slots__ = ("transform",)
+        ...     def __init__(self):
+        ...         super().__init__()
+        ...         self.transform = Transform()
     """
 
+    __slots__ = ("_components", "_index", "_mask", "_world", "_handle")
+
     def __init__(self):
         """Initialize the entity."""
         self._components = {}
+        self._index = {}
+        self._mask = 0
+        self._world = None
+        self._handle = None
 
     def __getitem__(self, key: type):
         """Return the component with the given type.
 
+        Components can also be looked up by any of their base classes. If more
+        than one attached component is an instance of the given type, then the
+        component that was attached first is returned.
+
         Args:
             key: A component type.
 
@@ -30,21 +58,23 @@ class Entity:
             ComponentError: If the entity does not have a component of the given
                 type.
         """
-        component_type = key
-        if component_type not in self._components:
+        try:
+            return self._index[key]
+        except KeyError as error:
             raise ComponentError(f"Entity {self} does not have a "
-                                 f"{component_type} component.")
-
-        return self._components[key]
+                                 f"{key} component.") from error
 
     def __contains__(self, key: type):
-        """Return true if the entity contains a component of the given type."""
+        """Return true if the entity contains a component of the given type.
+
+        Components of a subclass of the given type are also considered.
+        """
         try:
-            components = self.__dict__["_components"]
-        except KeyError as error:
+            index = self._index
+        except AttributeError as error:
             raise AttributeError("Cannot check components before "
                                  "Entity.__init__() call.") from error
-        return key in components
+        return key in index
 
     def __setattr__(self, name: str, value: Any) -> None:
         """Set an instance attribute.
@@ -69,8 +99,8 @@ class Entity:
         component = value
 
         try:
-            components = self.__dict__["_components"]
-        except KeyError as error:
+            components = self._components
+        except AttributeError as error:
             raise AttributeError("Cannot attach components before "
                                  "Entity.__init__() call.") from error
 
@@ -80,7 +110,16 @@ class Entity:
                                  f"attached.")
 
         components[type(component)] = component
-        component.entity = self
+        keys = component_keys(type(component))
+        for key in keys:
+            self._index.setdefault(key, component)
+        self._mask |= component_mask(*keys)
+        # `object.__setattr__` bypasses the `__setattr__` of frozen dataclasses
+        # like `Sprite` but still calls the `Component.entity` setter.
+        object.__setattr__(component, "entity", self)
+
+        if self._world is not None:
+            self._world.update(self)
 
     def __delattr__(self, name: str) -> None:
         """Delete an instance attribute.
@@ -94,21 +133,35 @@ class Entity:
                 an instance of `Component` and the `Entity` constructor has not
                 been called.
         """
-        value = self.__dict__[name]
+        value = getattr(self, name)
         object.__delattr__(self, name)  # pytype: disable=attribute-error
 
-        if isinstance(value, Component):
+        if not isinstance(value, Component):
             return
         component = value
 
         try:
-            components = self.__dict__["_components"]
+            components = self._components
         except AttributeError as error:
-            raise AttributeError("Cannot attach components before"
+            raise AttributeError("Cannot remove components before "
                                  "Entity.__init__() call.") from error
 
         del components[type(component)]
-        component.entity = None
+        self._reindex()
+        object.__setattr__(component, "entity", None)
+
+        if self._world is not None:
+            self._world.update(self)
+
+    def _reindex(self) -> None:
+        """Rebuild the component index and mask from the attached components."""
+        self._index = {}
+        self._mask = 0
+        for component in self._components.values():
+            keys = component_keys(type(component))
+            for key in keys:
+                self._index.setdefault(key, component)
+            self._mask |= component_mask(*keys)
 
     def update(self, delta: float):
         """Update this entity.
@@ -120,3 +173,115 @@ class Entity:
     def components(self) -> Iterable[Component]:
         """Return an iterator over the components attached to this entity."""
         return iter(self._components.values())
+
+    @property
+    def mask(self) -> int:
+        """Return a bitmask representing the types of the attached components.
+
+        See `flaris.component.component_mask`.
+        """
+        return self._mask
+
+    @property
+    def world(self) -> Union[None, World]:
+        """Return the world that this entity is stored in."""
+        return self._world
+
+    @world.setter
+    def world(self, value) -> None:
+        """Set the world that this entity is stored in."""
+        self._world = value
+
+    def reinitialize(self, *args, **kwargs) -> None:
+        """Prepare a released entity to be used again.
+
+        Every component is detached, and then the entity's constructor is run
+        again with the given arguments, which resets the entity's components
+        and world. `EntityPool` calls this when it reuses an entity. Subclasses
+        can override it to reuse their components instead of constructing new
+        ones.
+
+        Args:
+            args: Positional arguments for the entity constructor.
+            kwargs: Keyword arguments for the entity constructor.
+        """
+        for component in self._components.values():
+            object.__setattr__(component, "entity", None)
+        type(self).__init__(self, *args, **kwargs)
+
+    @property
+    def handle(self) -> Union[None, int]:
+        """Return the generational handle of this entity.
+
+        See `World.resolve`.
+        """
+        return self._handle
+
+    @handle.setter
+    def handle(self, value) -> None:
+        """Set the generational handle of this entity."""
+        self._handle = value
+
+
+_E = TypeVar("_E", bound=Entity)
+
+
+class EntityPool(Generic[_E]):
+    """A free list of entities that can be reused instead of reallocated.
+
+    Released entities are reinitialized with `Entity.reinitialize`, which runs
+    their constructor again, so entity types used with a pool should set every
+    component in `__init__`.
+
+    Example:
+        >>> from flaris import Transform, World
+        >>> class Bullet(Entity):
+        ...     def __init__(self, transform):
+        ...         super().__init__()
+        ...         self.transform = transform
+        >>> world = World()
+        >>> pool = EntityPool(Bullet)
+        >>> bullet = pool.acquire(Transform())
+        >>> world.add(bullet)
+        >>> pool.release(bullet)
+        >>> pool.acquire(Transform()) is bullet
+        True
+    """
+
+    def __init__(self, entity_type: Type[_E]):
+        """Initialize an empty pool.
+
+        Args:
+            entity_type: The type of entity stored in this pool.
+        """
+        self.entity_type = entity_type
+        self._free = collections.deque()
+
+    def __len__(self) -> int:
+        """Return the number of entities waiting to be reused."""
+        return len(self._free)
+
+    def acquire(self, *args, **kwargs) -> _E:
+        """Return a released entity, or a new entity if none are available.
+
+        Args:
+            args: Positional arguments for the entity constructor.
+            kwargs: Keyword arguments for the entity constructor.
+        """
+        # Entities released while their world was deferring structural changes
+        # can only be reused once the world has removed them.
+        if self._free and self._free[0].world is None:
+            entity = self._free.popleft()
+            entity.reinitialize(*args, **kwargs)
+            return entity
+        return self.entity_type(*args, **kwargs)
+
+    def release(self, entity: _E) -> None:
+        """Remove an entity from its world and store it for reuse.
+
+        Args:
+            entity: An entity returned by `EntityPool.acquire`.
+        """
+        if entity.world is not None:
+            entity.world.remove(entity)
+        self._free.append(entity)
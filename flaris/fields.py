@@ -0,0 +1,245 @@
+"""Implements array-backed component fields."""
+from __future__ import annotations
+
+import heapq
+import threading
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import numpy as np
+
+from .component import Component
+
+__all__ = ["ArrayComponent", "ComponentArray", "Field"]
+
+
+class Field:
+    """A component attribute stored in a `ComponentArray`.
+
+    Each instance of a component type with fields occupies one row of the
+    type's `ComponentArray`. Reading a field copies the value out of the row,
+    and assigning to a field writes the value into the row. Systems that need
+    the same field of many components can read and write whole columns instead;
+    see `World.batch`.
+
+    Example:
+        >>> class Velocity(ArrayComponent):
+        ...     value = Field(3)
+        ...     def __init__(self, x, y, z):
+        ...         self.value = (x, y, z)
+        >>> Velocity(1, 2, 3).value
+        array([1., 2., 3.])
+    """
+
+    def __init__(self,
+                 width: int = 1,
+                 default: Any = 0.0,
+                 wrap: Optional[Callable[..., Any]] = None,
+                 dtype: type = np.float64):
+        """Initialize the shape of the field.
+
+        Args:
+            width: The number of values stored for each component. Fields with
+                a width of 1 are read as Python scalars (default: 1).
+            default: The initial value of the field (default: 0.0).
+            wrap: A callable that converts the values in a row into the value
+                returned when the field is read. It's called with one argument
+                per value, like `wrap(x, y, z)`. If None, then fields wider than
+                1 are read as NumPy arrays (default: None).
+            dtype: The NumPy data type of the values (default: np.float64).
+        """
+        self.width = width
+        self.default = default
+        self.wrap = wrap
+        self.dtype = dtype
+        self.name = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Remember the name of the attribute this field is assigned to."""
+        self.name = name
+
+    def __get__(self, component: Optional[ArrayComponent], owner: type) -> Any:
+        """Return the value of this field for a component."""
+        if component is None:
+            return self
+        row = component.ARRAY[self.name][component.slot]
+        if self.width == 1:
+            return row.item()
+        if self.wrap is not None:
+            return self.wrap(*row.tolist())
+        return row.copy()
+
+    def __set__(self, component: ArrayComponent, value: Any) -> None:
+        """Store the value of this field for a component."""
+        if self.width != 1 and not isinstance(value, np.ndarray):
+            value = tuple(value)
+        component.ARRAY[self.name][component.slot] = value
+        component.ARRAY.modified(self.name, component.slot)
+
+    @property
+    def shape(self) -> tuple:
+        """Return the shape of the values stored for each component."""
+        return () if self.width == 1 else (self.width,)
+
+
+class ComponentArray:
+    """Contiguous storage for the fields of every instance of a component type.
+
+    Each field is stored in its own NumPy array, called a column. The values
+    of a component are stored in the row of each column given by the
+    component's `ArrayComponent.slot`. Rows are reused after their components
+    are garbage collected, and the columns are reallocated with twice the
+    capacity when every row is in use, so columns must not be kept across
+    frames.
+    """
+
+    def __init__(self, fields: Dict[str, Field], capacity: int = 64):
+        """Allocate empty columns.
+
+        Args:
+            fields: A dictionary that maps field names to fields.
+            capacity: The initial number of rows (default: 64).
+        """
+        self.fields = dict(fields)
+        self._columns = {
+            name: np.zeros((capacity,) + field.shape, dtype=field.dtype)
+            for name, field in self.fields.items()
+        }
+        self._free = list(range(capacity))
+        self._capacity = capacity
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of rows in use."""
+        return self._capacity - len(self._free)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """Return the column that stores a field, including unused rows."""
+        return self._columns[name]
+
+    @property
+    def capacity(self) -> int:
+        """Return the number of rows that can be used without reallocating."""
+        return self._capacity
+
+    def modified(self, name: str, rows: Union[int, slice, np.ndarray]) -> None:
+        """Respond to a change in the values of a field.
+
+        This is called after a field is assigned, either through a component
+        or through a `FieldView`. Subclasses can override it to keep values
+        derived from the fields up to date. Code that writes to a column
+        directly should call it too.
+
+        Args:
+            name: The name of the field that changed.
+            rows: An int, slice, or array of the rows that changed.
+        """
+
+    def allocate(self) -> int:
+        """Reserve a row and fill it with the default value of each field.
+
+        The lowest free row is used, so components created together tend to be
+        stored together.
+
+        Returns:
+            The index of the reserved row.
+        """
+        with self._lock:
+            if not self._free:
+                self._grow()
+            slot = heapq.heappop(self._free)
+        for name, field in self.fields.items():
+            self._columns[name][slot] = field.default
+        return slot
+
+    def release(self, slot: int) -> None:
+        """Free a row so that it can be reused.
+
+        Args:
+            slot: A row returned by `ComponentArray.allocate`.
+        """
+        with self._lock:
+            heapq.heappush(self._free, slot)
+
+    def _grow(self) -> None:
+        """Double the number of rows."""
+        capacity = self._capacity * 2
+        for name, column in self._columns.items():
+            grown = np.zeros((capacity,) + column.shape[1:], dtype=column.dtype)
+            grown[:self._capacity] = column
+            self._columns[name] = grown
+        self._free.extend(range(self._capacity, capacity))
+        self._capacity = capacity
+
+
+class ArrayComponent(Component):
+    """Base class for components whose fields are stored in arrays.
+
+    Subclasses declare their array-backed attributes as `Field` class
+    attributes. Every subclass that declares fields gets its own
+    `ComponentArray`, stored in `ARRAY`, which also holds the fields of its
+    base classes. Subclasses that don't declare fields share the array of their
+    base class.
+
+    To store the fields in a subclass of `ComponentArray`, pass it as the
+    `array` class keyword, like `class Transform(ArrayComponent,
+    array=TransformArray)`.
+
+    Attributes:
+        ARRAY: The `ComponentArray` storing the fields of every instance of
+            this type.
+    """
+
+    __slots__ = ("_slot",)
+
+    ARRAY: ComponentArray = None
+
+    def __init_subclass__(cls, array: Optional[type] = None, **kwargs):
+        """Create the array that stores the fields of a subclass."""
+        super().__init_subclass__(**kwargs)
+        if array is None and not any(
+                isinstance(value, Field) for value in vars(cls).values()):
+            return
+
+        fields = {}
+        for base in reversed(cls.__mro__):
+            for name, value in vars(base).items():
+                if isinstance(value, Field):
+                    fields[name] = value
+        if array is None:
+            array = type(cls.ARRAY) if cls.ARRAY else ComponentArray
+        cls.ARRAY = array(fields)
+
+    def __new__(cls, *args, **kwargs):
+        """Construct a component and reserve a row for its fields."""
+        component = super().__new__(cls, *args, **kwargs)
+        object.__setattr__(component, "_slot", cls.ARRAY.allocate())
+        return component
+
+    def __del__(self):
+        """Free the row that stores this component's fields."""
+        # The slot is assigned in `__new__`, which pylint doesn't follow.
+        self.ARRAY.release(self._slot)  # pylint: disable=no-member
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the fields and attributes of this component for copying."""
+        state = dict(getattr(self, "__dict__", {}))
+        for name in self.ARRAY.fields:
+            state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the fields and attributes of a copied component."""
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    @property
+    def slot(self) -> int:
+        """Return the row of `ARRAY` that stores this component's fields."""
+        return self._slot  # pylint: disable=no-member
+
+
+def gather(components: List[ArrayComponent]) -> np.ndarray:
+    """Return the rows of `ArrayComponent.ARRAY` that store each component."""
+    return np.fromiter((component.slot for component in components),
+                       dtype=np.intp,
+                       count=len(components))
@@ -1,34 +1,180 @@
 """Implements the `Game` class."""
 from __future__ import annotations
 
+import time
 from timeit import default_timer as timer
 from typing import Optional, TYPE_CHECKING
 
+from .profiler import PROFILER
 from .system import SequentialSystem, UpdateSystem
-from .rendering import Window, RenderingSystem
-from .inputs import InputSystem
+from .scheduler import ParallelSystem
+from .world import World
 
 if TYPE_CHECKING:
+    from .entity import Entity
     from .rendering import Icon
+    from .system import System
 
 __all__ = ["Game"]
 
 
 class Game(SequentialSystem):
-    """Base class for all games."""
+    """Base class for all games.
+
+    Each frame, the game polls for input, steps the simulation systems, and
+    then renders the scene.
+
+    By default, the simulation advances once per frame by the duration of the
+    previous frame. If a fixed timestep is given, the simulation instead
+    advances in increments of exactly that duration, as many times as needed to
+    catch up with the time that has passed. The fraction of a timestep left
+    over is stored in `World.alpha`, so renderers can interpolate between the
+    last two simulation states.
+
+    A headless game has no input or rendering systems and never imports
+    OpenGL, GLFW, or FreeType, so it can run on machines without a display.
+    Use `Game.run_headless` to run it.
+
+    Attributes:
+        world: The `World` that stores every entity added to the game.
+        simulation: A `ParallelSystem` containing the `UpdateSystem` and any
+            systems added with `Game.add_system`.
+        timestep: The fixed duration of a simulation step in seconds, or None
+            if the simulation is stepped once per frame.
+        max_steps: The maximum number of fixed simulation steps per frame. Time
+            that can't be simulated within this many steps is dropped, so a slow
+            frame doesn't make the next frame even slower.
+        headless: If true, the game only contains the simulation.
+    """
 
     _HAS_DYNAMIC_ATTRIBUTES = True
 
-    def __init__(self, name: str, icon: Optional[Icon] = None):
+    def __init__(self,
+                 name: str,
+                 icon: Optional[Icon] = None,
+                 timestep: Optional[float] = None,
+                 max_steps: int = 5,
+                 headless: bool = False):
         """Initialize the game.
 
         Args:
             name: The title of the game.
             icon: The window icon (default: None).
+            timestep: The fixed duration of a simulation step in seconds. If
+                None, the simulation is stepped once per frame (default: None).
+            max_steps: The maximum number of fixed simulation steps per frame
+                (default: 5).
+            headless: If true, don't create the input and rendering systems
+                (default: False).
         """
-        super().__init__([InputSystem(), UpdateSystem(), RenderingSystem()])
+        # pylint: disable=too-many-arguments
+        self.simulation = ParallelSystem([UpdateSystem()])
+        if headless:
+            super().__init__([self.simulation])
+        else:
+            # Imported here so that headless games don't load OpenGL and GLFW.
+            # pylint: disable=import-outside-toplevel
+            from .inputs import InputSystem
+            from .rendering import RenderingSystem
+            super().__init__(
+                [InputSystem(), self.simulation,
+                 RenderingSystem()])
         self.name = name
         self.icon = icon
+        self.timestep = timestep
+        self.max_steps = max_steps
+        self.headless = headless
+        self._accumulator = 0.0
+        self._running = False
+
+        self.world = World()
+        self.world.register(self)
+
+    def add(self, entity: Entity) -> None:
+        """Add an entity to the game.
+
+        The entity joins every system that accepts it. If components are later
+        attached to or removed from the entity, the systems it belongs to are
+        updated automatically.
+
+        Args:
+            entity: The entity to add.
+        """
+        self.world.add(entity)
+
+    def remove(self, entity: Entity) -> None:
+        """Remove an entity from the game."""
+        self.world.remove(entity)
+
+    def add_system(self, system: System) -> None:
+        """Add a system to the simulation.
+
+        Systems that declare `System.READS` and `System.WRITES` can run at the
+        same time as the other simulation systems they don't conflict with.
+
+        Args:
+            system: The system to add.
+        """
+        self.simulation.systems.append(system)
+        self.world.register(system)
+
+    def step(self, delta: float) -> None:
+        """Advance the game by one frame.
+
+        Entities added or removed, and components attached or removed, while
+        a system is stepping take effect once that system (or, for the
+        simulation, that simulation step) has finished.
+
+        Args:
+            delta: The amount of time required to complete the previous frame.
+        """
+        profiling = PROFILER.enabled
+        start_time = timer()
+        for system in self.systems:
+            if system is self.simulation:
+                self._simulate(delta)
+                continue
+
+            with self.world.deferred():
+                if profiling:
+                    PROFILER.step(system, delta)
+                else:
+                    system.step(delta)
+
+        if profiling:
+            PROFILER.record(self, start_time, timer())
+            PROFILER.end_frame()
+
+    def _simulate(self, delta: float) -> None:
+        """Advance the simulation by the time that has passed.
+
+        Args:
+            delta: The amount of time required to complete the previous frame.
+        """
+        if self.timestep is None:
+            with self.world.deferred():
+                self._step_simulation(delta)
+            return
+
+        self._accumulator += delta
+
+        steps = 0
+        while self._accumulator >= self.timestep and steps < self.max_steps:
+            with self.world.deferred():
+                self._step_simulation(self.timestep)
+            self._accumulator -= self.timestep
+            steps += 1
+
+        if self._accumulator >= self.timestep:
+            self._accumulator %= self.timestep
+        self.world.alpha = self._accumulator / self.timestep
+
+    def _step_simulation(self, delta: float) -> None:
+        """Step the simulation once, timing it if the profiler is enabled."""
+        if PROFILER.enabled:
+            PROFILER.step(self.simulation, delta)
+        else:
+            self.simulation.step(delta)
 
     def run(self, width: int, height: int, fullscreen: bool = False) -> None:
         """Run the game.
@@ -37,7 +183,15 @@ class Game(SequentialSystem):
             width: The width of the window.
             height: The height of the window.
             fullscreen: If true, make the window fullscreen (default: False).
+
+        Raises:
+            RuntimeError: if the game is headless.
         """
+        if self.headless:
+            raise RuntimeError(
+                "Headless games can't open a window; use Game.run_headless.")
+
+        from .rendering import Window  # pylint: disable=import-outside-toplevel
         with Window(self.name, width, height, fullscreen, self.icon) as window:
             self.start()
 
@@ -49,3 +203,51 @@ class Game(SequentialSystem):
                 delta = end_time - start_time
 
             self.exit()
+
+    def run_headless(self,
+                     steps: Optional[int] = None,
+                     rate: Optional[float] = None) -> None:
+        """Run the simulation without a window, input, or rendering.
+
+        If a tick rate is given, each tick advances the simulation by
+        `1 / rate` seconds and the game sleeps between ticks to hold that
+        rate. Otherwise, ticks run back to back and each advances the
+        simulation by the time the previous tick took. Either way, a fixed
+        `Game.timestep` still applies.
+
+        Args:
+            steps: The number of ticks to run. If None, run until `Game.stop`
+                is called (default: None).
+            rate: The target number of ticks per second. If None, run as fast
+                as possible (default: None).
+        """
+        self.simulation.start()
+        self._running = True
+
+        delta = 0 if rate is None else 1 / rate
+        deadline = timer()
+        tick = 0
+        while self._running and (steps is None or tick < steps):
+            start_time = timer()
+            self._simulate(delta)
+            tick += 1
+            if PROFILER.enabled:
+                PROFILER.end_frame()
+
+            if rate is None:
+                delta = timer() - start_time
+                continue
+
+            deadline += delta
+            remaining = deadline - timer()
+            if remaining > 0:
+                time.sleep(remaining)
+            else:
+                deadline = timer()
+
+        self._running = False
+        self.simulation.exit()
+
+    def stop(self) -> None:
+        """Stop `Game.run_headless` after the current tick."""
+        self._running = False
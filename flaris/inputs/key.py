@@ -29,6 +29,9 @@ def key_callback(  # pylint: disable=unused-argument
 class KeyboardHandlingSystem(System):
     """System that checks for keyboard input."""
 
+    READS = WRITES = ()
+    MAIN_THREAD = True
+
     def start(self) -> None:
         """Get reference to window and set callback function."""
         self.window = glfw.get_current_context()
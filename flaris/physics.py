@@ -0,0 +1,613 @@
+"""Implements rigid-body physics with vectorized collision detection."""
+from __future__ import annotations
+
+import itertools
+from typing import Callable, List, NamedTuple, Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from .batch import Batch, FieldView
+from .fields import ArrayComponent, Field
+from .system import System
+from .transform import Transform, Vector
+
+if TYPE_CHECKING:
+    from .entity import Entity
+
+__all__ = [
+    "BoxCollider", "CircleCollider", "Collider", "Contacts", "PhysicsSystem",
+    "RigidBody", "SphereCollider"
+]
+
+_SPHERE, _BOX, _CIRCLE = 0, 1, 2
+
+
+class Collider(ArrayComponent):
+    """Base class for the shapes that entities collide as.
+
+    Colliders are centered on the world position of their entity's transform,
+    and scaled by the transform's scale. An entity with a collider but no
+    `RigidBody` is static: other bodies collide with it, but it never moves.
+
+    Attributes:
+        shape: The kind of shape, set by each subclass.
+        extents: Half the size of a box along each axis, or the radius of a
+            sphere or circle in the first value.
+        trigger: If true, overlapping colliders are reported as triggers
+            instead of being pushed apart.
+    """
+
+    shape = Field(dtype=np.int8)
+    extents = Field(3, wrap=Vector)
+    trigger = Field(default=False, dtype=np.bool_)
+
+
+class BoxCollider(Collider):
+    """A box collider aligned with the world axes.
+
+    The rotation of the entity's transform is ignored.
+    """
+
+    def __init__(self, size: Vector = Vector(1, 1, 1), trigger: bool = False):
+        """Initialize the box.
+
+        Args:
+            size: The length of the box along each axis (default: 1 by 1 by 1).
+            trigger: If true, the collider is a trigger (default: False).
+        """
+        self.shape = _BOX
+        self.extents = size * 0.5
+        self.trigger = trigger
+
+
+class SphereCollider(Collider):
+    """A sphere collider."""
+
+    def __init__(self, radius: float = 0.5, trigger: bool = False):
+        """Initialize the sphere.
+
+        Args:
+            radius: The radius of the sphere (default: 0.5).
+            trigger: If true, the collider is a trigger (default: False).
+        """
+        self.shape = _SPHERE
+        self.extents = Vector(radius, radius, radius)
+        self.trigger = trigger
+
+
+class CircleCollider(Collider):
+    """A circle collider for 2D games.
+
+    Circles collide in the xy-plane; their z coordinate is ignored.
+    """
+
+    def __init__(self, radius: float = 0.5, trigger: bool = False):
+        """Initialize the circle.
+
+        Args:
+            radius: The radius of the circle (default: 0.5).
+            trigger: If true, the collider is a trigger (default: False).
+        """
+        self.shape = _CIRCLE
+        self.extents = Vector(radius, radius, radius)
+        self.trigger = trigger
+
+
+class RigidBody(ArrayComponent):
+    """The motion of an entity that is moved by the physics system.
+
+    Bodies with a mass of 0 are kinematic: they move with their velocity, but
+    gravity and collisions don't affect them.
+
+    Attributes:
+        velocity: The velocity of the body in units per second.
+        mass: The mass of the body, or 0 if the body is kinematic.
+        restitution: How much of the body's speed is kept when it bounces, from
+            0 for no bounce to 1 for a perfectly elastic bounce.
+        gravity_scale: A multiplier for the gravity applied to the body.
+        drag: The fraction of the body's velocity lost per second.
+    """
+
+    velocity = Field(3, wrap=Vector)
+    mass = Field(default=1.0)
+    restitution = Field()
+    gravity_scale = Field(default=1.0)
+    drag = Field()
+
+    def __init__(self,
+                 mass: float = 1.0,
+                 velocity: Vector = Vector(0, 0, 0),
+                 restitution: float = 0.0,
+                 gravity_scale: float = 1.0):
+        """Initialize the body.
+
+        Args:
+            mass: The mass of the body, or 0 if the body is kinematic
+                (default: 1).
+            velocity: The initial velocity of the body (default: at rest).
+            restitution: How much of the body's speed is kept when it bounces
+                (default: 0).
+            gravity_scale: A multiplier for the gravity applied to the body
+                (default: 1).
+        """
+        self.mass = mass
+        self.velocity = velocity
+        self.restitution = restitution
+        self.gravity_scale = gravity_scale
+
+
+class Contacts(NamedTuple):
+    """Pairs of colliders that touched, with one row per pair.
+
+    Attributes:
+        first: The first entity of each pair.
+        second: The second entity of each pair.
+        normals: An (n, 3) array containing, for each pair, the unit vector
+            that points from the first entity to the second.
+        depths: An array containing how far each pair overlaps.
+    """
+
+    first: List[Entity]
+    second: List[Entity]
+    normals: np.ndarray
+    depths: np.ndarray
+
+    @classmethod
+    def empty(cls) -> Contacts:
+        """Return contacts without any pairs."""
+        return cls([], [], np.empty((0, 3)), np.empty(0))
+
+    @classmethod
+    def concatenate(cls, contacts: List[Contacts]) -> Contacts:
+        """Return the pairs of several contacts as one."""
+        if len(contacts) == 1:
+            return contacts[0]
+        return cls(sum((c.first for c in contacts), []),
+                   sum((c.second for c in contacts), []),
+                   np.concatenate([c.normals for c in contacts]),
+                   np.concatenate([c.depths for c in contacts]))
+
+
+class PhysicsSystem(System):
+    """System that moves rigid bodies and resolves collisions between them.
+
+    Each step, the system integrates the velocities of every entity with a
+    `RigidBody`, then finds overlapping colliders with a spatial hash
+    broadphase, pushes colliding bodies apart, and makes them bounce. Each of
+    these stages is done for every body at once with NumPy operations.
+
+    The simulation advances in fixed timesteps, as many times per frame as
+    needed to catch up with the time that has passed, which keeps it stable
+    regardless of the frame rate. If the game already has a fixed timestep,
+    pass None so that the system steps once per simulation step.
+
+    Collisions and trigger overlaps are delivered in batches: after each step,
+    `PhysicsSystem.contacts` and `PhysicsSystem.triggers` contain every pair
+    found during the step, and `on_contact` and `on_trigger` are called with
+    them if they aren't empty. Triggers are reported every step while they
+    overlap.
+
+    Bodies are moved in world space by changing the position of their
+    transforms, so bodies should not be the children of rotated or scaled
+    transforms.
+
+    Attributes:
+        gravity: The acceleration applied to every body with a mass.
+        timestep: The fixed duration of a physics step in seconds, or None.
+        max_steps: The maximum number of physics steps per frame.
+        contacts: The collisions found during the most recent step.
+        triggers: The trigger overlaps found during the most recent step.
+        on_contact: A function called with `PhysicsSystem.contacts`, or None.
+        on_trigger: A function called with `PhysicsSystem.triggers`, or None.
+
+    Example:
+        >>> from flaris import Entity, World
+        >>> class Ball(Entity):
+        ...     def __init__(self):
+        ...         super().__init__()
+        ...         self.transform = Transform(Vector(0, 1, 0))
+        ...         self.collider = SphereCollider(radius=0.5)
+        ...         self.body = RigidBody(mass=1)
+        >>> class Floor(Entity):
+        ...     def __init__(self):
+        ...         super().__init__()
+        ...         self.transform = Transform()
+        ...         self.collider = BoxCollider(Vector(10, 1, 10))
+        >>> world = World()
+        >>> physics = PhysicsSystem()
+        >>> world.register(physics)
+        >>> ball, floor = Ball(), Floor()
+        >>> world.add(ball)
+        >>> world.add(floor)
+        >>> for _ in range(120):
+        ...     physics.step(1 / 60)
+        >>> round(ball.transform.position.y, 1)
+        1.0
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    REQUIRED_COMPONENTS = (Transform, Collider)
+    READS = (Transform, Collider, RigidBody)
+    WRITES = (Transform, RigidBody)
+
+    # The overlap allowed before bodies are pushed apart, and the fraction of
+    # the remaining overlap removed each step. Leaving a small overlap keeps
+    # resting bodies in contact instead of jittering.
+    SLOP = 0.005
+    CORRECTION = 0.8
+
+    def __init__(self,
+                 gravity: Vector = Vector(0, -9.81, 0),
+                 timestep: Optional[float] = 1 / 60,
+                 max_steps: int = 5):
+        """Initialize the system.
+
+        Args:
+            gravity: The acceleration applied to every body with a mass
+                (default: 9.81 units per second squared downwards).
+            timestep: The fixed duration of a physics step in seconds. If
+                None, the system steps once per frame (default: 1 / 60).
+            max_steps: The maximum number of physics steps per frame. Time
+                that can't be simulated within this many steps is dropped
+                (default: 5).
+        """
+        super().__init__()
+        self.gravity = gravity
+        self.timestep = timestep
+        self.max_steps = max_steps
+        self.contacts = Contacts.empty()
+        self.triggers = Contacts.empty()
+        self.on_contact: Optional[Callable[[Contacts], None]] = None
+        self.on_trigger: Optional[Callable[[Contacts], None]] = None
+        self._accumulator = 0.0
+        self._cache: Tuple[Optional[Batch], list, np.ndarray] = (None, [], None)
+
+    def step(self, delta: float) -> None:
+        """Advance the simulation by the time that has passed.
+
+        Args:
+            delta: The amount of time required to complete the previous frame.
+        """
+        contacts, triggers = [], []
+        if self.timestep is None:
+            self._simulate(delta, contacts, triggers)
+        else:
+            self._accumulator += delta
+            steps = 0
+            while (self._accumulator >= self.timestep and
+                   steps < self.max_steps):
+                self._simulate(self.timestep, contacts, triggers)
+                self._accumulator -= self.timestep
+                steps += 1
+            self._accumulator = min(self._accumulator, self.timestep)
+
+        self.contacts = (Contacts.concatenate(contacts)
+                         if contacts else Contacts.empty())
+        self.triggers = (Contacts.concatenate(triggers)
+                         if triggers else Contacts.empty())
+        # pylint: disable=not-callable
+        if self.on_contact and self.contacts.first:
+            self.on_contact(self.contacts)
+        if self.on_trigger and self.triggers.first:
+            self.on_trigger(self.triggers)
+
+    def _simulate(self, delta: float, contacts: List[Contacts],
+                  triggers: List[Contacts]) -> None:
+        """Advance the simulation by one step and collect its contacts."""
+        self._integrate(delta)
+        colliders = self.world.batch(Transform, Collider)
+        if len(colliders) < 2:
+            return
+        found, overlaps = self._collide(colliders)
+        if found.first:
+            contacts.append(found)
+        if overlaps.first:
+            triggers.append(overlaps)
+
+    def _integrate(self, delta: float) -> None:
+        """Apply gravity and drag, and move every body by its velocity."""
+        bodies = self.world.batch(Transform, RigidBody)
+        if not bodies:
+            return
+        view = bodies[RigidBody]
+        velocities = view.velocity
+        dynamic = view.mass > 0
+        velocities[dynamic] += (np.asarray(tuple(self.gravity)) * delta *
+                                view.gravity_scale[dynamic, np.newaxis])
+        velocities *= np.maximum(1 - view.drag * delta, 0)[:, np.newaxis]
+        view.velocity = velocities
+        bodies[Transform].position += velocities * delta
+
+    def _collide(self, colliders: Batch) -> Tuple[Contacts, Contacts]:
+        """Find overlapping colliders and resolve the collisions."""
+        # pylint: disable=too-many-locals
+        entities, body_slots = self._bodies(colliders)
+        rows = np.arange(Transform.ARRAY.capacity)[colliders.rows(Transform)]
+        view = colliders[Collider]
+        shapes, triggers = view.shape, view.trigger
+
+        matrices = Transform.ARRAY.world_matrices(rows)
+        centers = matrices[:, 3, :3].astype(np.float64)
+        scales = np.linalg.norm(matrices[:, :3, :3], axis=2)
+        half = np.where((shapes == _BOX)[:, np.newaxis], view.extents * scales,
+                        view.extents[:, :1] * scales.max(axis=1, keepdims=True))
+        lower, upper = centers - half, centers + half
+        # Circles are infinitely tall cylinders, so they overlap anything with
+        # the same x and y.
+        lower[shapes == _CIRCLE, 2] = -np.inf
+        upper[shapes == _CIRCLE, 2] = np.inf
+
+        first, second = _broadphase(centers, lower, upper)
+        # Pairs of static colliders can't move, so they're never reported.
+        moving = (body_slots[first] >= 0) | (body_slots[second] >= 0)
+        first, second = first[moving], second[moving]
+        first, second, normals, depths = _narrowphase(shapes, centers,
+                                                      (lower, upper),
+                                                      (first, second))
+
+        touching = depths > 0
+        first, second = first[touching], second[touching]
+        normals, depths = normals[touching], depths[touching]
+        sensing = triggers[first] | triggers[second]
+        self._resolve(body_slots, rows, (first[~sensing], second[~sensing],
+                                         normals[~sensing], depths[~sensing]))
+
+        def contacts(mask: np.ndarray) -> Contacts:
+            return Contacts([entities[i] for i in first[mask]],
+                            [entities[i] for i in second[mask]], normals[mask],
+                            depths[mask])
+
+        return contacts(~sensing), contacts(sensing)
+
+    def _resolve(self, body_slots: np.ndarray, rows: np.ndarray,
+                 contacts: Tuple[np.ndarray, ...]) -> None:
+        """Push colliding bodies apart and make them bounce.
+
+        Args:
+            body_slots: The slot of the `RigidBody` of each collider, or -1.
+            rows: The slot of the `Transform` of each collider.
+            contacts: The indices of the colliders in each colliding pair, the
+                normal of each pair, and the depth of each pair.
+        """
+        # pylint: disable=too-many-locals
+        first, second, normals, depths = contacts
+        count = len(body_slots)
+        has_body = body_slots >= 0
+        bodies = FieldView(RigidBody.ARRAY, body_slots[has_body])
+        masses = bodies.mass
+        inverse_masses = np.zeros(count)
+        inverse_masses[has_body] = np.divide(1,
+                                             masses,
+                                             out=np.zeros_like(masses),
+                                             where=masses > 0)
+        total = inverse_masses[first] + inverse_masses[second]
+        solid = total > 0
+        if not np.any(solid):
+            return
+        first, second, normals = first[solid], second[solid], normals[solid]
+        depths, total = depths[solid], total[solid]
+
+        velocities = np.zeros((count, 3))
+        velocities[has_body] = bodies.velocity
+        restitutions = np.zeros(count)
+        restitutions[has_body] = bodies.restitution
+
+        # Remove most of the overlap, split between the bodies by mass.
+        amounts = np.maximum(depths - self.SLOP, 0) * self.CORRECTION / total
+        corrections = np.zeros((count, 3))
+        shifts = normals * amounts[:, np.newaxis]
+        np.add.at(corrections, first,
+                  -shifts * inverse_masses[first, np.newaxis])
+        np.add.at(corrections, second,
+                  shifts * inverse_masses[second, np.newaxis])
+
+        # Apply an impulse along the normal to bodies that are approaching.
+        speeds = np.einsum("ij,ij->i", velocities[second] - velocities[first],
+                           normals)
+        bounce = np.maximum(restitutions[first], restitutions[second])
+        impulses = np.where(speeds < 0, -(1 + bounce) * speeds / total, 0)
+        changes = np.zeros((count, 3))
+        impulses = normals * impulses[:, np.newaxis]
+        np.add.at(changes, first, -impulses * inverse_masses[first, np.newaxis])
+        np.add.at(changes, second,
+                  impulses * inverse_masses[second, np.newaxis])
+
+        moved = np.unique(np.concatenate([first, second]))
+        moved = moved[inverse_masses[moved] > 0]
+        transforms = FieldView(Transform.ARRAY, rows[moved])
+        transforms.position += corrections[moved]
+        bodies = FieldView(RigidBody.ARRAY, body_slots[moved])
+        bodies.velocity += changes[moved]
+
+    def _bodies(self, colliders: Batch) -> Tuple[list, np.ndarray]:
+        """Return the entities of a batch and the slots of their bodies.
+
+        Entities without a `RigidBody` have a slot of -1. The result is cached
+        until the world returns a different batch.
+        """
+        if self._cache[0] is not colliders:
+            entities = list(colliders.entities)
+            slots = [
+                entity[RigidBody].slot if RigidBody in entity else -1
+                for entity in entities
+            ]
+            self._cache = (colliders, entities, np.array(slots, dtype=np.intp))
+        return self._cache[1], self._cache[2]
+
+
+def _broadphase(centers: np.ndarray, lower: np.ndarray,
+                upper: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the pairs of boxes that overlap.
+
+    Boxes are hashed into a uniform grid by their centers. The cells are as
+    large as the largest box, so boxes that overlap are always in the same or
+    neighboring cells. Boxes that are much larger than the typical box, like
+    floors and walls, would make every cell too large, so they're tested
+    against every other box instead.
+
+    Args:
+        centers: An (n, 3) array containing the center of each box.
+        lower: An (n, 3) array containing the smallest corner of each box.
+        upper: An (n, 3) array containing the largest corner of each box.
+
+    Returns:
+        Two arrays containing the indices of the boxes in each pair.
+    """
+    count = len(centers)
+    # Circles are infinitely tall, so the grid only uses the x and y axes if
+    # there are any.
+    axes = np.flatnonzero(np.isfinite(lower).all(axis=0))
+    sizes = (upper - lower)[:, axes].max(axis=1)
+    large = sizes > 4 * np.median(sizes)
+    small = np.flatnonzero(~large)
+
+    firsts, seconds = [], []
+    if small.size > 1:
+        first, second = _grid_pairs(centers[small][:, axes], sizes[small].max())
+        firsts += [small[first]]
+        seconds += [small[second]]
+    others = np.arange(count)
+    for box in np.flatnonzero(large):
+        second = others[~large | (others > box)]
+        second = second[second != box]
+        firsts += [np.full(len(second), box)]
+        seconds += [second]
+    if not firsts:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+
+    first, second = np.concatenate(firsts), np.concatenate(seconds)
+    overlap = np.all(
+        (lower[first] <= upper[second]) & (lower[second] <= upper[first]),
+        axis=1)
+    return first[overlap], second[overlap]
+
+
+def _grid_pairs(points: np.ndarray,
+                cell: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the pairs of points in the same or neighboring grid cells.
+
+    Each cell is given an integer code, and the points are sorted by the code
+    of their cell, so the points in any cell can be found with a binary search.
+    Only half of the neighboring cells are searched, so each pair is found
+    once.
+    """
+    keys = np.floor(points / max(cell, 1e-9)).astype(np.int64)
+    # Leave an empty layer of cells around the occupied ones, so that the
+    # codes of neighboring cells never wrap around.
+    keys -= keys.min(axis=0) - 1
+    spans = keys.max(axis=0) + 2
+    strides = np.cumprod(np.concatenate([[1], spans[:-1]]))
+    codes = keys @ strides
+    order = np.argsort(codes, kind="stable")
+    codes = codes[order]
+
+    neighbors = np.array(
+        list(itertools.product((-1, 0, 1), repeat=points.shape[1]))) @ strides
+    firsts, seconds = [], []
+    for offset in neighbors[neighbors >= 0]:
+        stops = np.searchsorted(codes, codes + offset, side="right")
+        if offset:
+            starts = np.searchsorted(codes, codes + offset, side="left")
+        else:
+            starts = np.arange(1, len(codes) + 1)
+        first, second = _runs(starts, stops)
+        firsts += [order[first]]
+        seconds += [order[second]]
+    return np.concatenate(firsts), np.concatenate(seconds)
+
+
+def _runs(starts: np.ndarray,
+          stops: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Pair each index i with every index in `range(starts[i], stops[i])`."""
+    counts = np.maximum(stops - starts, 0)
+    first = np.repeat(np.arange(len(starts)), counts)
+    second = (np.arange(counts.sum()) -
+              np.repeat(np.cumsum(counts) - counts - starts, counts))
+    return first, second
+
+
+def _narrowphase(
+    shapes: np.ndarray, centers: np.ndarray,
+    bounds: Tuple[np.ndarray, np.ndarray], pairs: Tuple[np.ndarray, np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Compute the contact normal and depth of each pair of colliders.
+
+    Pairs of a box and a round collider are reordered so that the box is
+    first.
+
+    Args:
+        shapes: The shape of each collider.
+        centers: An (n, 3) array containing the center of each collider.
+        bounds: Two (n, 3) arrays containing the smallest and largest corner
+            of the box around each collider.
+        pairs: Two arrays containing the indices of the colliders in each
+            pair.
+
+    Returns:
+        The indices of the colliders in each pair, the normal pointing from
+        the first collider to the second, and the depth of the overlap, which
+        is not positive if the colliders don't touch.
+    """
+    # pylint: disable=too-many-locals
+    lower, upper = bounds
+    first, second = pairs
+    boxes = shapes == _BOX
+    swap = ~boxes[first] & boxes[second]
+    first, second = (np.where(swap, second,
+                              first), np.where(swap, first, second))
+    normals = np.zeros((len(first), 3))
+    depths = np.zeros(len(first))
+    planar = (shapes[first] == _CIRCLE) | (shapes[second] == _CIRCLE)
+    radii = (upper[:, 0] - lower[:, 0]) / 2
+
+    # Two spheres or circles.
+    pairs = np.flatnonzero(~boxes[first])
+    offsets = centers[second[pairs]] - centers[first[pairs]]
+    offsets[planar[pairs], 2] = 0
+    distances = np.linalg.norm(offsets, axis=1)
+    normals[pairs] = _normalize(offsets, distances)
+    depths[pairs] = radii[first[pairs]] + radii[second[pairs]] - distances
+
+    # Two boxes, which are pushed apart along the axis they overlap least on.
+    pairs = np.flatnonzero(boxes[first] & boxes[second])
+    a, b = first[pairs], second[pairs]
+    overlaps = np.minimum(upper[a], upper[b]) - np.maximum(lower[a], lower[b])
+    axes = np.argmin(overlaps, axis=1)
+    signs = np.where(centers[b, axes] < centers[a, axes], -1, 1)
+    normals[pairs, axes] = signs
+    depths[pairs] = overlaps[np.arange(len(pairs)), axes]
+
+    # A box and a sphere or circle, pushed apart from the closest point on the
+    # box to the center of the sphere.
+    pairs = np.flatnonzero(boxes[first] & ~boxes[second])
+    a, b = first[pairs], second[pairs]
+    closest = np.clip(centers[b], lower[a], upper[a])
+    offsets = centers[b] - closest
+    offsets[planar[pairs], 2] = 0
+    distances = np.linalg.norm(offsets, axis=1)
+    normals[pairs] = _normalize(offsets, distances)
+    depths[pairs] = radii[b] - distances
+
+    # If the center is inside the box, it's pushed out of the nearest face.
+    inside = pairs[distances == 0]
+    if inside.size:
+        a, b = first[inside], second[inside]
+        faces = np.concatenate([centers[b] - lower[a], upper[a] - centers[b]],
+                               axis=1)
+        faces[planar[inside][:, np.newaxis] & (np.arange(6) % 3 == 2)] = np.inf
+        nearest = np.argmin(faces, axis=1)
+        normals[inside] = 0
+        normals[inside, nearest % 3] = np.where(nearest < 3, -1, 1)
+        depths[inside] = radii[b] + faces[np.arange(len(inside)), nearest]
+
+    return first, second, normals, depths
+
+
+def _normalize(vectors: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Divide vectors by their lengths, using the y-axis for zero vectors."""
+    normals = np.zeros_like(vectors)
+    normals[:, 1] = 1
+    nonzero = lengths > 0
+    normals[nonzero] = vectors[nonzero] / lengths[nonzero, np.newaxis]
+    return normals
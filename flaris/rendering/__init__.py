@@ -1,14 +1,17 @@
 """Classes for rendering objects on a screen."""
 from .camera import *  # noqa: F401, F403
 from .character import *  # noqa: F401, F403
+from .atlas import *  # noqa: F401, F403
 from .color import *  # noqa: F401, F403
 from .font import *  # noqa: F401, F403
 from .icon import *  # noqa: F401, F403
 from .light import *  # noqa: F401, F403
 from .material import *  # noqa: F401, F403
 from .mesh import *  # noqa: F401, F403
+from .queue import *  # noqa: F401, F403
 from .renderers import *  # noqa: F401, F403
 from .shader import *  # noqa: F401, F403
+from .state import *  # noqa: F401, F403
 from .sprite import *  # noqa: F401, F403
 from .systems import *  # noqa: F401, F403
 from .text import *  # noqa: F401, F403
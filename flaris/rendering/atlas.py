@@ -0,0 +1,159 @@
+"""Implements packing many textures into a few large textures."""
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import OpenGL.GL as gl
+
+from .state import RENDER_STATE
+from .texture import Texture
+
+__all__ = ["AtlasRegion", "TextureAtlas"]
+
+# Pages are sampled like `Texture`s, but clamped so that the edge pixels
+# around each texture are sampled instead of the other side of the page.
+_PARAMETERS = (
+    (gl.GL_TEXTURE_WRAP_S, gl.GL_CLAMP_TO_EDGE),
+    (gl.GL_TEXTURE_WRAP_T, gl.GL_CLAMP_TO_EDGE),
+    (gl.GL_TEXTURE_MIN_FILTER, gl.GL_LINEAR),
+    (gl.GL_TEXTURE_MAG_FILTER, gl.GL_NEAREST),
+)
+
+
+class AtlasRegion(NamedTuple):
+    """The place a texture is stored in an atlas.
+
+    Attributes:
+        page: The index of the atlas page that stores the texture.
+        uvs: The texture coordinates of the texture's lower left and upper
+            right corners in the page, as (u0, v0, u1, v1).
+    """
+
+    page: int
+    uvs: Tuple[float, float, float, float]
+
+
+class _Page:  # pylint: disable=too-few-public-methods
+    """An atlas texture, packed with rows of images called shelves."""
+
+    def __init__(self, size: int):
+        """Allocate an empty page.
+
+        Args:
+            size: The width and height of the page in pixels.
+        """
+        self.pixels = np.zeros((size, size, 4), dtype=np.uint8)
+        # Each shelf is a list of its bottom edge, height, and used width.
+        self.shelves: List[List[int]] = []
+        self.top = 0
+        self.name: Optional[int] = None
+        self.dirty = True
+
+    @property
+    def size(self) -> int:
+        """Return the width and height of the page in pixels."""
+        return len(self.pixels)
+
+    def place(self, width: int, height: int) -> Optional[Tuple[int, int]]:
+        """Reserve space for an image.
+
+        Returns:
+            The column and row of the image's lower left corner, or None if
+            the page doesn't have room for the image.
+        """
+        for shelf in self.shelves:
+            bottom, shelf_height, used = shelf
+            if height <= shelf_height and used + width <= self.size:
+                shelf[2] += width
+                return used, bottom
+        if width <= self.size and self.top + height <= self.size:
+            self.shelves.append([self.top, height, width])
+            self.top += height
+            return 0, self.top - height
+        return None
+
+
+class TextureAtlas:
+    """Textures packed into shared pages, so they can be drawn together.
+
+    Textures are added to the first page with room for them when they're first
+    looked up, and each page is uploaded to OpenGL when it's next used after a
+    texture is added to it. Textures larger than a page get a page of their
+    own. Each texture is surrounded by a copy of its edge pixels, so that
+    filtering doesn't blend in its neighbours.
+
+    Example:
+        >>> atlas = TextureAtlas()
+        >>> region = atlas.region(Texture("ball.png"))  # doctest: +SKIP
+        >>> texture = atlas.page(region.page)  # doctest: +SKIP
+    """
+
+    def __init__(self, size: int = 2048, padding: int = 1):
+        """Initialize an empty atlas.
+
+        Args:
+            size: The width and height of each page in pixels (default: 2048).
+            padding: The number of edge pixels copied around each texture
+                (default: 1).
+        """
+        self.size = size
+        self.padding = padding
+        self._pages: List[_Page] = []
+        self._regions: Dict[str, AtlasRegion] = {}
+
+    def __len__(self) -> int:
+        """Return the number of pages."""
+        return len(self._pages)
+
+    def region(self, texture: Texture) -> AtlasRegion:
+        """Return where a texture is stored, adding it if it's new.
+
+        Textures are identified by their path.
+        """
+        region = self._regions.get(texture.path)
+        if region is None:
+            region = self._add(texture)
+            self._regions[texture.path] = region
+        return region
+
+    def page(self, index: int) -> int:
+        """Return the OpenGL texture of a page, uploading it if it changed."""
+        page = self._pages[index]
+        if page.name is None:
+            page.name = gl.glGenTextures(1)
+            RENDER_STATE.bind_texture(0, page.name)
+            for parameter, value in _PARAMETERS:
+                gl.glTexParameteri(gl.GL_TEXTURE_2D, parameter, value)
+        if page.dirty:
+            RENDER_STATE.bind_texture(0, page.name)
+            gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_RGBA, page.size,
+                            page.size, 0, gl.GL_RGBA, gl.GL_UNSIGNED_BYTE,
+                            page.pixels)
+            page.dirty = False
+        return page.name
+
+    def _add(self, texture: Texture) -> AtlasRegion:
+        """Copy a texture into the first page with room for it."""
+        shape = texture.height, texture.width, 4
+        image = np.frombuffer(texture.data, dtype=np.uint8).reshape(shape)
+        padding = self.padding
+        padded = np.pad(image, ((padding, padding), (padding, padding), (0, 0)),
+                        mode="edge")
+        height, width = padded.shape[:2]
+
+        for index, page in enumerate(self._pages):
+            corner = page.place(width, height)
+            if corner is not None:
+                break
+        else:
+            index = len(self._pages)
+            page = _Page(max(self.size, width, height))
+            self._pages.append(page)
+            corner = page.place(width, height)
+
+        x, y = corner
+        page.pixels[y:y + height, x:x + width] = padded
+        page.dirty = True
+        size = page.size
+        return AtlasRegion(index, ((x + padding) / size, (y + padding) / size,
+                                   (x + width - padding) / size,
+                                   (y + height - padding) / size))
@@ -1,42 +1,64 @@
 """Implements the `Camera` class."""
 from dataclasses import dataclass
-import math
 
-import glfw
 import glm
+import numpy as np
 
 from flaris.component import Component, ComponentError
 from flaris.transform import Transform
 
+from .culling import frustum_planes
+from .window import surface_size
+
 __all__ = ["Camera", "OrthographicCamera"]
 
 
 class Camera(Component):
     """Base class for cameras."""
 
+    _view = None
+    _view_key = None
+
     @property
     def view(self) -> glm.mat4:
-        """Return the camera view matrix."""
+        """Return the camera view matrix.
+
+        The matrix is built from the world matrix of the camera's transform, so
+        a camera follows its parents, and is cached until the world matrix
+        changes.
+        """
         if not self.entity or Transform not in self.entity:
             raise ComponentError(
                 "Expected camera to be attached to an entity with a transform "
                 "component.")
 
-        position = glm.vec3(self.entity.transform.position.x,
-                            self.entity.transform.position.y,
-                            self.entity.transform.position.z)
-        front = glm.vec3(0.0, 0.0, -1.0)
-        upwards = glm.vec3(0.0, 1.0, 0.0)
-        angles = self.entity[Transform].rotation * math.pi / 180
-        rotation = glm.quat(glm.vec3(angles.x, angles.y, angles.z))
-        return glm.lookAt(position, position + rotation * front,
-                          rotation * upwards)
+        matrix = self.entity[Transform].world_model
+        key = matrix.tobytes()
+        if key == self._view_key:
+            return self._view
+
+        basis = matrix[:3, :3] / np.linalg.norm(
+            matrix[:3, :3], axis=1, keepdims=True)
+        position = glm.vec3(*matrix[3, :3].tolist())
+        front = glm.vec3(*(-basis[2]).tolist())
+        upwards = glm.vec3(*basis[1].tolist())
+        self._view = glm.lookAt(position, position + front, upwards)
+        self._view_key = key
+        return self._view
 
     @property
     def projection(self) -> glm.mat4:
         """Return a projection matrix."""
         raise NotImplementedError
 
+    @property
+    def frustum(self) -> np.ndarray:
+        """Return the planes of the volume the camera can see.
+
+        See `frustum_planes` for the layout of the planes.
+        """
+        return frustum_planes(self.projection * self.view)
+
 
 @dataclass
 class OrthographicCamera(Camera):
@@ -55,8 +77,7 @@ class OrthographicCamera(Camera):
     @property
     def projection(self) -> glm.mat4:
         """Return an orthographic projection matrix."""
-        window = glfw.get_current_context()
-        width, height = glfw.get_window_size(window)
+        width, height = surface_size()
         aspect_ratio = width / height
         left, right = (-aspect_ratio * self.size / 2,
                        aspect_ratio * self.size / 2)
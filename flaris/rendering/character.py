@@ -1,5 +1,6 @@
 """Implements the `Character` class."""
 from dataclasses import dataclass
+from typing import Tuple
 
 import glm  # pytype: disable=import-error
 
@@ -10,8 +11,14 @@ __all__ = ["Character"]
 # isn't exposed.
 @dataclass(frozen=True)
 class Character:
-    """Represents a character in a font."""
+    """Represents a character in a font.
+
+    The texture is shared by every character in the font, and `uvs` are the
+    texture coordinates of the upper left and lower right corners of the
+    character's glyph.
+    """
     texture: int
     size: glm.vec2
     bearing: glm.vec2
     advance: int
+    uvs: Tuple[float, float, float, float] = (0.0, 0.0, 1.0, 1.0)
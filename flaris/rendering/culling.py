@@ -0,0 +1,97 @@
+"""Implements testing bounding volumes against a camera's view frustum."""
+from typing import NamedTuple, Tuple
+
+import numpy as np
+
+__all__ = [
+    "CullingStats", "bounding_spheres", "frustum_planes", "in_frustum",
+    "view_depths"
+]
+
+
+class CullingStats(NamedTuple):
+    """The number of objects drawn and skipped in the most recent frame."""
+
+    visible: int
+    culled: int
+
+
+def frustum_planes(matrix: np.ndarray) -> np.ndarray:
+    """Extract the planes of a view frustum from a view-projection matrix.
+
+    The planes are extracted with the Gribb-Hartmann method, and normalized so
+    that the distance from a plane to a point is the dot product of the plane
+    with the point in homogeneous coordinates.
+
+    Args:
+        matrix: The product of a projection matrix and a view matrix, like
+            `np.array(camera.projection * camera.view)`.
+
+    Returns:
+        A (6, 4) array containing the left, right, bottom, top, near, and far
+        planes. Each normal points into the frustum.
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    rows = matrix[:3]
+    planes = np.concatenate([matrix[3] + rows, matrix[3] - rows])
+    planes = planes[[0, 3, 1, 4, 2, 5]]
+    return planes / np.linalg.norm(planes[:, :3], axis=1, keepdims=True)
+
+
+def bounding_spheres(lower: np.ndarray, upper: np.ndarray,
+                     matrices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return spheres in world space around boxes in model space.
+
+    Args:
+        lower: An (n, 3) array containing the smallest corner of each box.
+        upper: An (n, 3) array containing the largest corner of each box.
+        matrices: An (n, 4, 4) array of world matrices, as returned by
+            `TransformArray.world_matrices`.
+
+    Returns:
+        An (n, 3) array containing the center of each sphere, and an array
+        containing the radius of each sphere.
+    """
+    centers = np.einsum("ni,nij->nj", (lower + upper) / 2, matrices[:, :3, :3])
+    centers += matrices[:, 3, :3]
+    # The rows of each matrix are the images of the axes, so the longest row
+    # is the largest scale of the transform.
+    scales = np.linalg.norm(matrices[:, :3, :3], axis=2).max(axis=1)
+    radii = np.linalg.norm(upper - lower, axis=1) / 2 * scales
+    return centers, radii
+
+
+def in_frustum(planes: np.ndarray, centers: np.ndarray,
+               radii: np.ndarray) -> np.ndarray:
+    """Return which spheres are at least partly inside a view frustum.
+
+    Spheres near the corners of the frustum can be reported as inside when
+    they aren't, but spheres that are inside are never reported as outside.
+
+    Args:
+        planes: A (6, 4) array of planes, as returned by `frustum_planes`.
+        centers: An (n, 3) array containing the center of each sphere.
+        radii: An array containing the radius of each sphere.
+
+    Returns:
+        A boolean array that's true for each sphere inside the frustum.
+    """
+    distances = centers @ planes[:, :3].T + planes[:, 3]
+    return np.all(distances >= -radii[:, np.newaxis], axis=1)
+
+
+def view_depths(planes: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """Return how far points are between the near and far planes of a frustum.
+
+    Args:
+        planes: A (6, 4) array of planes, as returned by `frustum_planes`.
+        points: An (n, 3) array of points.
+
+    Returns:
+        An array containing the depth of each point, from 0 at the near plane
+        to 1 at the far plane. Points outside of the planes have depths less
+        than 0 or greater than 1.
+    """
+    near = points @ planes[4, :3] + planes[4, 3]
+    far = points @ planes[5, :3] + planes[5, 3]
+    return near / (near + far)
@@ -1,20 +1,59 @@
 """Implements the `Font` class."""
 import os
-from typing import Dict
+from typing import Dict, NamedTuple, Optional, Tuple
 
 import freetype
 import glm  # pytype: disable=import-error
+import numpy as np
 import OpenGL.GL as gl
 
 from flaris.rendering.character import Character
+from flaris.rendering.state import RENDER_STATE
 
-__all__ = ["Font"]
+__all__ = ["Font", "Glyphs"]
+
+# The number of empty pixels around each glyph, so that filtering doesn't
+# blend in its neighbours.
+_PADDING = 1
+
+_PARAMETERS = (
+    (gl.GL_TEXTURE_WRAP_S, gl.GL_CLAMP_TO_EDGE),
+    (gl.GL_TEXTURE_WRAP_T, gl.GL_CLAMP_TO_EDGE),
+    (gl.GL_TEXTURE_MIN_FILTER, gl.GL_LINEAR),
+    (gl.GL_TEXTURE_MAG_FILTER, gl.GL_LINEAR),
+)
+
+
+class Glyphs(NamedTuple):
+    """The glyphs of the ASCII characters in a font, packed into one bitmap.
+
+    Each array is indexed by character code.
+
+    Attributes:
+        pixels: A bitmap containing the coverage of every glyph, with its
+            first row at the top.
+        sizes: An (128, 2) array of the widths and heights of the glyphs in
+            pixels.
+        bearings: An (128, 2) array of the offsets from the pen position to the
+            left and top edges of the glyphs in pixels.
+        advances: The distance to move the pen after each glyph, in 1/64ths
+            of a pixel.
+        uvs: An (128, 4) array of the texture coordinates of the upper left and
+            lower right corners of the glyphs, as (u0, v0, u1, v1).
+    """
+
+    pixels: np.ndarray
+    sizes: np.ndarray
+    bearings: np.ndarray
+    advances: np.ndarray
+    uvs: np.ndarray
 
 
 class Font:  # pylint: disable=too-few-public-methods
     """Represents a font.
 
-    The character map is lazily loaded at runtime.
+    The glyphs are lazily loaded at runtime, and packed into one texture so
+    that a string can be drawn with one draw call.
 
     Attributes:
         characters: A dictionary that maps ASCII characters to `Character`
@@ -36,6 +75,30 @@ class Font:  # pylint: disable=too-few-public-methods
         self.path = path
         self.size = size
         self._characters = {}
+        self._glyphs: Optional[Glyphs] = None
+        self._texture: Optional[int] = None
+
+    @property
+    def glyphs(self) -> Glyphs:
+        """Return the glyphs of the ASCII characters, packed into one bitmap."""
+        if self._glyphs is None:
+            self._glyphs = _load_glyphs(self.path, self.size)
+        return self._glyphs
+
+    @property
+    def texture(self) -> int:
+        """Return the OpenGL texture that stores the glyph bitmap."""
+        if self._texture is None:
+            pixels = self.glyphs.pixels
+            self._texture = gl.glGenTextures(1)
+            RENDER_STATE.bind_texture(0, self._texture)
+            gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, 1)
+            gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_RED, pixels.shape[1],
+                            pixels.shape[0], 0, gl.GL_RED, gl.GL_UNSIGNED_BYTE,
+                            pixels)
+            for parameter, value in _PARAMETERS:
+                gl.glTexParameteri(gl.GL_TEXTURE_2D, parameter, value)
+        return self._texture
 
     @property
     def characters(self) -> Dict[str, Character]:
@@ -43,35 +106,63 @@ class Font:  # pylint: disable=too-few-public-methods
         if self._characters:
             return self._characters
 
-        gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, 1)
-
-        face = freetype.Face(self.path)
-        face.set_char_size(self.size * 64)
-
-        for i in range(128):
-            face.load_char(chr(i))
-
-            texture = gl.glGenTextures(1)
-            gl.glBindTexture(gl.GL_TEXTURE_2D, texture)
-            gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_RED,
-                            face.glyph.bitmap.width, face.glyph.bitmap.rows, 0,
-                            gl.GL_RED, gl.GL_UNSIGNED_BYTE,
-                            face.glyph.bitmap.buffer)
-
-            gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_S,
-                               gl.GL_CLAMP_TO_EDGE)
-            gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_T,
-                               gl.GL_CLAMP_TO_EDGE)
-            gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER,
-                               gl.GL_LINEAR)
-            gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER,
-                               gl.GL_LINEAR)
-
-            character = Character(
-                texture,
-                glm.ivec2(face.glyph.bitmap.width, face.glyph.bitmap.rows),
-                glm.ivec2(face.glyph.bitmap_left, face.glyph.bitmap_top),
-                face.glyph.advance.x)
-            self._characters[chr(i)] = character
+        glyphs = self.glyphs
+        for i, advance in enumerate(glyphs.advances.tolist()):
+            self._characters[chr(i)] = Character(
+                self.texture, glm.ivec2(*glyphs.sizes[i].tolist()),
+                glm.ivec2(*glyphs.bearings[i].tolist()), advance,
+                tuple(glyphs.uvs[i].tolist()))
 
         return self._characters
+
+
+def _load_glyphs(path: str, size: int) -> Glyphs:
+    """Render the ASCII characters of a font and pack them into one bitmap."""
+    face = freetype.Face(path)
+    face.set_char_size(size * 64)
+
+    bitmaps, bearings, advances = [], [], []
+    for i in range(128):
+        face.load_char(chr(i))
+        bitmap = face.glyph.bitmap
+        pixels = np.array(bitmap.buffer, dtype=np.uint8)
+        pixels = pixels.reshape(bitmap.rows, bitmap.pitch)[:, :bitmap.width]
+        bitmaps.append(pixels)
+        bearings.append((face.glyph.bitmap_left, face.glyph.bitmap_top))
+        advances.append(face.glyph.advance.x)
+
+    sizes = np.array([bitmap.shape[::-1] for bitmap in bitmaps]).reshape(-1, 2)
+    corners, shape = _pack(sizes + 2 * _PADDING)
+    corners += _PADDING
+    pixels = np.zeros(shape, dtype=np.uint8)
+    for (x, y), bitmap in zip(corners, bitmaps):
+        pixels[y:y + bitmap.shape[0], x:x + bitmap.shape[1]] = bitmap
+
+    uvs = np.concatenate([corners, corners + sizes], axis=1) / np.tile(
+        shape[::-1], 2)
+    return Glyphs(pixels, sizes, np.array(bearings), np.array(advances), uvs)
+
+
+def _pack(sizes: np.ndarray) -> Tuple[np.ndarray, Tuple[int, int]]:
+    """Place rectangles in rows, tallest first.
+
+    Args:
+        sizes: An (n, 2) array containing the width and height of each
+            rectangle.
+
+    Returns:
+        An (n, 2) array containing the column and row of each rectangle's
+        upper left corner, and the height and width of the packed area.
+    """
+    area = int(np.prod(sizes, axis=1).sum())
+    width = max(int(sizes[:, 0].max()),
+                1 << int(np.ceil(np.log2(max(area, 1)**0.5))))
+    corners = np.zeros_like(sizes)
+    x = y = row_height = 0
+    for i in np.argsort(-sizes[:, 1], kind="stable"):
+        if x + sizes[i, 0] > width:
+            x, y, row_height = 0, y + row_height, 0
+        corners[i] = x, y
+        x += sizes[i, 0]
+        row_height = max(row_height, sizes[i, 1])
+    return corners, (y + row_height, width)
@@ -2,8 +2,10 @@
 from dataclasses import dataclass
 
 import glm
+import numpy as np
 
 from flaris.entity import Component
+from flaris.transform import Transform
 
 from .color import Color
 
@@ -13,6 +15,25 @@ __all__ = ["Light", "DirectionalLight", "AmbientLight"]
 class Light(Component):
     """Base class for all lights."""
 
+    _direction = None
+    _direction_key = None
+
+    @property
+    def direction(self) -> glm.vec3:
+        """Return a unit vector pointing in the direction the light shines.
+
+        The direction is taken from the world matrix of the light's transform,
+        so a light follows its parents, and is cached until the world matrix
+        changes.
+        """
+        matrix = self.entity[Transform].world_model
+        key = matrix.tobytes()
+        if key != self._direction_key:
+            forward = matrix[2, :3] / np.linalg.norm(matrix[2, :3])
+            self._direction = glm.vec3(*forward.tolist())
+            self._direction_key = key
+        return self._direction
+
     @property
     def ambient(self) -> glm.vec3:
         """Return a vector reprsenting the color of ambient light."""
@@ -1,15 +1,35 @@
 """Implements the `Mesh` class."""
+from typing import Optional, Tuple
+
 from flaris.component import Component
+from flaris.transform import Vector
 
 __all__ = ["Mesh"]
 
 
 class Mesh(Component):  # pylint: disable=too-few-public-methods
-    """A collection of primitives defining three-dimensional geometry."""
+    """A collection of primitives defining three-dimensional geometry.
+
+    Attributes:
+        path: Path to a COLLADA model. Meshes with the same path are drawn
+            together.
+        bounds: The smallest and largest corners of a box around the mesh's
+            vertices in model space. Meshes outside of the camera's view are
+            culled using this box.
+    """
 
-    def __init__(self, path: str):
+    def __init__(self,
+                 path: str,
+                 bounds: Optional[Tuple[Vector, Vector]] = None):
         """Initialize instance attributes.
 
         Arguments:
             path: Path to a COLLADA model.
+            bounds: The smallest and largest corners of a box around the
+                mesh's vertices in model space (default: the unit cube
+                centered on the origin).
         """
+        if bounds is None:
+            bounds = (Vector(-0.5, -0.5, -0.5), Vector(0.5, 0.5, 0.5))
+        self.path = path
+        self.bounds = bounds
@@ -0,0 +1,118 @@
+"""Implements sorting draw calls to reduce state changes."""
+from typing import Callable, List, Sequence
+
+import numpy as np
+
+__all__ = ["RENDER_QUEUE", "RenderQueue", "sort_keys"]
+
+# The number of bits used by each part of a sort key below the layer and
+# transparency bits. The layer uses the top 8 bits.
+_SHADER_BITS = 12
+_MATERIAL_BITS = 19
+_DEPTH_BITS = 24
+
+Draw = Callable[[], None]
+
+
+def _low_bits(values: np.ndarray, bits: int) -> np.ndarray:
+    """Return the lowest bits of integers as uint64s."""
+    return np.asarray(values, dtype=np.uint64) & np.uint64((1 << bits) - 1)
+
+
+def sort_keys(layers: np.ndarray, transparent: np.ndarray, shaders: np.ndarray,
+              materials: np.ndarray, depths: np.ndarray) -> np.ndarray:
+    """Pack the properties of draw calls into integers that sort them.
+
+    Draw calls are sorted by layer first, and opaque calls come before
+    transparent calls in the same layer. Opaque calls are then sorted by
+    shader and material, so that calls sharing state are made together, and
+    then front to back, so that hidden fragments fail the depth test early.
+    Transparent calls are sorted back to front before anything else, so that
+    they blend correctly.
+
+    Shaders and materials are only compared for equality, so their low bits
+    are used as-is.
+
+    Args:
+        layers: The layer of each call, from 0 to 255. Lower layers are drawn
+            first.
+        transparent: Whether each call blends with what's behind it.
+        shaders: The shader program used by each call.
+        materials: An integer identifying the material or texture used by each
+            call.
+        depths: The depth of each call, from 0 at the camera's near plane to 1
+            at its far plane.
+
+    Returns:
+        An array of uint64 sort keys.
+    """
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    layers = np.asarray(layers, dtype=np.uint64)
+    transparent = np.asarray(transparent, dtype=bool)
+    shaders = _low_bits(shaders, _SHADER_BITS)
+    materials = _low_bits(materials, _MATERIAL_BITS)
+    scale = (1 << _DEPTH_BITS) - 1
+    depths = (np.clip(depths, 0, 1) * scale).astype(np.uint64)
+
+    state = (shaders << np.uint64(_MATERIAL_BITS)) | materials
+    state_bits = _SHADER_BITS + _MATERIAL_BITS
+    opaque_keys = (state << np.uint64(_DEPTH_BITS)) | depths
+    distances = np.uint64(scale) - depths
+    transparent_keys = (distances << np.uint64(state_bits)) | state
+    keys = np.where(transparent, transparent_keys, opaque_keys)
+
+    low_bits = state_bits + _DEPTH_BITS
+    keys |= transparent.astype(np.uint64) << np.uint64(low_bits)
+    keys |= layers << np.uint64(low_bits + 1)
+    return keys
+
+
+class RenderQueue:
+    """A list of draw calls that are made in sorted order once per frame.
+
+    Rendering systems submit their draw calls with keys from `sort_keys`
+    instead of drawing immediately. `RenderQueueSystem` then makes every call
+    in order of its key. Calls with equal keys are made in the order they were
+    submitted.
+    """
+
+    def __init__(self):
+        """Initialize an empty queue."""
+        self._keys: List[np.ndarray] = []
+        self._draws: List[Draw] = []
+
+    def __len__(self) -> int:
+        """Return the number of draw calls waiting to be made."""
+        return len(self._draws)
+
+    def submit(self, keys: np.ndarray, draws: Sequence[Draw]) -> None:
+        """Add draw calls to the queue.
+
+        Args:
+            keys: The sort key of each call, as returned by `sort_keys`.
+            draws: A callable for each call that draws something when it's
+                called with no arguments.
+        """
+        if len(keys) != len(draws):
+            raise ValueError(f"Expected {len(draws)} keys but got {len(keys)}.")
+        self._keys.append(np.asarray(keys, dtype=np.uint64))
+        self._draws.extend(draws)
+
+    def flush(self) -> int:
+        """Make every queued draw call in order, and then empty the queue.
+
+        Returns:
+            The number of draw calls made.
+        """
+        if not self._draws:
+            return 0
+        order = np.argsort(np.concatenate(self._keys), kind="stable")
+        draws = self._draws
+        self._keys, self._draws = [], []
+        for index in order:
+            draws[index]()
+        return len(draws)
+
+
+# The queue shared by every rendering system.
+RENDER_QUEUE = RenderQueue()
@@ -1,39 +1,49 @@
 """Implements rendering meshes."""
 import ctypes
+import functools
+from typing import List, Optional, Sequence
+
 import numpy as np
 import OpenGL.GL as gl
-import glm
 
 from flaris.transform import Transform
 
 from flaris.rendering.camera import Camera
 from flaris.rendering.shader import Shader
+from flaris.rendering.state import RENDER_STATE
 
 from ..light import Light
 from ..material import Material
 from ..mesh import Mesh
 
-__all__ = ["MeshRenderer"]
+__all__ = ["MAX_LIGHTS", "MeshRenderer"]
+
+# The number of lights that can be drawn in one pass. It must match MAX_LIGHTS
+# in DEFAULT_FRAGMENT_SHADER.
+MAX_LIGHTS = 16
 
 DEFAULT_VERTEX_SHADER = """
     #version 410 core
     layout (location = 0) in vec3 aPos;
     layout (location = 1) in vec3 aNormal;
     layout (location = 2) in vec2 aTexCoords;
+    layout (location = 3) in mat4 aModel;
+    layout (location = 7) in vec3 aAlbedo;
 
     out vec3 FragPos;
     out vec3 Normal;
     out vec2 TexCoords;
+    out vec3 Albedo;
 
-    uniform mat4 model;
     uniform mat4 view;
     uniform mat4 projection;
 
     void main()
     {
-        FragPos = vec3(model * vec4(aPos, 1.0));
-        Normal = mat3(transpose(inverse(model))) * aNormal;
+        FragPos = vec3(aModel * vec4(aPos, 1.0));
+        Normal = mat3(transpose(inverse(aModel))) * aNormal;
         TexCoords = aTexCoords;
+        Albedo = aAlbedo;
 
         gl_Position = projection * view * vec4(FragPos, 1.0);
     }
@@ -46,50 +56,87 @@ DEFAULT_FRAGMENT_SHADER = """
     struct Material {
         sampler2D ambient;
         sampler2D diffuse;
-        vec3 albedo;
     };
 
+    #define MAX_LIGHTS 16
+
     struct Light {
-        vec3 direction;
-        vec3 ambient;
-        vec3 diffuse;
+        vec4 direction;
+        vec4 ambient;
+        vec4 diffuse;
+    };
+
+    layout (std140) uniform Lights {
+        Light lights[MAX_LIGHTS];
     };
 
     in vec3 FragPos;
     in vec3 Normal;
     in vec2 TexCoords;
+    in vec3 Albedo;
 
     uniform vec3 viewPos;
     uniform Material material;
-    uniform Light light;
 
     void main()
     {
-        // ambient
-        vec3 ambient = material.albedo * light.ambient *
-            texture(material.ambient, TexCoords).rgb;
-
-        // diffuse
+        vec3 ambientColor = texture(material.ambient, TexCoords).rgb;
+        vec3 diffuseColor = texture(material.diffuse, TexCoords).rgb;
         vec3 norm = normalize(Normal);
-        vec3 lightDir = light.direction;
-        float diff = max(dot(norm, -lightDir), 0.0);
-        vec3 diffuse = material.albedo * light.diffuse *
-            (diff * texture(material.diffuse, TexCoords).rgb);
 
-        vec3 result = ambient + diffuse;
+        // LIGHT_COUNT is defined when the shader is compiled, so that the
+        // loop can be unrolled.
+        vec3 result = vec3(0.0);
+        for (int i = 0; i < LIGHT_COUNT; i++) {
+            // ambient
+            result += Albedo * lights[i].ambient.rgb * ambientColor;
+
+            // diffuse
+            float diff = max(dot(norm, -lights[i].direction.xyz), 0.0);
+            result += Albedo * lights[i].diffuse.rgb * (diff * diffuseColor);
+        }
         FragColor = vec4(result, 1.0);
     }
 """
 
-DEFAULT_MESH_SHADER = Shader.compile(vertex=DEFAULT_VERTEX_SHADER,
-                                     fragment=DEFAULT_FRAGMENT_SHADER)
+# The number of floats stored for each instance: a 4x4 matrix and an albedo.
+_INSTANCE_FLOATS = 19
+
+# The uniform buffer binding point of the Lights block, and the size of the
+# block in bytes: three vec4s per light.
+_LIGHTS_BINDING = 0
+_LIGHTS_SIZE = MAX_LIGHTS * 48
+
+
+@functools.lru_cache(maxsize=None)
+def _default_shader(light_count: int) -> Shader:
+    """Return the default mesh shader compiled for a number of lights."""
+    version, source = DEFAULT_FRAGMENT_SHADER.split("\n", 2)[1:]
+    fragment = f"{version}\n    #define LIGHT_COUNT {light_count}\n{source}"
+    return Shader.compile(vertex=DEFAULT_VERTEX_SHADER, fragment=fragment)
+
+
+class MeshRenderer:  # pylint: disable=too-many-instance-attributes
+    """A renderer for drawing meshes on the screen.
 
+    Every light in the scene is stored in a uniform buffer by
+    `MeshRenderer.set_lights`, and the shader adds up the light of up to
+    `MAX_LIGHTS` lights in one pass. More lights are split over several
+    passes.
+    """
 
-class MeshRenderer:  # pylint: disable=too-few-public-methods
-    """A renderer for drawing meshes on the screen."""
+    def __init__(self, camera: Camera, shader: Optional[Shader] = None):
+        """Initialize OpenGL buffer data.
 
-    def __init__(self, camera: Camera, shader: Shader = DEFAULT_MESH_SHADER):
-        """Initialize OpenGL buffer data."""
+        Args:
+            camera: The camera to draw meshes from.
+            shader: The shader to draw meshes with. The lights of a pass are
+                stored in its `Lights` uniform block, which contains
+                `MAX_LIGHTS` lights laid out like in DEFAULT_FRAGMENT_SHADER.
+                Lights past the end of a pass are zero, so they add no light.
+                If None, then the default shader is compiled for the number of
+                lights in each pass (default: None).
+        """
         self.camera = camera
 
         # TODO(@nspevacek): replace with vertices from loaded model once
@@ -127,7 +174,7 @@ class MeshRenderer:  # pylint: disable=too-few-public-methods
         self.vao = gl.glGenVertexArrays(1)
         vbo = gl.glGenBuffers(1)
 
-        gl.glBindVertexArray(self.vao)
+        RENDER_STATE.bind_vertex_array(self.vao)
 
         gl.glBindBuffer(gl.GL_ARRAY_BUFFER, vbo)
         gl.glBufferData(gl.GL_ARRAY_BUFFER, vertices.nbytes, vertices,
@@ -145,63 +192,140 @@ class MeshRenderer:  # pylint: disable=too-few-public-methods
                                  ctypes.c_void_p(24))
         gl.glEnableVertexAttribArray(2)
 
-    def draw(self, mesh: Mesh, transform: Transform, light: Light) -> None:  # pylint: disable=unused-argument  # noqa: E501
+        # Each instance has a world matrix, stored as four column attributes,
+        # and an albedo. The buffer is refilled before each draw.
+        self.instances = gl.glGenBuffers(1)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.instances)
+        stride = _INSTANCE_FLOATS * 4
+        for column in range(4):
+            gl.glVertexAttribPointer(3 + column, 4, gl.GL_FLOAT, gl.GL_FALSE,
+                                     stride, ctypes.c_void_p(16 * column))
+            gl.glEnableVertexAttribArray(3 + column)
+            gl.glVertexAttribDivisor(3 + column, 1)
+        gl.glVertexAttribPointer(7, 3, gl.GL_FLOAT, gl.GL_FALSE, stride,
+                                 ctypes.c_void_p(64))
+        gl.glEnableVertexAttribArray(7)
+        gl.glVertexAttribDivisor(7, 1)
+
+        # Each pass of lights is stored at an offset that can be bound on its
+        # own, so the lights of every pass are uploaded together.
+        alignment = int(gl.glGetIntegerv(gl.GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT))
+        self._lights_stride = -(-_LIGHTS_SIZE // alignment) * alignment
+        self.lights_buffer = gl.glGenBuffers(1)
+        self._shaders: List[Shader] = []
+        self._blocks = set()
+        self.set_lights([])
+
+    def draw(self,
+             mesh: Mesh,
+             transform: Transform,
+             model: Optional[np.ndarray] = None) -> None:
         """Draw a mesh on the screen.
 
+        The mesh is lit by the first pass of the lights passed to
+        `MeshRenderer.set_lights`, which only need to be uploaded once per
+        frame.
+
         Args:
             mesh: The mesh to draw.
             transform: The position, rotation, and scale of the mesh.
-            light: The light to draw.
+            model: The world matrix of the transform, as computed by
+                `TransformArray.world_matrices`. If None, then the matrix is
+                computed from the transform (default: None).
         """
-        gl.glUseProgram(self.shader.program)
-        gl.glBindVertexArray(self.vao)
-
-        gl.glActiveTexture(gl.GL_TEXTURE0)
-        gl.glBindTexture(gl.GL_TEXTURE_2D, mesh.entity[Material].ambient)
-
-        gl.glActiveTexture(gl.GL_TEXTURE1)
-        gl.glBindTexture(gl.GL_TEXTURE_2D, mesh.entity[Material].diffuse)
-
-        self.shader.set_int("material.ambient", 0)
-        self.shader.set_int("material.diffuse", 1)
-
-        model = glm.mat4(1.0)
-        model = glm.translate(
-            model,
-            glm.vec3(transform.position.x, transform.position.y,
-                     transform.position.z))
-
-        model = glm.rotate(model, glm.radians(transform.rotation.x),
-                           glm.vec3(1.0, 0.0, 0.0))
-        model = glm.rotate(model, glm.radians(transform.rotation.y),
-                           glm.vec3(0.0, 1.0, 0.0))
-        model = glm.rotate(model, glm.radians(transform.rotation.z),
-                           glm.vec3(0.0, 0.0, 1.0))
-
-        model = glm.scale(
-            model,
-            glm.vec3(transform.scale.x, transform.scale.y, transform.scale.z))
-
-        gl.glUniformMatrix4fv(
-            gl.glGetUniformLocation(self.shader.program, "model"), 1,
-            gl.GL_FALSE, glm.value_ptr(model))
-        gl.glUniformMatrix4fv(
-            gl.glGetUniformLocation(self.shader.program, "view"), 1,
-            gl.GL_FALSE, glm.value_ptr(self.camera.view))
-        gl.glUniformMatrix4fv(
-            gl.glGetUniformLocation(self.shader.program, "projection"), 1,
-            gl.GL_FALSE, glm.value_ptr(self.camera.projection))
-
-        angles = light.entity[Transform].rotation * 3.14159 / 180
-        rotation = glm.quat(glm.vec3(angles.x, angles.y, angles.z))
-        forwards = glm.vec3(0, 0, 1)
-        self.shader.set_vec3("light.direction", rotation * forwards)
-        self.shader.set_vec3("viewPos", self.camera.entity[Transform].position)
+        if model is None:
+            model = transform.world_model
         albedo = mesh.entity[Material].albedo
-        self.shader.set_vec3("material.albedo",
-                             glm.vec3(albedo.red, albedo.green, albedo.blue))
-        self.shader.set_vec3("light.diffuse", light.diffuse)
-        self.shader.set_vec3("light.ambient", light.ambient)
+        self.draw_instances(mesh, model[np.newaxis],
+                            np.array([[albedo.red, albedo.green, albedo.blue]]))
+
+    def set_lights(self,
+                   lights: Sequence[Light],
+                   lights_per_pass: int = MAX_LIGHTS) -> int:
+        """Upload the lights that meshes are drawn with.
+
+        Args:
+            lights: The lights in the scene.
+            lights_per_pass: The largest number of lights drawn in one pass,
+                from 1 to `MAX_LIGHTS` (default: `MAX_LIGHTS`).
 
-        gl.glDrawArrays(gl.GL_TRIANGLES, 0, 36)
-        gl.glBindVertexArray(0)
+        Returns:
+            The number of passes needed to draw every light.
+        """
+        if not 1 <= lights_per_pass <= MAX_LIGHTS:
+            raise ValueError(f"Expected lights per pass to be between 1 and "
+                             f"{MAX_LIGHTS} but got {lights_per_pass}.")
+        values = np.array(
+            [(*light.direction, 0, *light.ambient, 0, *light.diffuse, 0)
+             for light in lights],
+            dtype=np.float32).reshape(-1, 12)
+
+        passes = max(1, -(-len(values) // lights_per_pass))
+        data = np.zeros((passes, self._lights_stride // 4), dtype=np.float32)
+        self._shaders = []
+        for index in range(passes):
+            chunk = values[index * lights_per_pass:(index + 1) *
+                           lights_per_pass]
+            data[index, :chunk.size] = chunk.ravel()
+            self._shaders.append(self.shader or _default_shader(len(chunk)))
+
+        gl.glBindBuffer(gl.GL_UNIFORM_BUFFER, self.lights_buffer)
+        gl.glBufferData(gl.GL_UNIFORM_BUFFER, data.nbytes, data,
+                        gl.GL_STREAM_DRAW)
+        return passes
+
+    def shader_for(self, light_pass: int = 0) -> Shader:
+        """Return the shader that draws a pass of the current lights."""
+        return self._shaders[light_pass]
+
+    def draw_instances(self,
+                       mesh: Mesh,
+                       models: np.ndarray,
+                       albedos: np.ndarray,
+                       light_pass: int = 0) -> None:
+        """Draw many copies of a mesh with one draw call.
+
+        Every copy is drawn with the geometry and textures of the given mesh,
+        but with its own world matrix and albedo. The copies are lit by the
+        lights passed to `MeshRenderer.set_lights`.
+
+        Args:
+            mesh: The mesh to draw.
+            models: An (n, 4, 4) array containing the world matrix of each
+                copy, stored column by column like
+                `TransformArray.world_matrices`.
+            albedos: An (n, 3) array containing the albedo of each copy.
+            light_pass: The index of the pass whose lights are drawn
+                (default: 0).
+        """
+        shader = self.shader_for(light_pass)
+        if shader.program not in self._blocks:
+            block = gl.glGetUniformBlockIndex(shader.program, "Lights")
+            if block != gl.GL_INVALID_INDEX:
+                gl.glUniformBlockBinding(shader.program, block, _LIGHTS_BINDING)
+            self._blocks.add(shader.program)
+
+        RENDER_STATE.use_program(shader.program)
+        RENDER_STATE.bind_vertex_array(self.vao)
+        RENDER_STATE.bind_texture(0, mesh.entity[Material].ambient)
+        RENDER_STATE.bind_texture(1, mesh.entity[Material].diffuse)
+        RENDER_STATE.bind_uniform_buffer(_LIGHTS_BINDING, self.lights_buffer,
+                                         light_pass * self._lights_stride,
+                                         _LIGHTS_SIZE)
+
+        shader.set_int("material.ambient", 0)
+        shader.set_int("material.diffuse", 1)
+
+        shader.set_mat4("view", self.camera.view)
+        shader.set_mat4("projection", self.camera.projection)
+        shader.set_vec3("viewPos", self.camera.entity[Transform].position)
+
+        count = len(models)
+        instances = np.empty((count, _INSTANCE_FLOATS), dtype=np.float32)
+        instances[:, :16] = models.reshape(count, 16)
+        instances[:, 16:] = albedos
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.instances)
+        gl.glBufferData(gl.GL_ARRAY_BUFFER, instances.nbytes, instances,
+                        gl.GL_STREAM_DRAW)
+
+        gl.glDrawArraysInstanced(gl.GL_TRIANGLES, 0, 36, count)
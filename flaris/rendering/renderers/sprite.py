@@ -1,127 +1,267 @@
 """Implements rendering objects."""
 import ctypes
-import glfw
+from typing import Optional, Sequence, Tuple
+
 import glm  # pytype: disable=import-error
 import numpy as np
 import OpenGL.GL as gl
 
 from flaris.transform import Transform
 
+from flaris.rendering.atlas import TextureAtlas
 from flaris.rendering.shader import Shader
 from flaris.rendering.sprite import Sprite
+from flaris.rendering.state import RENDER_STATE
+from flaris.rendering.window import surface_size
 
-__all__ = ["SpriteRenderer"]
+__all__ = [
+    "SpriteRenderer", "sprite_matrices", "sprite_sizes", "sprite_vertices"
+]
 
 DEFAULT_VERTEX_SHADER = """
     #version 410 core
-    layout (location = 0) in vec4 vertex;
+    layout (location = 0) in vec2 aPos;
+    layout (location = 1) in vec2 aTexCoords;
+    layout (location = 2) in vec4 aColor;
 
     out vec2 TexCoords;
+    out vec4 Color;
 
-    uniform mat4 model;
     uniform mat4 projection;
 
     void main()
     {
-        TexCoords = vertex.zw;
-        gl_Position = projection * model * vec4(vertex.xy, 0.0, 1.0);
+        TexCoords = aTexCoords;
+        Color = aColor;
+        gl_Position = projection * vec4(aPos, 0.0, 1.0);
     }
     """
 
 DEFAULT_FRAGMENT_SHADER = """
     #version 410 core
     in vec2 TexCoords;
+    in vec4 Color;
     out vec4 color;
 
     uniform sampler2D image;
-    uniform vec3 spriteColor;
 
     void main()
     {
-        color = vec4(spriteColor, 1.0) * texture(image, TexCoords);
+        color = Color * texture(image, TexCoords);
     }
     """
 
-DEFAULT_SPRITE_SHADER = Shader.compile(vertex=DEFAULT_FRAGMENT_SHADER,
-                                       fragment=DEFAULT_VERTEX_SHADER)
+DEFAULT_SPRITE_SHADER = Shader.compile(vertex=DEFAULT_VERTEX_SHADER,
+                                       fragment=DEFAULT_FRAGMENT_SHADER)
 
+# The corners of each vertex of a sprite's two triangles. A corner at (0, 0)
+# has the texture coordinates of the texture's lower left corner.
+_CORNERS = np.array([(0, 1), (1, 0), (0, 0), (0, 1), (1, 1), (1, 0)],
+                    dtype=np.float32)
 
-class SpriteRenderer:  # pylint: disable=too-few-public-methods
-    """A renderer for drawing sprites on the screen."""
+# The number of floats stored for each vertex: a position, texture coordinates,
+# and a color.
+_VERTEX_FLOATS = 8
 
-    def __init__(self, shader: Shader = DEFAULT_SPRITE_SHADER):
-        """Initialize OpenGL buffer data."""
-        # yapf: disable
-        vertices = np.array([
-            0.0, 1.0, 0.0, 1.0,
-            1.0, 0.0, 1.0, 0.0,
-            0.0, 0.0, 0.0, 0.0,
-            0.0, 1.0, 0.0, 1.0,
-            1.0, 1.0, 1.0, 1.0,
-            1.0, 0.0, 1.0, 0.0
-        ], dtype=np.float32)
-        # yapf: enable
 
-        self.shader = shader
+def sprite_matrices(positions: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+    """Compute the model matrices of many sprites at once.
 
-        self.vao = gl.glGenVertexArrays(1)
-        vbo = gl.glGenBuffers(1)
+    A sprite matrix stretches the unit quad to the size of the sprite, rotates
+    it 180 degrees around its center, and then translates it to the position of
+    the sprite.
 
-        gl.glBindVertexArray(self.vao)
+    Args:
+        positions: An (n, 2) array of the screen positions of the sprites.
+        sizes: An (n, 2) array of the widths and heights of the sprites in
+            pixels, including the scale of their transforms.
 
-        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, vbo)
-        gl.glBufferData(gl.GL_ARRAY_BUFFER, vertices.nbytes, vertices,
-                        gl.GL_STATIC_DRAW)
+    Returns:
+        An (n, 4, 4) float32 array containing one matrix per sprite, stored
+        column by column like `TransformArray.model_matrices`.
+    """
+    matrices = np.zeros((len(positions), 4, 4), dtype=np.float32)
+    matrices[:, 0, 0] = -sizes[:, 0]
+    matrices[:, 1, 1] = -sizes[:, 1]
+    matrices[:, 2, 2] = 1
+    matrices[:, 3, :2] = positions + sizes
+    matrices[:, 3, 3] = 1
+    return matrices
 
-        gl.glEnableVertexAttribArray(0)
-        gl.glVertexAttribPointer(0, 4, gl.GL_FLOAT, gl.GL_FALSE,
-                                 vertices.itemsize * 4, ctypes.c_void_p(0))
-        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
-        gl.glBindVertexArray(0)
 
-    def __del__(self):
-        """Delete VAO."""
-        # NOTE(@bveeramani): Seems like there's some issue with PyOpenGL that's
-        # causing this to bug out. See https://rb.gy/g4cj2k.
-        # gl.glDeleteVertexArrays(1, self.vao);
+def sprite_sizes(sprites: Sequence[Sprite], matrices: np.ndarray) -> np.ndarray:
+    """Compute the sizes of many sprites at once.
+
+    The texture of each sprite is scaled by the lengths of the x and y axes of
+    its world matrix, so a sprite is scaled by its parents as well.
+
+    Args:
+        sprites: The sprites to compute the sizes of.
+        matrices: An (n, 4, 4) array of the world matrices of the sprites, as
+            returned by `TransformArray.world_matrices`.
+
+    Returns:
+        An (n, 2) array of the widths and heights of the sprites in pixels.
+    """
+    textures = np.array([
+        (sprite.texture.width, sprite.texture.height) for sprite in sprites
+    ])
+    return textures * np.linalg.norm(matrices[:, :2, :3], axis=2)
+
+
+def sprite_vertices(positions: np.ndarray, sizes: np.ndarray, uvs: np.ndarray,
+                    colors: np.ndarray) -> np.ndarray:
+    """Compute the vertices of many sprites at once.
+
+    Each sprite is drawn as two triangles, rotated 180 degrees around the
+    sprite's center like the matrices returned by `sprite_matrices`.
+
+    Args:
+        positions: An (n, 2) array of the screen positions of the sprites.
+        sizes: An (n, 2) array of the widths and heights of the sprites in
+            pixels, including the scale of their transforms.
+        uvs: An (n, 4) array of the lower left and upper right texture
+            coordinates of each sprite, as (u0, v0, u1, v1).
+        colors: An (n, 4) array of the RGBA color of each sprite.
+
+    Returns:
+        An (n * 6, 8) float32 array containing the screen position, texture
+        coordinates, and color of each vertex.
+    """
+    count = len(positions)
+    vertices = np.empty((count, len(_CORNERS), _VERTEX_FLOATS),
+                        dtype=np.float32)
+    corners = _CORNERS[np.newaxis]
+    vertices[...,
+             0:2] = (positions + sizes)[:, np.newaxis] - (sizes[:, np.newaxis] *
+                                                          corners)
+    vertices[...,
+             2:4] = uvs[:, np.newaxis, :2] + corners * (uvs[:, np.newaxis, 2:] -
+                                                        uvs[:, np.newaxis, :2])
+    vertices[..., 4:8] = colors[:, np.newaxis]
+    return vertices.reshape(-1, _VERTEX_FLOATS)
+
+
+def _on_screen(positions: np.ndarray, sizes: np.ndarray,
+               screen: Tuple[int, int]) -> np.ndarray:
+    """Return the indices of the rectangles that overlap the screen."""
+    lower = np.minimum(positions, positions + sizes)
+    upper = np.maximum(positions, positions + sizes)
+    return np.flatnonzero(np.all((upper >= 0) & (lower <= screen), axis=1))
+
+
+class SpriteRenderer:
+    """A renderer for drawing sprites on the screen.
+
+    Sprite textures are packed into a `TextureAtlas`, and every sprite drawn
+    together is written to one vertex buffer. The sprites on each atlas page
+    are then drawn with one draw call.
 
-    def draw(self, sprite: Sprite, transform: Transform) -> None:
+    Attributes:
+        atlas: The atlas that stores the sprite textures.
+    """
+
+    def __init__(self,
+                 shader: Shader = DEFAULT_SPRITE_SHADER,
+                 atlas: Optional[TextureAtlas] = None):
+        """Initialize OpenGL buffer data.
+
+        Args:
+            shader: The shader to use for rendering sprites.
+            atlas: The atlas to pack sprite textures into. If None, then the
+                renderer creates its own (default: None).
+        """
+        self.shader = shader
+        self.atlas = atlas if atlas is not None else TextureAtlas()
+
+        self.vao = gl.glGenVertexArrays(1)
+        self.vbo = gl.glGenBuffers(1)
+
+        RENDER_STATE.bind_vertex_array(self.vao)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.vbo)
+        stride = _VERTEX_FLOATS * 4
+        for location, (size, offset) in enumerate(((2, 0), (2, 8), (4, 16))):
+            gl.glEnableVertexAttribArray(location)
+            gl.glVertexAttribPointer(location, size, gl.GL_FLOAT, gl.GL_FALSE,
+                                     stride, ctypes.c_void_p(offset))
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
+
+    def draw(self,
+             sprite: Sprite,
+             transform: Transform,
+             model: Optional[np.ndarray] = None) -> None:
         """Draw a sprite on the screen.
 
         Args:
             sprite: The sprite to draw.
             transform: The position, rotation, and scale of the sprite.
+            model: The model matrix of the sprite, as computed by
+                `sprite_matrices`. If None, then the matrix is computed from
+                the transform (default: None).
         """
-        # pylint: disable=c-extension-no-member, no-member
-        gl.glUseProgram(self.shader.program)
-        gl.glBindTexture(gl.GL_TEXTURE_2D, sprite.texture.name)
+        if model is None:
+            matrices = transform.world_model[np.newaxis]
+            model = sprite_matrices(matrices[:, 3, :2],
+                                    sprite_sizes([sprite], matrices))[0]
+        size = -np.array([[model[0, 0], model[1, 1]]])
+        self.draw_batch([sprite], model[np.newaxis, 3, :2] - size, size)
 
-        window = glfw.get_current_context()
-        window_width, window_height = glfw.get_window_size(window)
-        projection = glm.ortho(0.0, window_width, window_height, 0.0, -1.0, 1.0)
+    def draw_batch(self, sprites: Sequence[Sprite], positions: np.ndarray,
+                   sizes: np.ndarray) -> None:
+        """Draw many sprites with one draw call per atlas page.
+
+        Sprites that are entirely off the screen are skipped. Sprites on the
+        same page are drawn in order.
+
+        Args:
+            sprites: The sprites to draw.
+            positions: An (n, 2) array of the screen positions of the sprites.
+            sizes: An (n, 2) array of the widths and heights of the sprites in
+                pixels, including the scale of their transforms.
+        """
+        window_width, window_height = surface_size()
+        visible = _on_screen(positions, sizes, (window_width, window_height))
+        if visible.size == 0:
+            return
+        vertices, pages = self._vertices([sprites[i] for i in visible],
+                                         positions[visible], sizes[visible])
 
-        width = sprite.texture.width * transform.scale.x
-        height = sprite.texture.height * transform.scale.y
+        RENDER_STATE.use_program(self.shader.program)
+        RENDER_STATE.set_blend((gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA))
+        RENDER_STATE.set_depth(gl.GL_LESS)
+        RENDER_STATE.bind_vertex_array(self.vao)
 
+        projection = glm.ortho(0.0, window_width, window_height, 0.0, -1.0, 1.0)
         self.shader.set_int("image", 0)
         self.shader.set_mat4("projection", projection)
 
-        model = glm.mat4(1.0)
-        model = glm.translate(
-            model, glm.vec3(transform.position.x, transform.position.y, 0.0))
-
-        model = glm.translate(model, glm.vec3(0.5 * width, 0.5 * height, 0.0))
-        model = glm.rotate(model, glm.radians(180.0), glm.vec3(0.0, 0.0, 1.0))
-        model = glm.translate(model, glm.vec3(-0.5 * width, -0.5 * height, 0.0))
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.vbo)
+        gl.glBufferData(gl.GL_ARRAY_BUFFER, vertices.nbytes, vertices,
+                        gl.GL_STREAM_DRAW)
 
-        model = glm.scale(model, glm.vec3(width, height, 1.0))
+        counts = np.bincount(pages, minlength=len(self.atlas))
+        first = 0
+        for page, count in enumerate(counts):
+            if count:
+                RENDER_STATE.bind_texture(0, self.atlas.page(page))
+                gl.glDrawArrays(gl.GL_TRIANGLES, first * len(_CORNERS),
+                                count * len(_CORNERS))
+                first += count
 
-        self.shader.set_mat4("model", model)
-        # TODO(@bveeramani): Add support for color alpha.
-        self.shader.set_vec3(
-            "spriteColor",
-            glm.vec3(sprite.color.red, sprite.color.green, sprite.color.blue))
+    def _vertices(self, sprites: Sequence[Sprite], positions: np.ndarray,
+                  sizes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the vertices of sprites sorted by atlas page.
 
-        gl.glBindVertexArray(self.vao)
-        gl.glDrawArrays(gl.GL_TRIANGLES, 0, 6)
-        gl.glBindVertexArray(0)
+        Returns:
+            The vertices of the sprites, and the sorted page of each sprite.
+        """
+        regions = [self.atlas.region(sprite.texture) for sprite in sprites]
+        pages = np.array([region.page for region in regions])
+        uvs = np.array([region.uvs for region in regions])
+        colors = np.array([(sprite.color.red, sprite.color.green,
+                            sprite.color.blue, sprite.color.alpha)
+                           for sprite in sprites])
+        order = np.argsort(pages, kind="stable")
+        vertices = sprite_vertices(positions[order], sizes[order], uvs[order],
+                                   colors[order])
+        return vertices, pages[order]
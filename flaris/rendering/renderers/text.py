@@ -1,21 +1,26 @@
 """Implements the `TextRenderer` class."""
 from __future__ import annotations
 
-import ctypes
-from typing import TYPE_CHECKING
+import functools
+from typing import TYPE_CHECKING, Optional
 
-import glfw
 import glm  # pytype: disable=import-error
 import OpenGL.GL as gl
 import numpy as np
 
 from flaris.rendering.shader import Shader
+from flaris.rendering.state import RENDER_STATE
+from flaris.rendering.window import surface_size
 
 if TYPE_CHECKING:
     from flaris.transform import Transform
+    from flaris.rendering.font import Font
     from flaris.rendering.text import Text
 
-__all__ = ["TextRenderer"]
+__all__ = ["TextRenderer", "text_vertices"]
+
+# The corners of the two triangles of a glyph's quad, in texture space.
+_CORNERS = np.array([(0, 0), (0, 1), (1, 1), (0, 0), (1, 1), (1, 0)])
 
 DEFAULT_VERTEX_SHADER = """
     #version 330 core
@@ -23,10 +28,11 @@ DEFAULT_VERTEX_SHADER = """
     out vec2 TexCoords;
 
     uniform mat4 projection;
+    uniform vec2 origin;
 
     void main()
     {
-        gl_Position = projection * vec4(vertex.xy, 0.0, 1.0);
+        gl_Position = projection * vec4(vertex.xy + origin, 0.0, 1.0);
         TexCoords = vertex.zw;
     }
     """
@@ -50,6 +56,45 @@ DEFAULT_TEXT_SHADER = Shader.compile(vertex=DEFAULT_VERTEX_SHADER,
                                      fragment=DEFAULT_FRAGMENT_SHADER)
 
 
+@functools.lru_cache(maxsize=1024)
+def text_vertices(font: Font, value: str) -> np.ndarray:
+    """Return the vertices of the quads that draw a string.
+
+    The string starts at the origin. Vertices are cached for each font and
+    string, so the returned array is read-only.
+
+    Args:
+        font: The font to draw the string with.
+        value: An ASCII string.
+
+    Returns:
+        An (n * 6, 4) float32 array with the position and texture coordinates
+        of each vertex.
+
+    Raises:
+        UnicodeEncodeError: If the string contains a non-ASCII character.
+    """
+    glyphs = font.glyphs
+    codes = np.frombuffer(value.encode("ascii"), dtype=np.uint8)
+    sizes = glyphs.sizes[codes, np.newaxis]
+    bearings = glyphs.bearings[codes, np.newaxis]
+    uvs = glyphs.uvs[codes, np.newaxis]
+    advances = glyphs.advances[codes] >> 6
+    pens = np.cumsum(advances) - advances
+
+    # The lower left corner of each glyph.
+    lower_left = np.stack(
+        [pens + bearings[:, 0, 0], bearings[:, 0, 1] - sizes[:, 0, 1]], axis=1)
+    # `_CORNERS` are in texture space, where v increases downwards.
+    flipped = _CORNERS * (1, -1) + (0, 1)
+    vertices = np.empty((len(codes), len(_CORNERS), 4), dtype=np.float32)
+    vertices[..., :2] = lower_left[:, np.newaxis] + flipped * sizes
+    vertices[..., 2:] = uvs[..., :2] + _CORNERS * (uvs[..., 2:] - uvs[..., :2])
+    vertices = vertices.reshape(-1, 4)
+    vertices.flags.writeable = False
+    return vertices
+
+
 class TextRenderer:  # noqa: E241  # pylint: disable=too-few-public-methods
     """A renderer for rendering text on the screen."""
 
@@ -59,97 +104,60 @@ class TextRenderer:  # noqa: E241  # pylint: disable=too-few-public-methods
         Args:
             shader: The shader to use for rendering text.
         """
-        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
-
         self.vao = gl.glGenVertexArrays(1)
-        gl.glBindVertexArray(self.vao)
+        RENDER_STATE.bind_vertex_array(self.vao)
 
         self.vbo = gl.glGenBuffers(1)
         gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.vbo)
-        gl.glBufferData(gl.GL_ARRAY_BUFFER,
-                        ctypes.sizeof(ctypes.c_float) * 6 * 4, None,
-                        gl.GL_DYNAMIC_DRAW)
         gl.glEnableVertexAttribArray(0)
         gl.glVertexAttribPointer(0, 4, gl.GL_FLOAT, gl.GL_FALSE, 0, None)
         gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
-        gl.glBindVertexArray(0)
 
         self.shader = shader
+        # The vertices in the buffer, so that a string drawn again isn't
+        # uploaded again.
+        self._uploaded: Optional[np.ndarray] = None
 
-    def draw(self, text: Text, transform: Transform) -> None:
-        """Render text on the screen.
+    def draw(self,
+             text: Text,
+             transform: Transform,
+             model: Optional[np.ndarray] = None) -> None:
+        """Render text on the screen with one draw call.
 
         Args:
             text: The text to render.
-            transform: The `Transform` that specifies the position of the text.
+            transform: The `Transform` whose world position is where the text
+                starts.
+            model: The world matrix of the transform, as computed by
+                `TransformArray.world_matrices`. If None, then the matrix is
+                computed from the transform (default: None).
         """
-        # pylint: disable=too-many-locals
-        gl.glUseProgram(self.shader.program)
+        vertices = text_vertices(text.font, text.value)
+        if not len(vertices):  # pylint: disable=len-as-condition
+            return
 
-        window = glfw.get_current_context()
-        window_width, window_height = glfw.get_window_size(window)
+        RENDER_STATE.use_program(self.shader.program)
+
+        window_width, window_height = surface_size()
 
         projection = glm.ortho(0.0, window_width, 0, window_height)
         self.shader.set_mat4("projection", projection)
+        if model is None:
+            model = transform.world_model
+        self.shader.set_vec2("origin", glm.vec2(*model[3, :2].tolist()))
 
         self.shader.set_vec3(
             "textColor",
-            glm.vec3(text.color.red, text.color.blue, text.color.green))
-
-        gl.glActiveTexture(gl.GL_TEXTURE0)
-
-        gl.glEnable(gl.GL_BLEND)
-        gl.glBlendFunc(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA)
-
-        gl.glBindVertexArray(self.vao)
-
-        x, y, _ = transform.position
-
-        for c in text.value:
-            character = text.font.characters[c]
-
-            xpos = x + character.bearing.x
-            ypos = y - (character.size.y - character.bearing.y)
-
-            width = character.size.x
-            height = character.size.y
-
-            vertices = np.array(
-                [
-                    xpos,
-                    ypos + height,
-                    0.0,
-                    0.0,  # noqa: E241
-                    xpos,
-                    ypos,
-                    0.0,
-                    1.0,  # noqa: E241
-                    xpos + width,
-                    ypos,
-                    1.0,
-                    1.0,  # noqa: E241
-                    xpos,
-                    ypos + height,
-                    0.0,
-                    0.0,  # noqa: E241
-                    xpos + width,
-                    ypos,
-                    1.0,
-                    1.0,  # noqa: E241
-                    xpos + width,
-                    ypos + height,
-                    1.0,
-                    0.0,  # noqa: E241
-                ],
-                dtype=np.float32)
-
-            gl.glBindTexture(gl.GL_TEXTURE_2D, character.texture)
-            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.vbo)
-            gl.glBufferSubData(gl.GL_ARRAY_BUFFER, 0, vertices.nbytes, vertices)
+            glm.vec3(text.color.red, text.color.green, text.color.blue))
 
-            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
-            gl.glDrawArrays(gl.GL_TRIANGLES, 0, 6)
-            x += (character.advance >> 6)
+        RENDER_STATE.set_blend((gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA))
+        RENDER_STATE.set_depth(gl.GL_LESS)
+        RENDER_STATE.bind_vertex_array(self.vao)
+        RENDER_STATE.bind_texture(0, text.font.texture)
 
-        gl.glBindVertexArray(0)
-        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+        if vertices is not self._uploaded:
+            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.vbo)
+            gl.glBufferData(gl.GL_ARRAY_BUFFER, vertices.nbytes, vertices,
+                            gl.GL_STREAM_DRAW)
+            self._uploaded = vertices
+        gl.glDrawArrays(gl.GL_TRIANGLES, 0, len(vertices))
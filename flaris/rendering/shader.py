@@ -3,20 +3,76 @@ from __future__ import annotations
 
 import tempfile
 import os
+from typing import Any, Callable, Dict, NamedTuple, Union
+
 import glm
+import numpy as np
 
 import OpenGL.GL as gl
 import OpenGL.GL.shaders as gls
 
-__all__ = ["Shader"]
+__all__ = ["Shader", "UniformStats"]
 
 _SHADERS = {}
+_UNIFORMS = {}
+
+
+class UniformStats(NamedTuple):
+    """The number of uniform uploads made and skipped by a shader program.
+
+    Every uniform assignment used to look up the uniform's location and then
+    upload the value. Locations are now looked up once, when the program is
+    linked, and a value is only uploaded if it differs from the last value
+    assigned to the uniform.
+    """
+
+    uploads: int
+    skipped: int
+
+    @property
+    def avoided(self) -> int:
+        """Return the number of OpenGL calls avoided by caching."""
+        return self.uploads + 2 * self.skipped
+
+
+class _Uniforms:  # pylint: disable=too-few-public-methods
+    """The locations and last assigned values of a program's uniforms."""
+
+    def __init__(self, locations: Dict[str, int]):
+        """Initialize the cache.
+
+        Args:
+            locations: A dictionary that maps the name of each active uniform
+                to its location.
+        """
+        self.locations = locations
+        self.values = {}
+        self.uploads = 0
+        self.skipped = 0
+
+    @staticmethod
+    def introspect(program: int) -> Dict[str, int]:
+        """Return the location of each active uniform in a linked program."""
+        locations = {}
+        count = gl.glGetProgramiv(program, gl.GL_ACTIVE_UNIFORMS)
+        for index in range(count):
+            name, _, _ = gl.glGetActiveUniform(program, index)
+            name = name.decode() if isinstance(name, bytes) else name
+            location = gl.glGetUniformLocation(program, name)
+            locations[name] = location
+            # Arrays are reported by their first element, like "lights[0]",
+            # but can be assigned by the name of the array too.
+            if name.endswith("[0]"):
+                locations[name[:-3]] = location
+        return locations
 
 
 class Shader:  # pylint: disable=too-few-public-methods
     """Encapsulates an OpenGL shader.
 
-    The shader program is compiled lazily.
+    The shader program is compiled lazily. The locations of its uniforms are
+    looked up once after it's linked, and assigning a uniform the value it
+    already has doesn't make any OpenGL calls.
 
     Attributes:
         program: An OpenGL shader program.
@@ -54,7 +110,7 @@ class Shader:  # pylint: disable=too-few-public-methods
             name: The name of the uniform.
             value: The int to assign to the uniform.
         """
-        gl.glUniform1i(gl.glGetUniformLocation(self.program, name), value)
+        self._upload(name, value, gl.glUniform1i, value)
 
     def set_float(self, name: str, value: float) -> None:
         """Set the value of a float uniform.
@@ -63,22 +119,65 @@ class Shader:  # pylint: disable=too-few-public-methods
             name: The name of the uniform.
             value: The float to assign to the uniform.
         """
-        gl.glUniform1f(gl.glGetUniformLocation(self.program, name), value)
+        self._upload(name, value, gl.glUniform1f, value)
+
+    def set_vec2(self, name: str, vector: glm.vec2) -> None:
+        """Set the value of a vec2 uniform."""
+        value = vector.x, vector.y
+        self._upload(name, value, gl.glUniform2f, *value)
 
     def set_vec3(self, name: str, vector: glm.vec3) -> None:
         """Set the value of a vec3 uniform."""
-        gl.glUniform3f(gl.glGetUniformLocation(self.program, name), vector.x,
-                       vector.y, vector.z)
+        value = vector.x, vector.y, vector.z
+        self._upload(name, value, gl.glUniform3f, *value)
 
-    def set_mat4(self, name: str, value: glm.mat4) -> None:
+    def set_mat4(self, name: str, value: Union[glm.mat4, np.ndarray]) -> None:
         """Set the value of a mat4 uniform.
 
         Args:
             name: The name of the uniform.
-            value: The mat4 to assign to the uniform.
+            value: The mat4 to assign to the uniform, or a 4x4 float32 array
+                that stores the matrix column by column.
+        """
+        # The pointer is only valid while `value` is alive, so it mustn't
+        # replace the only reference to the matrix.
+        data = value if isinstance(value, np.ndarray) else glm.value_ptr(value)
+        key = value.tobytes() if isinstance(value, np.ndarray) else bytes(value)
+        self._upload(name, key, gl.glUniformMatrix4fv, 1, gl.GL_FALSE, data)
+
+    @property
+    def stats(self) -> UniformStats:
+        """Return the number of uniform uploads made and skipped.
+
+        The counts include every assignment made through any `Shader` that
+        shares this shader's program.
+        """
+        uniforms = _UNIFORMS[self.program]
+        return UniformStats(uniforms.uploads, uniforms.skipped)
+
+    def _upload(self, name: str, key: Any, function: Callable[..., None],
+                *args) -> None:
+        """Upload the value of a uniform unless the uniform already has it.
+
+        The program must be in use.
+
+        Args:
+            name: The name of the uniform.
+            key: A hashable copy of the value, compared with the last value
+                assigned to the uniform.
+            function: The `glUniform` function that uploads the value.
+            *args: The arguments passed to `function` after the location.
         """
-        gl.glUniformMatrix4fv(gl.glGetUniformLocation(self.program, name), 1,
-                              gl.GL_FALSE, glm.value_ptr(value))
+        uniforms = _UNIFORMS[self.program]
+        location = uniforms.locations.get(name, -1)
+        # OpenGL ignores assignments to inactive uniforms, so there's no need
+        # to make them.
+        if location == -1 or uniforms.values.get(name) == key:
+            uniforms.skipped += 1
+            return
+        function(location, *args)
+        uniforms.values[name] = key
+        uniforms.uploads += 1
 
     @property
     def program(self):
@@ -86,11 +185,13 @@ class Shader:  # pylint: disable=too-few-public-methods
         if (self.vertex_path, self.fragment_path) in _SHADERS:
             return _SHADERS[(self.vertex_path, self.fragment_path)]
 
-        _SHADERS[(self.vertex_path, self.fragment_path)] = gls.compileProgram(
+        program = gls.compileProgram(
             gls.compileShader(self.vertex_source, gl.GL_VERTEX_SHADER),
             gls.compileShader(self.fragment_source, gl.GL_FRAGMENT_SHADER))
+        _SHADERS[(self.vertex_path, self.fragment_path)] = program
+        _UNIFORMS[program] = _Uniforms(_Uniforms.introspect(program))
 
-        return _SHADERS[(self.vertex_path, self.fragment_path)]
+        return program
 
     @staticmethod
     def compile(vertex: str, fragment: str) -> Shader:
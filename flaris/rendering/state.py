@@ -0,0 +1,158 @@
+"""Implements tracking of OpenGL state to avoid redundant state changes."""
+from typing import Dict, NamedTuple, Optional, Tuple
+
+import OpenGL.GL as gl
+
+__all__ = ["RENDER_STATE", "RenderState", "StateStats"]
+
+
+class StateStats(NamedTuple):
+    """The number of OpenGL state changes made and skipped in a frame."""
+
+    issued: int
+    skipped: int
+
+
+class RenderState:
+    """A cache of the OpenGL state set by the renderers.
+
+    Renderers change state through the shared `RENDER_STATE` instead of
+    calling OpenGL directly. A change is only passed on to OpenGL if it differs
+    from the cached state. State that hasn't been set through the cache yet is
+    unknown, so the first change to it is always made.
+
+    Code that changes the same state without going through the cache must call
+    `RenderState.invalidate` afterwards.
+
+    Attributes:
+        issued: The number of OpenGL calls made since the frame began.
+        skipped: The number of OpenGL calls skipped since the frame began.
+        stats: The number of calls made and skipped in the previous frame.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self.issued = 0
+        self.skipped = 0
+        self.stats = StateStats(0, 0)
+        self._program = None
+        self._vertex_array = None
+        self._unit = None
+        self._textures: Dict[int, int] = {}
+        self._blend = None
+        self._blend_factors = None
+        self._depth = None
+        self._depth_func = None
+        self._uniform_buffers: Dict[int, Tuple[int, int, int]] = {}
+
+    def begin_frame(self) -> None:
+        """Record the counts of the previous frame and reset them."""
+        self.stats = StateStats(self.issued, self.skipped)
+        self.issued = self.skipped = 0
+
+    def invalidate(self) -> None:
+        """Forget the cached state, so that every change is made again."""
+        self._program = self._vertex_array = self._unit = None
+        self._textures.clear()
+        self._blend = self._blend_factors = None
+        self._depth = self._depth_func = None
+        self._uniform_buffers.clear()
+
+    def use_program(self, program: int) -> None:
+        """Make a shader program part of the current rendering state."""
+        if self._changed("_program", program):
+            gl.glUseProgram(program)
+
+    def bind_vertex_array(self, vertex_array: int) -> None:
+        """Bind a vertex array object, or unbind it if it's 0."""
+        if self._changed("_vertex_array", vertex_array):
+            gl.glBindVertexArray(vertex_array)
+
+    def bind_texture(self, unit: int, texture: int) -> None:
+        """Bind a 2D texture to a texture unit.
+
+        Args:
+            unit: The index of the texture unit, like 0 for GL_TEXTURE0.
+            texture: The name of the texture, or 0 to unbind the unit.
+        """
+        if self._textures.get(unit) == texture:
+            self.skipped += 2
+            return
+        if self._changed("_unit", unit):
+            gl.glActiveTexture(gl.GL_TEXTURE0 + unit)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, texture)
+        self._textures[unit] = texture
+        self.issued += 1
+
+    def bind_uniform_buffer(self, binding: int, buffer: int, offset: int,
+                            size: int) -> None:
+        """Bind a range of a buffer to a uniform buffer binding point.
+
+        Args:
+            binding: The index of the binding point.
+            buffer: The name of the buffer.
+            offset: The offset of the range in bytes.
+            size: The size of the range in bytes.
+        """
+        if self._uniform_buffers.get(binding) == (buffer, offset, size):
+            self.skipped += 1
+            return
+        gl.glBindBufferRange(gl.GL_UNIFORM_BUFFER, binding, buffer, offset,
+                             size)
+        self._uniform_buffers[binding] = buffer, offset, size
+        self.issued += 1
+
+    def set_blend(self, factors: Optional[Tuple[int, int]]) -> None:
+        """Enable blending with the given factors, or disable it if None.
+
+        Args:
+            factors: The source and destination factors passed to
+                `glBlendFunc`, like `(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)`.
+        """
+        if factors is None:
+            if self._changed("_blend", False):
+                gl.glDisable(gl.GL_BLEND)
+            return
+        if self._changed("_blend", True):
+            gl.glEnable(gl.GL_BLEND)
+        if self._changed("_blend_factors", factors):
+            gl.glBlendFunc(*factors)
+
+    def set_depth(self, func: Optional[int]) -> None:
+        """Enable depth testing with the given function, or disable it if None.
+
+        Args:
+            func: The comparison passed to `glDepthFunc`, like GL_LESS.
+        """
+        if func is None:
+            if self._changed("_depth", False):
+                gl.glDisable(gl.GL_DEPTH_TEST)
+            return
+        if self._changed("_depth", True):
+            gl.glEnable(gl.GL_DEPTH_TEST)
+        if self._changed("_depth_func", func):
+            gl.glDepthFunc(func)
+
+    def _changed(self, name: str, value) -> bool:
+        """Update a cached value and return whether an OpenGL call is needed.
+
+        Args:
+            name: The name of the attribute that caches the value.
+            value: The new value.
+
+        Returns:
+            True if the value differs from the cached value. The caller must
+            then make the OpenGL call.
+        """
+        if getattr(self, name) == value:
+            self.skipped += 1
+            return False
+        setattr(self, name, value)
+        self.issued += 1
+        return True
+
+
+# The state of the current OpenGL context, shared by every renderer.
+RENDER_STATE = RenderState()
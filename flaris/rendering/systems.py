@@ -1,18 +1,26 @@
 """Implements rendering-related classes that subclass `System`."""
+import functools
+
 import glfw
+import numpy as np
 import OpenGL.GL as gl
 
-from flaris.entity import Entity
-
 from flaris.system import System, SequentialSystem
 from flaris.transform import Transform
 
-from .camera import OrthographicCamera
-from .light import DirectionalLight, AmbientLight
+from .camera import Camera
+from .culling import CullingStats, bounding_spheres, in_frustum, view_depths
+from .light import Light
+from .material import Material
 from .mesh import Mesh
+from .queue import RENDER_QUEUE, sort_keys
+from .state import RENDER_STATE
 from .sprite import Sprite
 from .text import Text
+from .texture import Texture
 from .renderers import MeshRenderer, SpriteRenderer, TextRenderer
+from .renderers.mesh import MAX_LIGHTS
+from .renderers.sprite import sprite_sizes
 
 
 class RenderingSystem(SequentialSystem):
@@ -25,6 +33,7 @@ class RenderingSystem(SequentialSystem):
             MeshRenderingSystem(),
             TextRenderingSystem(),
             SpriteRenderingSystem(),
+            RenderQueueSystem(),
             BufferSwapSystem()
         ])
 
@@ -32,94 +41,248 @@ class RenderingSystem(SequentialSystem):
 class WindowClearSystem(System):
     """System that clears the pixels on the screen."""
 
+    READS = WRITES = ()
+    MAIN_THREAD = True
+
     def step(self, delta: float) -> None:
-        """Clear the pixels on the screen."""
+        """Clear the pixels on the screen and begin a new frame."""
+        RENDER_STATE.begin_frame()
         gl.glClear(gl.GL_COLOR_BUFFER_BIT | gl.GL_DEPTH_BUFFER_BIT)
 
 
+class RenderQueueSystem(System):
+    """System that makes the draw calls submitted to the render queue."""
+
+    READS = WRITES = ()
+    MAIN_THREAD = True
+
+    def step(self, delta: float) -> None:
+        """Make every queued draw call in sorted order."""
+        RENDER_QUEUE.flush()
+
+
 class TextRenderingSystem(System):
-    """System that renders text."""
+    """System that submits text to the render queue.
+
+    Attributes:
+        LAYER: The layer of the render queue that text is drawn in.
+    """
 
     REQUIRED_COMPONENTS = Transform, Text
+    READS = Transform, Text
+    WRITES = ()
+    MAIN_THREAD = True
+    LAYER = 1
 
     def start(self) -> None:
         """Construct a text renderer."""
         self.renderer = TextRenderer()
 
     def step(self, delta: float) -> None:
-        """Render text in the scene."""
-        for entity in self.entities:
-            self.renderer.draw(entity[Text], entity[Transform])
+        """Submit the text in the scene to the render queue."""
+        batch = self.world.batch(Text, Transform)
+        if not batch:
+            return
+
+        # Compute every world matrix at once, rather than once per text.
+        matrices = Transform.ARRAY.world_matrices(batch.rows(Transform))
+        draws = [
+            functools.partial(self.renderer.draw, entity[Text],
+                              entity[Transform], matrix)
+            for entity, matrix in zip(batch.entities, matrices)
+        ]
+        count = len(draws)
+        RENDER_QUEUE.submit(
+            sort_keys(np.full(count, self.LAYER), np.ones(count, dtype=bool),
+                      np.full(count, self.renderer.shader.program),
+                      np.zeros(count), np.zeros(count)), draws)
 
 
 class SpriteRenderingSystem(System):
-    """System that renders sprite."""
+    """System that submits sprites to the render queue.
+
+    Every sprite is drawn by one `SpriteRenderer.draw_batch` call, so sprites
+    that share an atlas page keep their order.
+
+    Attributes:
+        LAYER: The layer of the render queue that sprites are drawn in.
+    """
 
     REQUIRED_COMPONENTS = Transform, Sprite
+    READS = Transform, Sprite
+    WRITES = ()
+    MAIN_THREAD = True
+    LAYER = 2
 
     def start(self) -> None:
         """Construct a sprite renderer."""
         self.renderer = SpriteRenderer()
 
     def step(self, delta: float) -> None:
-        """Render each sprite in the scene."""
-        for entity in self.entities:
-            self.renderer.draw(entity[Sprite], entity[Transform])
+        """Submit every sprite in the scene to the render queue as one batch."""
+        batch = self.world.batch(Sprite, Transform)
+        if not batch:
+            return
+
+        sprites = [entity[Sprite] for entity in batch.entities]
+        matrices = Transform.ARRAY.world_matrices(batch.rows(Transform))
+        draw = functools.partial(self.renderer.draw_batch, sprites,
+                                 matrices[:, 3, :2],
+                                 sprite_sizes(sprites, matrices))
+        RENDER_QUEUE.submit(
+            sort_keys([self.LAYER], [True], [self.renderer.shader.program], [0],
+                      [0]), [draw])
 
 
 class MeshRenderingSystem(System):
-    """System that renders a mesh."""
+    """System that submits meshes to the render queue.
 
-    REQUIRED_COMPONENTS = Transform, Mesh
+    Meshes whose bounds are outside of the camera's view are culled before
+    anything is drawn. The rest are drawn front to back, so that hidden
+    fragments fail the depth test early.
 
-    def __init__(self):
-        """Initialize the scene."""
+    Each mesh is lit by every light in one pass. If there are more lights than
+    `lights_per_pass`, then the remaining lights are added in further passes.
+
+    Attributes:
+        LAYER: The layer of the render queue that meshes are drawn in.
+        lights_per_pass: The largest number of lights drawn in one pass.
+        stats: The number of meshes drawn and culled in the most recent frame.
+    """
+
+    REQUIRED_COMPONENTS = Transform, Mesh
+    READS = Transform, Mesh, Material, Texture, Camera, Light
+    WRITES = ()
+    MAIN_THREAD = True
+    LAYER = 0
+
+    def __init__(self, lights_per_pass: int = MAX_LIGHTS):
+        """Initialize the scene.
+
+        Args:
+            lights_per_pass: The largest number of lights drawn in one pass,
+                from 1 to `MAX_LIGHTS` (default: `MAX_LIGHTS`).
+        """
         super().__init__()
+        if not 1 <= lights_per_pass <= MAX_LIGHTS:
+            raise ValueError(f"Expected lights per pass to be between 1 and "
+                             f"{MAX_LIGHTS} but got {lights_per_pass}.")
         self.camera = None
         self.renderer = None
         self.lights = []
+        self.lights_per_pass = lights_per_pass
+        self.stats = CullingStats(0, 0)
+        self._passes = 1
 
     def start(self) -> None:
         """Construct a mesh renderer."""
         self.renderer = MeshRenderer(self.camera)
 
     def step(self, delta: float) -> None:
-        """Render each mesh in the scene."""
+        """Submit each visible mesh in the scene to the render queue."""
+        if not self.camera:
+            for (camera,) in self.world.query(Camera):
+                self.camera = self.renderer.camera = camera
+                break
+
+        self.lights = list(self.world.components(Light))
         if not self.lights:
             return
+        self._passes = self.renderer.set_lights(self.lights,
+                                                self.lights_per_pass)
+
+        batch = self.world.batch(Mesh, Transform)
+        draws = [(entity[Mesh], entity[Transform]) for entity in batch.entities]
+        # Compute every world matrix once per frame and reuse it in each pass.
+        matrices = Transform.ARRAY.world_matrices(batch.rows(Transform))
+        depths = np.zeros(len(draws))
+        if draws:
+            visible, depths = self._cull([mesh for mesh, _ in draws], matrices)
+            draws = [draws[i] for i in visible]
+            matrices = matrices[visible]
+        self.stats = CullingStats(len(draws), len(batch) - len(draws))
+
+        # The meshes are sorted by depth, so each group is drawn front to back
+        # and its first mesh is its nearest.
+        groups = self._group([mesh for mesh, _ in draws])
+        count = len(groups)
+        keys = sort_keys(
+            np.full(count, self.LAYER), np.zeros(count, dtype=bool),
+            np.full(count,
+                    self.renderer.shader_for(0).program),
+            [mesh.entity[Material].ambient for mesh, _, _ in groups],
+            [depths[indices[0]] for _, indices, _ in groups])
+        RENDER_QUEUE.submit(keys, [
+            functools.partial(self._draw, mesh, matrices[indices], albedos)
+            for mesh, indices, albedos in groups
+        ])
 
-        for entity in self.entities:
-            # First pass
-            gl.glDepthFunc(gl.GL_LESS)
-            gl.glDisable(gl.GL_BLEND)
-            self.renderer.draw(entity[Mesh], entity[Transform], self.lights[0])
-
-        for entity in self.entities:
-            # Second+ pass
-            gl.glDepthFunc(gl.GL_EQUAL)
-            gl.glEnable(gl.GL_BLEND)
-            gl.glBlendFunc(gl.GL_ONE, gl.GL_ONE)
-            for light in self.lights[1:]:
-                self.renderer.draw(entity[Mesh], entity[Transform], light)
-
-    def add(self, entity: Entity) -> None:
-        """Add an entity to the scene."""
-        # TODO: Add inheritance for component keys
-        if OrthographicCamera in entity and not self.camera:
-            self.camera = entity[OrthographicCamera]
-
-        if DirectionalLight in entity:
-            self.lights.append(entity[DirectionalLight])
-
-        if AmbientLight in entity:
-            self.lights.append(entity[AmbientLight])
-
-        super().add(entity)
+    def _draw(self, mesh: Mesh, models: np.ndarray,
+              albedos: np.ndarray) -> None:
+        """Draw a group of meshes lit by every light in the scene.
+
+        The first pass is drawn normally, and each other pass adds its lights
+        to the visible fragments.
+        """
+        RENDER_STATE.set_depth(gl.GL_LESS)
+        RENDER_STATE.set_blend(None)
+        self.renderer.draw_instances(mesh, models, albedos)
+
+        if self._passes > 1:
+            RENDER_STATE.set_depth(gl.GL_EQUAL)
+            RENDER_STATE.set_blend((gl.GL_ONE, gl.GL_ONE))
+            for light_pass in range(1, self._passes):
+                self.renderer.draw_instances(mesh, models, albedos, light_pass)
+
+    @staticmethod
+    def _group(meshes: list) -> list:
+        """Group meshes that can be drawn with one instanced draw call.
+
+        Meshes are grouped by their model and textures.
+
+        Returns:
+            A list of tuples containing the first mesh in a group, an array of
+            the indices of the group's meshes, and an (n, 3) array containing
+            the albedo of each of the group's meshes.
+        """
+        indices = {}
+        for index, mesh in enumerate(meshes):
+            material = mesh.entity[Material]
+            key = mesh.path, material.ambient, material.diffuse
+            indices.setdefault(key, []).append(index)
+
+        groups = []
+        for group in indices.values():
+            colors = [meshes[index].entity[Material].albedo for index in group]
+            albedos = np.array([
+                (color.red, color.green, color.blue) for color in colors
+            ])
+            groups.append((meshes[group[0]], np.array(group), albedos))
+        return groups
+
+    def _cull(self, meshes: list, matrices: np.ndarray) -> tuple:
+        """Find the meshes inside the camera's view.
+
+        Returns:
+            The indices of the visible meshes, sorted from front to back, and
+            the depth of each of their centers.
+        """
+        lower = np.array([tuple(mesh.bounds[0]) for mesh in meshes])
+        upper = np.array([tuple(mesh.bounds[1]) for mesh in meshes])
+        centers, radii = bounding_spheres(lower, upper, matrices)
+        planes = self.camera.frustum
+        visible = np.flatnonzero(in_frustum(planes, centers, radii))
+        depths = view_depths(planes, centers[visible])
+        order = np.argsort(depths, kind="stable")
+        return visible[order], depths[order]
 
 
 class BufferSwapSystem(System):
     """System that swaps buffers."""
 
+    READS = WRITES = ()
+    MAIN_THREAD = True
+
     def start(self) -> None:
         """Get a reference to the window."""
         self.window = glfw.get_current_context()
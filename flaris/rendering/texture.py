@@ -4,6 +4,8 @@ from PIL import Image
 
 from flaris.component import Component
 
+from .state import RENDER_STATE
+
 _TEXTURES = {}
 
 
@@ -42,7 +44,7 @@ class Texture(Component):  # pylint: disable=too-few-public-methods
         name = gl.glGenTextures(1)
         _TEXTURES[self.path] = name
 
-        gl.glBindTexture(gl.GL_TEXTURE_2D, self.name)
+        RENDER_STATE.bind_texture(0, name)
 
         gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_S, gl.GL_REPEAT)
         gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_WRAP_T, gl.GL_REPEAT)
@@ -60,7 +62,7 @@ class Texture(Component):  # pylint: disable=too-few-public-methods
                         self.data)
         gl.glGenerateMipmap(gl.GL_TEXTURE_2D)
 
-        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+        RENDER_STATE.bind_texture(0, 0)
 
         return name
 
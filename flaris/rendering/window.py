@@ -1,13 +1,16 @@
 """Implements the Window class."""
-from typing import Optional
+from typing import List, Optional, Tuple
 
 import glfw
 import OpenGL.GL as gl
 
 from flaris.rendering.icon import Icon
+from flaris.rendering.state import RENDER_STATE
 
 __all__ = ["Window"]
 
+_WINDOWS: List = []
+
 
 class Window:  # pylint: disable=too-few-public-methods
     """An object that encapsulates both a window and a context."""
@@ -62,18 +65,22 @@ class Window:  # pylint: disable=too-few-public-methods
 
         glfw.make_context_current(self.window)
 
-        gl.glEnable(gl.GL_BLEND)
-        gl.glBlendFunc(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA)
-        gl.glEnable(gl.GL_DEPTH_TEST)
+        # The cached state belongs to the previous context, if there was one.
+        RENDER_STATE.invalidate()
+        RENDER_STATE.set_blend((gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA))
+        RENDER_STATE.set_depth(gl.GL_LESS)
 
         glfw.set_framebuffer_size_callback(self.window,
                                            framebuffer_size_callback)
+        _WINDOWS.append(self.window)
 
         return self
 
     def __exit__(self, exc_type, exc_value, exc_traceback):
         """Do something."""
+        _WINDOWS.remove(self.window)
         glfw.terminate()
+        RENDER_STATE.invalidate()
 
     @property
     def should_close(self) -> bool:
@@ -90,3 +97,17 @@ def framebuffer_size_callback(window, width: int, height: int) -> None:  # noqa:
         height: The height of the framebuffer.
     """
     gl.glViewport(0, 0, width, height)
+
+
+def surface_size() -> Tuple[int, int]:
+    """Return the size of the surface being drawn to.
+
+    Returns:
+        The size of the open window in screen coordinates. If no window is
+        open, for example when drawing to an offscreen context, the size of the
+        OpenGL viewport is returned instead.
+    """
+    if _WINDOWS:
+        return glfw.get_window_size(_WINDOWS[-1])
+    _, _, width, height = gl.glGetIntegerv(gl.GL_VIEWPORT)
+    return int(width), int(height)
@@ -0,0 +1,221 @@
+"""Implements the `ParallelSystem` class."""
+from __future__ import annotations
+
+import concurrent.futures
+from timeit import default_timer as timer
+from typing import (Dict, FrozenSet, List, Optional, Tuple, TYPE_CHECKING,
+                    Union)
+
+from .component import component_keys
+from .profiler import PROFILER
+from .system import SequentialSystem
+
+if TYPE_CHECKING:
+    from .system import System
+
+__all__ = ["ParallelSystem"]
+
+Access = Tuple[FrozenSet[type], FrozenSet[type]]
+
+
+def _access(system: Union[System, SequentialSystem]) -> Optional[Access]:
+    """Return the component types a system reads and writes.
+
+    Returns:
+        A tuple containing a frozenset of the types the system reads and a
+        frozenset of the types the system writes, or None if the system (or
+        any system it contains) doesn't declare `READS` and `WRITES`.
+    """
+    if isinstance(system, SequentialSystem):
+        reads, writes = set(), set()
+        for child in system.systems:
+            access = _access(child)
+            if access is None:
+                return None
+            reads |= access[0]
+            writes |= access[1]
+        return frozenset(reads), frozenset(writes)
+
+    if system.READS is None or system.WRITES is None:
+        return None
+    return frozenset(system.READS), frozenset(system.WRITES)
+
+
+def _pinned(system: Union[System, SequentialSystem]) -> bool:
+    """Return true if a system must run on the main thread."""
+    if isinstance(system, SequentialSystem):
+        return any(_pinned(child) for child in system.systems)
+    return system.MAIN_THREAD or _access(system) is None
+
+
+def _overlaps(types: FrozenSet[type], other_types: FrozenSet[type]) -> bool:
+    """Return true if a component could be an instance of a type in each set."""
+    return any(other_type in component_keys(component_type) or
+               component_type in component_keys(other_type)
+               for component_type in types
+               for other_type in other_types)
+
+
+def _conflicts(access: Optional[Access], other: Optional[Access]) -> bool:
+    """Return true if two systems can't safely run at the same time."""
+    if access is None or other is None:
+        return True
+    reads, writes = access
+    other_reads, other_writes = other
+    return (_overlaps(writes, other_writes) or _overlaps(writes, other_reads) or
+            _overlaps(reads, other_writes))
+
+
+class ParallelSystem(SequentialSystem):
+    """A collection of systems run concurrently where it is safe to do so.
+
+    Systems declare the component types they read and write with the `READS`
+    and `WRITES` class attributes. A system depends on every earlier system in
+    the list that writes a type it reads or writes, or that reads a type it
+    writes. Systems with no unfinished dependencies run at the same time on a
+    thread pool, so systems that spend their time in code that releases the
+    GIL, such as NumPy, benefit the most.
+
+    Systems with `MAIN_THREAD` set, like the rendering systems that issue
+    OpenGL calls, always run on the thread that calls `ParallelSystem.step`.
+    So do systems that don't declare `READS` and `WRITES`; they also depend
+    on every system before them and every system after them depends on them,
+    so a collection of undeclared systems runs in list order like a
+    `SequentialSystem`.
+
+    Systems that run concurrently may add and remove entities as long as the
+    world is deferring structural changes; see `World.deferred`.
+
+    Attributes:
+        critical_path: The list of systems on the longest chain of dependencies
+            in the previous step, measured by how long each system took.
+        critical_path_time: The total time in seconds spent by the systems in
+            `critical_path`.
+    """
+
+    def __init__(self,
+                 systems: List[Union[System, SequentialSystem]],
+                 workers: Optional[int] = None):
+        """Initialize the systems.
+
+        Args:
+            systems: An ordered collection of systems to run.
+            workers: The maximum number of worker threads. If None, then the
+                default of `concurrent.futures.ThreadPoolExecutor` is used
+                (default: None).
+        """
+        super().__init__(systems)
+        self.workers = workers
+        self.critical_path = []
+        self.critical_path_time = 0.0
+        self._executor = None
+        self._graph = None
+
+    def exit(self) -> None:
+        """Exit each system and shut down the worker threads."""
+        super().exit()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def step(self, delta: float) -> None:
+        """Advance each system by one step.
+
+        Args:
+            delta: The amount of time required to complete the previous frame.
+        """
+        dependencies, pinned_systems = self._schedule()
+        remaining = {
+            index: set(indices) for index, indices in dependencies.items()
+        }
+        durations: Dict[int, float] = {}
+        running: Dict[concurrent.futures.Future, int] = {}
+
+        while remaining or running:
+            ready = [index for index, deps in remaining.items() if not deps]
+            for index in ready:
+                del remaining[index]
+
+            pinned = [index for index in ready if index in pinned_systems]
+            for index in ready:
+                if index not in pinned:
+                    future = self._pool().submit(self._run, index, delta)
+                    running[future] = index
+
+            for index in pinned:
+                durations[index] = self._run(index, delta)
+                self._resolve(index, remaining)
+            if pinned or not running:
+                continue
+
+            done, _ = concurrent.futures.wait(
+                running, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                index = running.pop(future)
+                durations[index] = future.result()
+                self._resolve(index, remaining)
+
+        self._measure(dependencies, durations)
+
+    def _run(self, index: int, delta: float) -> float:
+        """Step a system and return how long it took."""
+        system = self.systems[index]
+        start_time = timer()
+        system.step(delta)
+        end_time = timer()
+        if PROFILER.enabled:
+            PROFILER.record(system, start_time, end_time)
+        return end_time - start_time
+
+    @staticmethod
+    def _resolve(index: int, remaining: Dict[int, set]) -> None:
+        """Mark a system as finished for the systems that depend on it."""
+        for dependencies in remaining.values():
+            dependencies.discard(index)
+
+    def _pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Return the thread pool, creating it if necessary."""
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="flaris")
+        return self._executor
+
+    def _schedule(self) -> Tuple[Dict[int, List[int]], FrozenSet[int]]:
+        """Return the dependency graph and the systems pinned to one thread.
+
+        The dependency graph maps the index of each system to the indices of
+        the systems it depends on. Pinned systems run on the main thread. The
+        schedule is rebuilt whenever `ParallelSystem.systems` changes.
+        """
+        key = tuple(map(id, self.systems))
+        if self._graph is None or self._graph[0] != key:
+            accesses = [_access(system) for system in self.systems]
+            dependencies = {}
+            for j, access in enumerate(accesses):
+                dependencies[j] = [
+                    i for i in range(j) if _conflicts(accesses[i], access)
+                ]
+            pinned = frozenset(
+                i for i, system in enumerate(self.systems) if _pinned(system))
+            self._graph = key, dependencies, pinned
+        return self._graph[1], self._graph[2]
+
+    def _measure(self, dependencies: Dict[int, List[int]],
+                 durations: Dict[int, float]) -> None:
+        """Find the longest chain of dependent systems in the last step."""
+        finish: Dict[int, float] = {}
+        previous: Dict[int, Optional[int]] = {}
+        for index in range(len(self.systems)):
+            previous[index] = max(dependencies[index],
+                                  key=finish.__getitem__,
+                                  default=None)
+            start = finish.get(previous[index], 0.0)
+            finish[index] = start + durations[index]
+
+        path = []
+        index = max(finish, key=finish.__getitem__, default=None)
+        self.critical_path_time = finish.get(index, 0.0)
+        while index is not None:
+            path.append(self.systems[index])
+            index = previous[index]
+        self.critical_path = path[::-1]
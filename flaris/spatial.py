@@ -0,0 +1,753 @@
+"""Implements spatial indexes for finding entities by position."""
+from __future__ import annotations
+
+import abc
+import itertools
+import math
+from typing import (Dict, Iterable, List, Optional, Sequence, Set, Tuple,
+                    TYPE_CHECKING)
+
+import numpy as np
+
+from .fields import gather
+from .system import System
+from .transform import Transform
+
+if TYPE_CHECKING:
+    from .entity import Entity
+
+__all__ = ["BVH", "HashGrid", "SpatialIndex", "SpatialSystem"]
+
+Point = Sequence[float]
+
+
+class SpatialIndex(abc.ABC):
+    """Base class for indexes that find entities by their position.
+
+    Each entity in an index is a sphere with a center and a radius, which may
+    be 0. The centers and radii are stored in arrays, one row per entity, so
+    that queries can test candidates with vectorized operations. Subclasses
+    decide which rows are candidates for a query.
+
+    Positions can be given as any sequence of coordinates, like a `Vector`.
+    Indexes with 2 dimensions ignore the z coordinate.
+    """
+
+    def __init__(self, dimensions: int = 3):
+        """Initialize an empty index.
+
+        Args:
+            dimensions: 2 or 3, the number of coordinates that are indexed
+                (default: 3).
+
+        Raises:
+            ValueError: If dimensions isn't 2 or 3.
+        """
+        if dimensions not in (2, 3):
+            raise ValueError(f"Expected 2 or 3 dimensions but got "
+                             f"{dimensions}.")
+        self.dimensions = dimensions
+        self._entities: List[Entity] = []
+        self._rows: Dict[Entity, int] = {}
+        self._positions = np.zeros((16, dimensions))
+        self._radii = np.zeros(16)
+        self._bounds = None
+
+    def __len__(self) -> int:
+        """Return the number of entities in the index."""
+        return len(self._entities)
+
+    def __contains__(self, entity: Entity) -> bool:
+        """Return true if the entity is in the index."""
+        return entity in self._rows
+
+    @property
+    def entities(self) -> List[Entity]:
+        """Return the entities in the index, in the order of their rows.
+
+        The list must not be modified.
+        """
+        return self._entities
+
+    def row(self, entity: Entity) -> int:
+        """Return the row of an entity in `SpatialIndex.entities`.
+
+        Raises:
+            ValueError: If the entity isn't in the index.
+        """
+        try:
+            return self._rows[entity]
+        except KeyError as error:
+            raise ValueError(f"Entity {entity} is not in the index.") from error
+
+    def insert(self,
+               entity: Entity,
+               position: Point,
+               radius: float = 0.0) -> None:
+        """Add an entity to the index.
+
+        Args:
+            entity: The entity to add.
+            position: The center of the entity.
+            radius: The radius of the entity's bounding sphere (default: 0).
+
+        Raises:
+            ValueError: If the entity is already in the index.
+        """
+        if entity in self._rows:
+            raise ValueError(f"Entity {entity} is already in the index.")
+        row = len(self._entities)
+        if row == len(self._radii):
+            self._grow(2 * row)
+        self._entities.append(entity)
+        self._rows[entity] = row
+        self._positions[row] = self._point(position)
+        self._radii[row] = radius
+        self._bounds = None
+        self._inserted(row)
+
+    def move(self,
+             entity: Entity,
+             position: Point,
+             radius: Optional[float] = None) -> None:
+        """Change the position, and optionally the radius, of an entity.
+
+        Args:
+            entity: An entity in the index.
+            position: The new center of the entity.
+            radius: The new radius of the entity, or None to keep its radius
+                (default: None).
+        """
+        row = self.row(entity)
+        self._positions[row] = self._point(position)
+        if radius is not None:
+            self._radii[row] = radius
+        self._bounds = None
+        self._moved(np.array([row]))
+
+    def update(self,
+               positions: np.ndarray,
+               radii: Optional[np.ndarray] = None) -> None:
+        """Change the positions of every entity in the index at once.
+
+        Only the rows whose values differ are treated as moved.
+
+        Args:
+            positions: An (n, 2) or (n, 3) array containing the new center of
+                each entity, in the order of `SpatialIndex.entities`.
+            radii: An array containing the new radius of each entity, or None
+                to keep the radii (default: None).
+        """
+        length = len(self)
+        positions = np.asarray(positions)[:, :self.dimensions]
+        changed = np.any(positions != self._positions[:length], axis=1)
+        if radii is not None:
+            changed |= radii != self._radii[:length]
+            self._radii[:length] = radii
+        rows = np.flatnonzero(changed)
+        if rows.size:
+            self._positions[rows] = positions[rows]
+            self._bounds = None
+            self._moved(rows)
+
+    def remove(self, entity: Entity) -> None:
+        """Remove an entity from the index.
+
+        The last row is moved into the removed entity's row.
+
+        Raises:
+            ValueError: If the entity isn't in the index.
+        """
+        row = self.row(entity)
+        self._removed(row)
+        del self._rows[entity]
+        last = self._entities.pop()
+        if last is not entity:
+            source = len(self._entities)
+            self._entities[row] = last
+            self._rows[last] = row
+            self._positions[row] = self._positions[source]
+            self._radii[row] = self._radii[source]
+            self._relocated(source, row)
+        self._bounds = None
+
+    def within(self, center: Point, radius: float) -> List[Entity]:
+        """Return the entities that overlap a sphere.
+
+        Args:
+            center: The center of the sphere.
+            radius: The radius of the sphere.
+        """
+        center = self._point(center)
+        rows = self._candidates(center - radius, center + radius)
+        distances = np.linalg.norm(self._positions[rows] - center, axis=1)
+        return self._select(rows[distances <= radius + self._radii[rows]])
+
+    def overlapping(self, lower: Point, upper: Point) -> List[Entity]:
+        """Return the entities that overlap an axis-aligned bounding box.
+
+        Args:
+            lower: The corner of the box with the smallest coordinates.
+            upper: The corner of the box with the largest coordinates.
+        """
+        lower, upper = self._point(lower), self._point(upper)
+        rows = self._candidates(lower, upper)
+        centers = self._positions[rows]
+        closest = np.clip(centers, lower, upper)
+        distances = np.linalg.norm(centers - closest, axis=1)
+        return self._select(rows[distances <= self._radii[rows]])
+
+    def nearest(self, point: Point, count: int = 1) -> List[Entity]:
+        """Return the entities closest to a point, closest first.
+
+        The distance to an entity is the distance to the surface of its
+        bounding sphere, or 0 if the point is inside it.
+
+        Args:
+            point: The point to search from.
+            count: The maximum number of entities to return (default: 1).
+        """
+        count = min(count, len(self))
+        if count <= 0:
+            return []
+
+        point = self._point(point)
+        lower, upper = self.bounds()
+        span = np.linalg.norm(np.maximum(upper - point, point - lower))
+        extent = max(span / len(self)**(1 / self.dimensions), 1e-9)
+        while True:
+            if extent >= span:
+                rows = np.arange(len(self))
+            else:
+                rows = self._candidates(point - extent, point + extent)
+            if rows.size >= count:
+                distances = np.maximum(
+                    np.linalg.norm(self._positions[rows] - point, axis=1) -
+                    self._radii[rows], 0)
+                order = np.argsort(distances, kind="stable")[:count]
+                # Entities farther than the extent might not be candidates, so
+                # the result is only complete if every selected entity is
+                # within the extent.
+                if extent >= span or distances[order[-1]] <= extent:
+                    return self._select(rows[order])
+            extent *= 2
+
+    def raycast(self,
+                origin: Point,
+                direction: Point,
+                max_distance: float = math.inf) -> List[Tuple[Entity, float]]:
+        """Return the entities that a ray hits, closest first.
+
+        Entities with a radius of 0 are points, which rays don't hit.
+
+        Args:
+            origin: The point the ray starts from.
+            direction: The direction of the ray. It doesn't need to be
+                normalized.
+            max_distance: The length of the ray (default: infinite).
+
+        Returns:
+            A list of pairs of entities and the distance along the ray to where
+            it enters the entity, or 0 if the ray starts inside it.
+
+        Raises:
+            ValueError: If the direction is a zero vector.
+        """
+        origin = self._point(origin)
+        direction = self._point(direction)
+        length = np.linalg.norm(direction)
+        if not length:
+            raise ValueError("Expected a non-zero ray direction.")
+        direction = direction / length
+
+        rows = self._candidates_along(origin, direction, max_distance)
+        offsets = self._positions[rows] - origin
+        along = offsets @ direction
+        lengths = np.einsum("ij,ij->i", offsets, offsets)
+        squared = lengths - along**2
+        radii = self._radii[rows]
+        # Spheres behind the origin are only hit if the origin is inside them.
+        hit = (squared < radii**2) & ((along >= 0) | (lengths <= radii**2))
+        rows, along = rows[hit], along[hit]
+        distances = np.maximum(along - np.sqrt(radii[hit]**2 - squared[hit]), 0)
+        order = np.argsort(distances, kind="stable")
+        return [(self._entities[row], float(distance))
+                for row, distance in zip(rows[order], distances[order])
+                if distance <= max_distance]
+
+    def bounds(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the corners of a box that contains every entity."""
+        if self._bounds is None:
+            length = len(self)
+            if not length:
+                zeros = np.zeros(self.dimensions)
+                return zeros, zeros
+            positions = self._positions[:length]
+            radii = self._radii[:length, np.newaxis]
+            self._bounds = ((positions - radii).min(axis=0),
+                            (positions + radii).max(axis=0))
+        return self._bounds
+
+    @abc.abstractmethod
+    def _candidates(self, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+        """Return the rows of entities that might overlap a box.
+
+        Every row whose bounding sphere overlaps the box must be included.
+        """
+
+    def _candidates_along(self, origin: np.ndarray, direction: np.ndarray,
+                          max_distance: float) -> np.ndarray:
+        """Return the rows of entities that a ray might hit.
+
+        By default, the candidates are the entities that might overlap the box
+        around the part of the ray inside `SpatialIndex.bounds`.
+        """
+        segment = _clip(origin, direction, max_distance, *self.bounds())
+        if segment is None:
+            return np.empty(0, dtype=np.intp)
+        start = origin + direction * segment[0]
+        end = origin + direction * segment[1]
+        return self._candidates(np.minimum(start, end), np.maximum(start, end))
+
+    def _inserted(self, row: int) -> None:
+        """Add a new row to the structure of the index."""
+
+    def _moved(self, rows: np.ndarray) -> None:
+        """Update the structure of the index after rows moved."""
+
+    def _removed(self, row: int) -> None:
+        """Remove a row from the structure of the index."""
+
+    def _relocated(self, source: int, destination: int) -> None:
+        """Update the structure of the index after a row was moved."""
+
+    def _grow(self, capacity: int) -> None:
+        """Reallocate the arrays to hold a given number of rows."""
+        positions = np.zeros((capacity, self.dimensions))
+        positions[:len(self._positions)] = self._positions
+        radii = np.zeros(capacity)
+        radii[:len(self._radii)] = self._radii
+        self._positions, self._radii = positions, radii
+
+    def _point(self, point: Point) -> np.ndarray:
+        """Convert a point to an array with one value per dimension."""
+        return np.array(tuple(point)[:self.dimensions], dtype=np.float64)
+
+    def _select(self, rows: Iterable[int]) -> List[Entity]:
+        """Return the entities in the given rows."""
+        return [self._entities[row] for row in rows]
+
+
+class HashGrid(SpatialIndex):
+    """A spatial index that buckets entities into a uniform grid of cells.
+
+    Each entity is stored in the cell that contains its center, and only
+    occupied cells are stored, in a dictionary. Moving an entity only touches
+    the grid if it crosses into another cell, which makes hash grids a good
+    fit for many moving entities of similar size. The cell size should be
+    about the size of the typical query.
+
+    Example:
+        >>> from flaris import Entity, Vector
+        >>> grid = HashGrid(cell_size=10)
+        >>> enemy = Entity()
+        >>> grid.insert(enemy, Vector(3, 4, 0))
+        >>> grid.within(Vector(0, 0, 0), 5) == [enemy]
+        True
+    """
+
+    def __init__(self, cell_size: float = 1.0, dimensions: int = 3):
+        """Initialize an empty grid.
+
+        Args:
+            cell_size: The length of the sides of each cell (default: 1).
+            dimensions: 2 or 3, the number of coordinates that are indexed
+                (default: 3).
+        """
+        super().__init__(dimensions)
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, ...], Set[int]] = {}
+        self._keys = np.zeros((16, dimensions), dtype=np.int64)
+        self._max_radius = 0.0
+
+    def _inserted(self, row: int) -> None:
+        """Add a row to the cell that contains it."""
+        self._keys[row] = np.floor(self._positions[row] / self.cell_size)
+        self._cells.setdefault(tuple(self._keys[row].tolist()), set()).add(row)
+        self._max_radius = max(self._max_radius, self._radii[row])
+
+    def _moved(self, rows: np.ndarray) -> None:
+        """Move rows that crossed into another cell."""
+        keys = np.floor(self._positions[rows] / self.cell_size).astype(np.int64)
+        crossed = np.any(keys != self._keys[rows], axis=1)
+        for row, key in zip(rows[crossed].tolist(), keys[crossed]):
+            self._removed(row)
+            self._keys[row] = key
+            self._cells.setdefault(tuple(key.tolist()), set()).add(row)
+        self._max_radius = max(self._max_radius, self._radii[rows].max())
+
+    def _removed(self, row: int) -> None:
+        """Remove a row from its cell."""
+        key = tuple(self._keys[row].tolist())
+        cell = self._cells[key]
+        cell.discard(row)
+        if not cell:
+            del self._cells[key]
+
+    def _relocated(self, source: int, destination: int) -> None:
+        """Replace a row with the row that was moved into its place."""
+        key = tuple(self._keys[source].tolist())
+        self._cells[key].discard(source)
+        self._cells[key].add(destination)
+        self._keys[destination] = self._keys[source]
+
+    def _grow(self, capacity: int) -> None:
+        """Reallocate the arrays, including the cell of each row."""
+        super()._grow(capacity)
+        keys = np.zeros((capacity, self.dimensions), dtype=np.int64)
+        keys[:len(self._keys)] = self._keys
+        self._keys = keys
+
+    def _candidates(self, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+        """Return the rows in the cells that overlap a box."""
+        # Entities are stored by their centers, so the box is expanded to find
+        # the centers of entities that overlap it.
+        low = np.floor((lower - self._max_radius) / self.cell_size)
+        high = np.floor((upper + self._max_radius) / self.cell_size)
+        if np.prod(high - low + 1) > len(self._cells):
+            low, high = low.tolist(), high.tolist()
+            cells = (rows for key, rows in self._cells.items()
+                     if all(a <= k <= b for a, k, b in zip(low, key, high)))
+        else:
+            ranges = (range(int(a), int(b) + 1) for a, b in zip(low, high))
+            cells = (self._cells[key]
+                     for key in itertools.product(*ranges)
+                     if key in self._cells)
+        return np.fromiter(itertools.chain.from_iterable(cells), dtype=np.intp)
+
+    def _candidates_along(self, origin: np.ndarray, direction: np.ndarray,
+                          max_distance: float) -> np.ndarray:
+        """Return the rows in the cells that a ray passes through.
+
+        The cells are visited in order with a 3D digital differential
+        analyzer. Cells near the ray are included too, if entities are large
+        enough to reach into the ray's cells from them.
+        """
+        # pylint: disable=too-many-locals
+        segment = _clip(origin, direction, max_distance, *self.bounds())
+        if segment is None:
+            return np.empty(0, dtype=np.intp)
+        start, end = segment
+
+        position = origin + direction * start
+        cell = np.floor(position / self.cell_size).astype(np.int64)
+        step = np.sign(direction).astype(np.int64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            delta = np.abs(self.cell_size / direction)
+            boundary = (cell + (step > 0)) * self.cell_size
+            crossing = np.where(step != 0,
+                                start + (boundary - position) / direction,
+                                math.inf)
+
+        cells = [cell.tolist()]
+        cell, step = cell.tolist(), step.tolist()
+        crossing, delta = crossing.tolist(), delta.tolist()
+        while True:
+            axis = crossing.index(min(crossing))
+            if crossing[axis] > end:
+                break
+            cell[axis] += step[axis]
+            crossing[axis] += delta[axis]
+            cells.append(list(cell))
+
+        reach = math.ceil(self._max_radius / self.cell_size)
+        offsets = np.array(
+            list(
+                itertools.product(range(-reach, reach + 1),
+                                  repeat=self.dimensions)))
+        keys = np.array(cells)[:, np.newaxis] + offsets
+        keys = set(map(tuple, keys.reshape(-1, self.dimensions).tolist()))
+        rows = (self._cells[key] for key in keys if key in self._cells)
+        return np.fromiter(itertools.chain.from_iterable(rows), dtype=np.intp)
+
+
+class BVH(SpatialIndex):
+    """A spatial index that stores entities in a bounding volume hierarchy.
+
+    The hierarchy is a binary tree of boxes built by splitting entities at the
+    median of their longest axis. Moving entities refits the boxes, without
+    changing the tree, in a vectorized pass per level of the tree. Adding or
+    removing entities rebuilds the tree before the next query. BVHs adapt to
+    uneven distributions and sizes of entities, which makes them a good fit
+    for mostly static scenes.
+    """
+
+    def __init__(self, leaf_size: int = 8, dimensions: int = 3):
+        """Initialize an empty hierarchy.
+
+        Args:
+            leaf_size: The maximum number of entities in a leaf (default: 8).
+            dimensions: 2 or 3, the number of coordinates that are indexed
+                (default: 3).
+        """
+        super().__init__(dimensions)
+        self.leaf_size = leaf_size
+        self._tree = None
+        self._refit = False
+
+    def _inserted(self, row: int) -> None:
+        """Rebuild the tree before the next query."""
+        self._tree = None
+
+    def _moved(self, rows: np.ndarray) -> None:
+        """Refit the boxes before the next query."""
+        self._refit = True
+
+    def _removed(self, row: int) -> None:
+        """Rebuild the tree before the next query."""
+        self._tree = None
+
+    def _candidates(self, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+        """Return the rows in the leaves whose boxes overlap a box."""
+        tree = self._current()
+        if tree is None:
+            return np.empty(0, dtype=np.intp)
+        lower, upper = lower.tolist(), upper.tolist()
+
+        rows = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if any(a < b for a, b in zip(tree.upper[node], lower)) or any(
+                    a > b for a, b in zip(tree.lower[node], upper)):
+                continue
+            if tree.left[node] < 0:
+                start = tree.start[node]
+                rows.append(tree.order[start:start + tree.count[node]])
+            else:
+                stack.extend((tree.left[node], tree.right[node]))
+        return np.concatenate(rows) if rows else np.empty(0, dtype=np.intp)
+
+    def _candidates_along(self, origin: np.ndarray, direction: np.ndarray,
+                          max_distance: float) -> np.ndarray:
+        """Return the rows in the leaves whose boxes a ray passes through."""
+        tree = self._current()
+        if tree is None:
+            return np.empty(0, dtype=np.intp)
+
+        rows = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if _clip(origin, direction, max_distance, tree.lower[node],
+                     tree.upper[node]) is None:
+                continue
+            if tree.left[node] < 0:
+                start = tree.start[node]
+                rows.append(tree.order[start:start + tree.count[node]])
+            else:
+                stack.extend((tree.left[node], tree.right[node]))
+        return np.concatenate(rows) if rows else np.empty(0, dtype=np.intp)
+
+    def _current(self) -> Optional[_Tree]:
+        """Return the tree, rebuilding or refitting it if it's out of date."""
+        if not self:
+            return None
+        if self._tree is None:
+            self._tree = _Tree(self._positions[:len(self)], self.leaf_size)
+            self._refit = True
+        if self._refit:
+            self._tree.refit(self._positions[:len(self)],
+                             self._radii[:len(self)])
+            self._refit = False
+        return self._tree
+
+
+class _Tree:
+    """The nodes of a `BVH`, stored in arrays.
+
+    Node 0 is the root. Leaves have a `left` child of -1, and contain the rows
+    `order[start:start + count]`.
+    """
+
+    # pylint: disable=too-few-public-methods,too-many-instance-attributes
+
+    def __init__(self, centers: np.ndarray, leaf_size: int):
+        """Build a tree by recursively splitting the centers at the median.
+
+        Args:
+            centers: An array containing the center of each entity.
+            leaf_size: The maximum number of entities in a leaf.
+        """
+        # pylint: disable=too-many-locals
+        self.order = np.arange(len(centers))
+        start, count, left, right, depth = [0], [len(centers)], [-1], [-1], [0]
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if count[node] <= leaf_size:
+                continue
+            rows = self.order[start[node]:start[node] + count[node]]
+            points = centers[rows]
+            axis = int(np.argmax(np.ptp(points, axis=0)))
+            half = count[node] // 2
+            rows[:] = rows[np.argpartition(points[:, axis], half)]
+            for offset, size in ((0, half), (half, count[node] - half)):
+                stack.append(len(start))
+                start.append(start[node] + offset)
+                count.append(size)
+                left.append(-1)
+                right.append(-1)
+                depth.append(depth[node] + 1)
+            left[node], right[node] = stack[-2], stack[-1]
+
+        self.start, self.count = start, count
+        self.left, self.right = left, right
+        self._depth = np.array(depth)
+        self.lower = self.upper = None
+
+    def refit(self, centers: np.ndarray, radii: np.ndarray) -> None:
+        """Recompute the box of every node, from the leaves up.
+
+        Args:
+            centers: An array containing the center of each entity.
+            radii: An array containing the radius of each entity.
+        """
+        left = np.array(self.left)
+        right = np.array(self.right)
+        start = np.array(self.start)
+        leaves = np.flatnonzero(left < 0)
+        leaves = leaves[np.argsort(start[leaves])]
+
+        ordered = centers[self.order]
+        extent = radii[self.order, np.newaxis]
+        lower = np.empty((len(left), centers.shape[1]))
+        upper = np.empty((len(left), centers.shape[1]))
+        lower[leaves] = np.minimum.reduceat(ordered - extent, start[leaves])
+        upper[leaves] = np.maximum.reduceat(ordered + extent, start[leaves])
+        for depth in range(self._depth.max() - 1, -1, -1):
+            nodes = np.flatnonzero((self._depth == depth) & (left >= 0))
+            lower[nodes] = np.minimum(lower[left[nodes]], lower[right[nodes]])
+            upper[nodes] = np.maximum(upper[left[nodes]], upper[right[nodes]])
+        self.lower, self.upper = lower.tolist(), upper.tolist()
+
+
+class SpatialSystem(System):
+    """System that keeps a spatial index up to date with the world.
+
+    Entities with a `Transform` are added to the index when they're added to
+    the world, and removed when they're removed from it. Entities added
+    together are inserted the next time the index is used, so their world
+    positions are computed at once. Every step, the world position of each
+    entity is compared with its position in the index, and only the entities
+    that moved are updated.
+
+    Entities are indexed as points. Override `SpatialSystem.radius` to give
+    them a size.
+
+    Example:
+        >>> from flaris import Entity, Vector, World
+        >>> class Enemy(Entity):
+        ...     def __init__(self, position):
+        ...         super().__init__()
+        ...         self.transform = Transform(position)
+        >>> world = World()
+        >>> spatial = SpatialSystem(HashGrid(cell_size=10))
+        >>> world.register(spatial)
+        >>> enemy = Enemy(Vector(3, 4, 0))
+        >>> world.add(enemy)
+        >>> spatial.index.within(Vector(0, 0, 0), 5) == [enemy]
+        True
+    """
+
+    REQUIRED_COMPONENTS = (Transform,)
+    READS = (Transform,)
+    WRITES = ()
+
+    def __init__(self, index: Optional[SpatialIndex] = None):
+        """Initialize the system.
+
+        Args:
+            index: The index to keep up to date (default: a 3D `HashGrid` with
+                a cell size of 1).
+        """
+        super().__init__()
+        self._index = index if index is not None else HashGrid()
+        # Entities added since the index was last used, which are inserted
+        # together so that world matrices are computed once.
+        self._pending: List[Entity] = []
+        # The transform row of each entity in the index, in the order of
+        # `SpatialIndex.entities`.
+        self._slots = np.zeros(0, dtype=np.intp)
+
+    @property
+    def index(self) -> SpatialIndex:
+        """Return the index, with every entity added to the system inserted."""
+        if self._pending:
+            slots = gather([entity[Transform] for entity in self._pending])
+            positions = Transform.ARRAY.world_matrices(slots)[:, 3, :3]
+            for entity, position in zip(self._pending, positions):
+                self._index.insert(entity, position, self.radius(entity))
+            self._slots = np.concatenate([self._slots, slots])
+            self._pending.clear()
+        return self._index
+
+    def add(self, entity: Entity) -> None:
+        """Add an entity to the system and to the index."""
+        super().add(entity)
+        self._pending.append(entity)
+
+    def remove(self, entity: Entity) -> None:
+        """Remove an entity from the system and from the index."""
+        super().remove(entity)
+        if entity in self._pending:
+            self._pending.remove(entity)
+            return
+        # The index moves its last row into the removed row, and so do the
+        # slots.
+        row = self._index.row(entity)
+        self._index.remove(entity)
+        last = len(self._index)
+        self._slots[row] = self._slots[last]
+        self._slots = self._slots[:last]
+
+    def radius(self, entity: Entity) -> float:
+        """Return the radius of an entity's bounding sphere.
+
+        This is called when an entity is inserted into the index. By default,
+        entities are points, with a radius of 0.
+        """
+        # pylint: disable=unused-argument
+        return 0.0
+
+    def step(self, delta: float) -> None:
+        """Move the entities whose world positions changed."""
+        index = self.index
+        if not index:
+            return
+        matrices = Transform.ARRAY.world_matrices(self._slots)
+        index.update(matrices[:, 3, :3])
+
+
+def _clip(origin: np.ndarray, direction: np.ndarray, max_distance: float,
+          lower: Point, upper: Point) -> Optional[Tuple[float, float]]:
+    """Clip a ray to a box with the slab method.
+
+    Returns:
+        The distances along the ray where it enters and exits the box, or None
+        if the ray misses the box.
+    """
+    start, end = 0.0, max_distance
+    for o, d, low, high in zip(origin.tolist(), direction.tolist(), lower,
+                               upper):
+        if d == 0:
+            if o < low or o > high:
+                return None
+            continue
+        near, far = (low - o) / d, (high - o) / d
+        if near > far:
+            near, far = far, near
+        start, end = max(start, near), min(end, far)
+        if start > end:
+            return None
+    return start, end
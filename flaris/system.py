@@ -4,12 +4,14 @@ from __future__ import annotations
 import abc
 from typing import Iterable, List, TYPE_CHECKING
 
-from .component import ComponentError
+from .component import ComponentError, component_mask
+from .profiler import PROFILER
 
 if TYPE_CHECKING:
+    from .batch import Batch
     from .entity import Entity
 
-__all__ = ["System", "SequentialSystem", "UpdateSystem"]
+__all__ = ["BatchSystem", "System", "SequentialSystem", "UpdateSystem"]
 
 
 class System(abc.ABC):
@@ -18,13 +20,26 @@ class System(abc.ABC):
     Attributes:
         REQUIRED_COMPONENTS: A list of types describing the components that this
             system acts on.
+        READS: A list of the component types that this system reads, or None if
+            the system doesn't declare the components it accesses.
+        WRITES: A list of the component types that this system modifies, or None
+            if the system doesn't declare the components it accesses.
+        MAIN_THREAD: If true, the system must run on the main thread, for
+            example because it makes OpenGL or GLFW calls.
+        world: The `World` that stores the entities this system acts on, or
+            None if the system has not been registered with a world.
     """
 
     REQUIRED_COMPONENTS = ()
+    READS = None
+    WRITES = None
+    MAIN_THREAD = False
 
     def __init__(self):
         """Initialize the system."""
         self._entities = set()
+        self._mask = component_mask(*self.REQUIRED_COMPONENTS)
+        self.world = None
 
     def __contains__(self, entity: Entity) -> bool:
         """Return true if the entity is part of the system."""
@@ -78,10 +93,12 @@ class System(abc.ABC):
         Returns: True, if and only if the entity possesses all of the components
             required by this system, as defined by `System.REQUIRED_COMPONENTS`.
         """
-        for component_type in self.REQUIRED_COMPONENTS:
-            if component_type not in entity:
-                return False
-        return True
+        return entity.mask & self._mask == self._mask
+
+    @property
+    def mask(self) -> int:
+        """Return a bitmask representing `System.REQUIRED_COMPONENTS`."""
+        return self._mask
 
     @property
     def entities(self) -> Iterable[Entity]:
@@ -99,6 +116,7 @@ class SequentialSystem:
             systems: An ordered collection of systems to run.
         """
         self.systems = systems
+        self.world = None
 
     def __contains__(self, entity: Entity) -> bool:
         """Return true if the entity is part of the system."""
@@ -120,18 +138,14 @@ class SequentialSystem:
         After adding an entity to the system, the system can act on the entity
         every frame.
 
+        Each system only receives the entity if it accepts the entity.
+
         Args:
             entity: The entity to add.
-
-        Raises:
-            ComponentError: If the entity does not possess the components
-                requried to be part of this system.
         """
         for system in self.systems:
-            try:
+            if system.accepts(entity):
                 system.add(entity)
-            except ComponentError:
-                pass
 
     def remove(self, entity: Entity) -> None:
         """Remove an entity from the system."""
@@ -139,6 +153,10 @@ class SequentialSystem:
             if entity in system:
                 system.remove(entity)
 
+    def accepts(self, entity: Entity) -> bool:
+        """Return true if any of the systems accepts the entity."""
+        return any(system.accepts(entity) for system in self.systems)
+
     def step(self, delta: float) -> None:
         """Sequentially advance each system by one step.
 
@@ -146,7 +164,10 @@ class SequentialSystem:
             delta: The amount of time required to complete the previous frame.
         """
         for system in self.systems:
-            system.step(delta)
+            if PROFILER.enabled:
+                PROFILER.step(system, delta)
+            else:
+                system.step(delta)
 
 
 class UpdateSystem(System):
@@ -160,3 +181,44 @@ class UpdateSystem(System):
         """
         for entity in self.entities:
             entity.update(delta)
+
+
+class BatchSystem(System):
+    """A system that acts on every entity at once with array operations.
+
+    Instead of visiting entities one at a time, a batch system receives the
+    array-backed fields of all the entities it acts on as NumPy arrays, so an
+    update like integrating velocities costs one array operation regardless of
+    how many entities there are. Subclasses implement `BatchSystem.update`.
+
+    Example:
+        >>> import numpy as np
+        >>> from flaris import ArrayComponent, Field
+        >>> class Velocity(ArrayComponent):
+        ...     value = Field(3)
+        >>> class Position(ArrayComponent):
+        ...     value = Field(3)
+        >>> class MovementSystem(BatchSystem):
+        ...     REQUIRED_COMPONENTS = (Position, Velocity)
+        ...     def update(self, batch, delta):
+        ...         batch[Position].value += batch[Velocity].value * delta
+    """
+
+    def step(self, delta: float) -> None:
+        """Update the entities that have the required components.
+
+        Args:
+            delta: The amount of time required to complete the previous frame.
+        """
+        batch = self.world.batch(*self.REQUIRED_COMPONENTS)
+        if batch:
+            self.update(batch, delta)
+
+    @abc.abstractmethod
+    def update(self, batch: Batch, delta: float) -> None:
+        """Update the fields of every entity in a batch.
+
+        Args:
+            batch: The fields of every entity that has the required components.
+            delta: The amount of time required to complete the previous frame.
+        """
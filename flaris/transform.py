@@ -1,22 +1,51 @@
 """Implements classes related to Euclidean space."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Union
+import numbers
+from dataclasses import FrozenInstanceError
+from typing import (Any, Dict, Iterable, Iterator, List, NamedTuple, Optional,
+                    Tuple, Union)
 
-from .component import Component
+import numpy as np
 
-__all__ = ["Direction", "Transform", "Vector"]
+from .batch import Index
+from .fields import ArrayComponent, ComponentArray, Field
+
+__all__ = [
+    "Direction", "Quaternion", "Transform", "TransformArray", "Vector",
+    "VectorArray"
+]
 
 
-@dataclass(frozen=True)
 class Vector:
-    """An object representing a three-dimensional vector."""
+    """An object representing a three-dimensional vector.
+
+    Vectors are immutable, so they can be shared freely, for example as
+    default arguments or as the constants in `Direction`. Operators return new
+    vectors. To update many vectors without allocating, use the in-place
+    methods of a `VectorArray`.
+    """
+
+    __slots__ = ("x", "y", "z")
 
     x: float
     y: float
     z: float
 
+    def __init__(self, x: float, y: float, z: float):
+        """Initialize the components of the vector."""
+        _SET_X(self, x)
+        _SET_Y(self, y)
+        _SET_Z(self, z)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Raise an error, because vectors are immutable."""
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        """Raise an error, because vectors are immutable."""
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
     def __add__(self, vector: Vector) -> Vector:
         """Add a vector to this vector.
 
@@ -117,15 +146,205 @@ class Vector:
 
         return Vector(self.x % other, self.y % other, self.z % other)
 
+    def __hash__(self) -> int:
+        """Return a hash of the components of this vector."""
+        return hash((self.x, self.y, self.z))
+
     def __iter__(self):
         """Return an iterator over this vector."""
-        return iter([self.x, self.y, self.z])
+        return iter((self.x, self.y, self.z))
+
+    def __reduce__(self) -> Tuple[type, Tuple[float, float, float]]:
+        """Return how to copy or pickle this vector."""
+        return Vector, (self.x, self.y, self.z)
 
     def __repr__(self) -> str:
         """Represent the Vector as a string."""
         return "Vector(%s, %s, %s)" % (self.x, self.y, self.z)
 
 
+# Vectors assign their components through the slot descriptors, because
+# `Vector.__setattr__` raises an error.
+_SET_X = Vector.x.__set__  # pylint: disable=no-member
+_SET_Y = Vector.y.__set__  # pylint: disable=no-member
+_SET_Z = Vector.z.__set__  # pylint: disable=no-member
+
+
+class VectorArray:
+    """A batch of vectors stored in an (n, 3) NumPy array.
+
+    Vector arrays support the same operators as `Vector`, applied to every
+    vector at once. The other operand can be a vector array of the same length,
+    a single `Vector`, or a scalar. Augmented assignments like `+=` and the
+    in-place methods modify the array instead of allocating a new one.
+
+    Example:
+        >>> positions = VectorArray([Vector(0, 0, 0), Vector(1, 2, 3)])
+        >>> positions += Vector(1, 0, 0)
+        >>> list(positions * 2)
+        [Vector(2.0, 0.0, 0.0), Vector(4.0, 4.0, 6.0)]
+
+    Attributes:
+        array: The (n, 3) float64 array storing the vectors.
+    """
+
+    __slots__ = ("array",)
+
+    __hash__ = None
+
+    def __init__(self, vectors: Union[Iterable[Vector], np.ndarray] = ()):
+        """Store the vectors in an array.
+
+        Args:
+            vectors: The vectors to store, or an (n, 3) array. Float64 arrays
+                are wrapped without being copied, so a `FieldView` column can
+                be operated on in place (default: no vectors).
+        """
+        if not isinstance(vectors, np.ndarray):
+            vectors = [tuple(vector) for vector in vectors]
+        array = np.asarray(vectors, dtype=np.float64)
+        self.array = array if array.ndim == 2 else array.reshape(-1, 3)
+
+    @classmethod
+    def zeros(cls, length: int) -> VectorArray:
+        """Return a vector array containing `length` zero vectors."""
+        return cls(np.zeros((length, 3)))
+
+    def __len__(self) -> int:
+        """Return the number of vectors in the array."""
+        return len(self.array)
+
+    def __iter__(self) -> Iterator[Vector]:
+        """Return an iterator over the vectors in the array."""
+        return (Vector(*row) for row in self.array.tolist())
+
+    def __getitem__(self, index: Union[int,
+                                       Index]) -> Union[Vector, VectorArray]:
+        """Return a vector, or a vector array if indexed by a slice or array.
+
+        Like NumPy, slicing returns a view of this array.
+        """
+        if isinstance(index, numbers.Integral):
+            return Vector(*self.array[index].tolist())
+        return VectorArray(self.array[index])
+
+    def __setitem__(self, index: Union[int, Index],
+                    value: Union[Vector, VectorArray]) -> None:
+        """Replace the vectors at an index."""
+        self.array[index] = _operand(value)
+
+    def __add__(self, other: Union[VectorArray, Vector]) -> VectorArray:
+        """Add vectors to the vectors in this array."""
+        return VectorArray(self.array + _operand(other))
+
+    def __sub__(self, other: Union[VectorArray, Vector]) -> VectorArray:
+        """Subtract vectors from the vectors in this array."""
+        return VectorArray(self.array - _operand(other))
+
+    def __mul__(self, obj: Union[VectorArray, Vector, float]) -> VectorArray:
+        """Multiply the vectors in this array with scalars or vectors.
+
+        Vector multiplication is performed component-wise.
+        """
+        return VectorArray(self.array * _operand(obj))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, scalar: float) -> VectorArray:
+        """Divide the vectors in this array by a scalar."""
+        return VectorArray(self.array / scalar)
+
+    def __matmul__(self, other: Union[VectorArray, Vector]) -> np.ndarray:
+        """Return the dot product of each vector with another vector."""
+        return np.einsum("ij,ij->i", self.array,
+                         np.broadcast_to(_operand(other), self.array.shape))
+
+    def __mod__(self, other: int) -> VectorArray:
+        """Apply the modulo operator to each component of each vector.
+
+        Raises:
+            ValueError: if other is not an int.
+        """
+        if not isinstance(other, int):
+            raise ValueError("Expected int but got %s." % type(other))
+        return VectorArray(self.array % other)
+
+    def __eq__(self, other: object) -> bool:
+        """Return true if other is a VectorArray with equal vectors."""
+        if not isinstance(other, VectorArray):
+            return False
+        return np.array_equal(self.array, other.array)
+
+    def __iadd__(self, other: Union[VectorArray, Vector]) -> VectorArray:
+        """Add vectors to the vectors in this array in place."""
+        return self.iadd(other)
+
+    def __isub__(self, other: Union[VectorArray, Vector]) -> VectorArray:
+        """Subtract vectors from the vectors in this array in place."""
+        return self.isub(other)
+
+    def __imul__(self, obj: Union[VectorArray, Vector, float]) -> VectorArray:
+        """Multiply the vectors in this array in place."""
+        return self.imul(obj)
+
+    def __repr__(self) -> str:
+        """Represent the VectorArray as a string."""
+        return "VectorArray(%s)" % np.array2string(self.array, separator=", ")
+
+    def iadd(self, other: Union[VectorArray, Vector]) -> VectorArray:
+        """Add vectors to the vectors in this array in place.
+
+        Returns:
+            This vector array.
+        """
+        self.array += _operand(other)
+        return self
+
+    def isub(self, other: Union[VectorArray, Vector]) -> VectorArray:
+        """Subtract vectors from the vectors in this array in place.
+
+        Returns:
+            This vector array.
+        """
+        self.array -= _operand(other)
+        return self
+
+    def imul(self, obj: Union[VectorArray, Vector, float]) -> VectorArray:
+        """Multiply the vectors in this array with scalars or vectors in place.
+
+        Returns:
+            This vector array.
+        """
+        self.array *= _operand(obj)
+        return self
+
+    @property
+    def x(self) -> np.ndarray:
+        """Return a view of the x components of the vectors."""
+        return self.array[:, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        """Return a view of the y components of the vectors."""
+        return self.array[:, 1]
+
+    @property
+    def z(self) -> np.ndarray:
+        """Return a view of the z components of the vectors."""
+        return self.array[:, 2]
+
+
+def _operand(obj: Union[VectorArray, Vector, float, np.ndarray]) -> Any:
+    """Return a value that broadcasts against the array of a VectorArray."""
+    if isinstance(obj, VectorArray):
+        return obj.array
+    if isinstance(obj, Vector):
+        return np.array((obj.x, obj.y, obj.z))
+    if isinstance(obj, (numbers.Real, np.ndarray)):
+        return obj
+    raise NotImplementedError
+
+
 class Direction:  # pylint: disable=too-few-public-methods
     """Defines commonly used unit vectors."""
     RIGHT = Vector(1, 0, 0)
@@ -136,15 +355,348 @@ class Direction:  # pylint: disable=too-few-public-methods
     BACKWARD = Vector(0, 0, -1)
 
 
-class Transform(Component):  # pylint: disable=unused-argument
+class Quaternion(NamedTuple):
+    """A unit quaternion representing an orientation."""
+
+    w: float
+    x: float
+    y: float
+    z: float
+
+
+class _Hierarchy:
+    """The parent of each row of a `TransformArray` and its world matrix.
+
+    Rows are grouped into levels by their depth in the hierarchy, so world
+    matrices can be propagated from roots to leaves one level at a time with
+    vectorized operations instead of recursive calls.
+    """
+
+    def __init__(self, capacity: int):
+        """Make every row a root.
+
+        Args:
+            capacity: The number of rows.
+        """
+        self.parents = np.full(capacity, -1, dtype=np.intp)
+        self.depths = np.zeros(capacity, dtype=np.intp)
+        self.matrices = np.zeros((capacity, 4, 4), dtype=np.float32)
+        self.dirty = np.ones(capacity, dtype=bool)
+        self._levels = None
+
+    def reparent(self, rows: np.ndarray, depths: np.ndarray,
+                 parent: int) -> None:
+        """Move a subtree under a new parent.
+
+        Args:
+            rows: The rows of the subtree, starting with its root.
+            depths: The new depth of each row of the subtree.
+            parent: The row of the new parent, or -1 to make the subtree's root
+                a root of the hierarchy.
+        """
+        self.parents[rows[0]] = parent
+        self.depths[rows] = depths
+        self.dirty[rows[0]] = True
+        self._levels = None
+
+    def update(self, local: np.ndarray) -> None:
+        """Recompute the world matrices of dirty rows and their descendants.
+
+        Args:
+            local: The model matrix of every row relative to its parent.
+        """
+        if not self.dirty.any():
+            return
+
+        # Levels above the shallowest dirty row don't need to be visited.
+        start = self.depths[self.dirty].min()
+        for level in self._hierarchy_levels()[start:]:
+            parents = self.parents[level]
+            dirty = self.dirty[level] | ((parents >= 0) & self.dirty[parents])
+            rows, parents = level[dirty], parents[dirty]
+            if not rows.size:
+                continue
+            # Descendants of a dirty row are dirty too.
+            self.dirty[rows] = True
+            roots = parents < 0
+            self.matrices[rows[roots]] = local[rows[roots]]
+            # The matrices are stored transposed, so the parent's matrix is on
+            # the right.
+            children = ~roots
+            self.matrices[rows[children]] = np.matmul(
+                local[rows[children]], self.matrices[parents[children]])
+        self.dirty[:] = False
+
+    def reset(self, row: int) -> None:
+        """Make a reused row a root."""
+        if self.depths[row]:
+            self._levels = None
+        self.parents[row] = -1
+        self.depths[row] = 0
+        self.dirty[row] = True
+
+    def grow(self, capacity: int) -> None:
+        """Add roots until there are a given number of rows."""
+        added = capacity - len(self.parents)
+        self.parents = np.concatenate(
+            [self.parents, np.full(added, -1, dtype=np.intp)])
+        self.depths = np.concatenate(
+            [self.depths, np.zeros(added, dtype=np.intp)])
+        self.matrices = np.concatenate(
+            [self.matrices,
+             np.zeros((added, 4, 4), dtype=np.float32)])
+        self.dirty = np.concatenate([self.dirty, np.ones(added, dtype=bool)])
+        self._levels = None
+
+    def _hierarchy_levels(self) -> List[np.ndarray]:
+        """Return the rows at each depth, starting with the roots."""
+        if self._levels is None:
+            order = np.argsort(self.depths, kind="stable")
+            bounds = np.cumsum(np.bincount(self.depths))[:-1]
+            self._levels = np.split(order, bounds)
+        return self._levels
+
+
+class TransformArray(ComponentArray):
+    """Contiguous storage for the position, rotation, and scale of transforms.
+
+    Each field is stored as an (n, 3) or (n, 4) array of float64 values, so the
+    model matrices of every transform can be computed in a single vectorized
+    pass. Rotations are stored both as euler angles, which are what users read
+    and write, and as quaternions, which are what matrices are built from.
+
+    The fields of a transform are relative to its parent, if it has one. The
+    model matrix of each row, relative to its parent, and its world matrix are
+    cached. They're only recomputed after a field of the row or of one of its
+    ancestors is modified. Writes through `Transform` attributes and through
+    `FieldView`s are tracked automatically; code that writes to the columns
+    directly must call `TransformArray.modified`.
+    """
+
+    def __init__(self, fields: Dict[str, Field], capacity: int = 64):
+        """Allocate empty columns and an empty matrix cache.
+
+        Args:
+            fields: A dictionary that maps field names to fields.
+            capacity: The initial number of rows (default: 64).
+        """
+        super().__init__(fields, capacity)
+        self._matrices = np.zeros((capacity, 4, 4), dtype=np.float32)
+        self._dirty = np.ones(capacity, dtype=bool)
+        self._rotated = np.zeros(capacity, dtype=bool)
+        self._versions = np.zeros(capacity, dtype=np.int64)
+        self._hierarchy = _Hierarchy(capacity)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """Return the column that stores a field, including unused rows."""
+        if name == "orientation":
+            self._update_orientations(np.flatnonzero(self._rotated))
+        return super().__getitem__(name)
+
+    def modified(self, name: str, rows: Union[int, Index]) -> None:
+        """Keep both rotations in sync and invalidate the cached matrices.
+
+        Quaternions are computed from euler angles lazily, the next time they
+        are read or needed for a matrix, so that they're computed in batches.
+        """
+        if name == "rotation":
+            self._rotated[rows] = True
+        elif name == "orientation":
+            orientation = self["orientation"][rows]
+            orientation /= np.linalg.norm(orientation, axis=-1, keepdims=True)
+            self["orientation"][rows] = orientation
+            self["rotation"][rows] = _euler_angles(orientation)
+        self._dirty[rows] = True
+        self._hierarchy.dirty[rows] = True
+        self._versions[rows] += 1
+
+    def allocate(self) -> int:
+        """Reserve a row without a parent and with out of date matrices."""
+        slot = super().allocate()
+        self._hierarchy.reset(slot)
+        self.modified(None, slot)
+        return slot
+
+    def reparent(self, rows: np.ndarray, depths: np.ndarray,
+                 parent: int) -> None:
+        """Move a subtree of transforms under a new parent.
+
+        Use `Transform.parent` instead of calling this directly.
+
+        Args:
+            rows: The rows of the subtree, starting with its root.
+            depths: The new depth of each row of the subtree, where roots have
+                a depth of 0.
+            parent: The row of the new parent, or -1 if the subtree's root
+                won't have a parent.
+        """
+        self._hierarchy.reparent(rows, depths, parent)
+
+    def version(self, slot: int) -> int:
+        """Return a number that changes whenever a row is modified.
+
+        Versions aren't reset when a row is reused, so the row and version
+        together can be used as a cache key for values derived from a
+        transform.
+        """
+        return int(self._versions[slot])
+
+    def model_matrices(self, rows: Index = slice(None)) -> np.ndarray:
+        """Return the model matrices of many transforms at once.
+
+        A model matrix scales, then rotates around the x, y, and z axes of the
+        transform in that order, and then translates. Only the matrices of rows
+        modified since they were last computed are recomputed, so the matrices
+        of static transforms are free after the first call.
+
+        Args:
+            rows: A slice or an array of the rows of the transforms to get
+                matrices for, like `Batch.rows(Transform)` (default: every
+                row).
+
+        Returns:
+            An (n, 4, 4) float32 array containing one matrix per row. Each
+            matrix is stored column by column, as OpenGL expects, so the
+            buffer can be uploaded as is and `matrices[i].T` is the i-th matrix.
+            The array may be a view of the cache, so it must not be modified.
+        """
+        dirty = self._dirty[rows]
+        if dirty.any():
+            stale = np.arange(self.capacity)[rows][dirty]
+            self._matrices[stale] = self._compute(stale)
+            self._dirty[stale] = False
+        return self._matrices[rows]
+
+    def world_matrices(self, rows: Index = slice(None)) -> np.ndarray:
+        """Return the world matrices of many transforms at once.
+
+        A world matrix is the model matrix of a transform multiplied by the
+        world matrix of its parent, so it transforms from the transform's local
+        space to world space. The world matrices of transforms without parents
+        are their model matrices.
+
+        World matrices are propagated from the roots of the hierarchy down,
+        one depth at a time, and only through subtrees below a modified
+        transform.
+
+        Args:
+            rows: A slice or an array of the rows of the transforms to get
+                matrices for (default: every row).
+
+        Returns:
+            An (n, 4, 4) float32 array laid out like the array returned by
+            `TransformArray.model_matrices`. It may be a view of the cache, so
+            it must not be modified.
+        """
+        self._hierarchy.update(self.model_matrices())
+        return self._hierarchy.matrices[rows]
+
+    def rotate(self, rows: Union[int, Index], angles: np.ndarray) -> None:
+        """Add euler angles to the rotations of many transforms at once.
+
+        Args:
+            rows: An int, slice, or array of the rows to rotate.
+            angles: The angles in degrees to add to each row's rotation.
+        """
+        rotation = self["rotation"]
+        rotation[rows] = np.mod(rotation[rows] + angles, 360)
+        self.modified("rotation", rows)
+
+    def _update_orientations(self, rows: np.ndarray) -> None:
+        """Compute the quaternions of rows whose euler angles changed."""
+        rows = rows[self._rotated[rows]]
+        if rows.size:
+            column = super().__getitem__("orientation")
+            column[rows] = _quaternions(self["rotation"][rows])
+            self._rotated[rows] = False
+
+    def _compute(self, rows: np.ndarray) -> np.ndarray:
+        """Compute the model matrices of the given rows."""
+        self._update_orientations(rows)
+        w, x, y, z = super().__getitem__("orientation")[rows].T
+        scale_x, scale_y, scale_z = self["scale"][rows].T
+
+        matrices = np.zeros((len(rows), 4, 4), dtype=np.float32)
+        # matrices[:, column, row] is the entry of the rotation in that row and
+        # column, multiplied by the scale of that column.
+        matrices[:, 0, 0] = (1 - 2 * (y * y + z * z)) * scale_x
+        matrices[:, 0, 1] = 2 * (x * y + w * z) * scale_x
+        matrices[:, 0, 2] = 2 * (x * z - w * y) * scale_x
+        matrices[:, 1, 0] = 2 * (x * y - w * z) * scale_y
+        matrices[:, 1, 1] = (1 - 2 * (x * x + z * z)) * scale_y
+        matrices[:, 1, 2] = 2 * (y * z + w * x) * scale_y
+        matrices[:, 2, 0] = 2 * (x * z + w * y) * scale_z
+        matrices[:, 2, 1] = 2 * (y * z - w * x) * scale_z
+        matrices[:, 2, 2] = (1 - 2 * (x * x + y * y)) * scale_z
+        matrices[:, 3, :3] = self["position"][rows]
+        matrices[:, 3, 3] = 1
+        return matrices
+
+    def _grow(self) -> None:
+        """Double the number of rows and the size of the matrix caches."""
+        capacity = self.capacity
+        super()._grow()
+        self._hierarchy.grow(self.capacity)
+        self._matrices = np.concatenate(
+            [self._matrices, np.zeros_like(self._matrices)])
+        self._dirty = np.concatenate(
+            [self._dirty, np.ones(capacity, dtype=bool)])
+        self._rotated = np.concatenate(
+            [self._rotated, np.zeros(capacity, dtype=bool)])
+        self._versions = np.concatenate(
+            [self._versions, np.zeros_like(self._versions)])
+
+
+class Transform(ArrayComponent, array=TransformArray):
     """An object representing a position, rotation, and scale.
 
+    Transforms are views into a `TransformArray` shared by every transform,
+    which is stored in `Transform.ARRAY`. Reading an attribute returns a new
+    `Vector`, so assign to the attribute to change it.
+
+    A rotation is stored as a quaternion, `orientation`, and can also be read
+    and written as euler angles in degrees, `rotation`. Assigning to either
+    one updates the other.
+
+    Transforms can be arranged in a hierarchy by assigning a `parent`. The
+    position, rotation, and scale of a transform with a parent are relative to
+    the parent, so moving the parent moves its descendants too:
+
+        >>> tank = Transform(position=Vector(10, 0, 0))
+        >>> turret = Transform(position=Vector(0, 1, 0))
+        >>> turret.parent = tank
+        >>> tank.translate(Vector(5, 0, 0))
+        >>> turret.world_position
+        Vector(15.0, 1.0, 0.0)
+
     Attributes:
-        position: A Vector representing the world position of the transform.
+        position: A Vector representing the position of the transform, relative
+            to its parent if it has one.
+        orientation: A Quaternion representing the rotation of the transform.
         rotation: A Vector representing the euler angles of the transform.
         scale: A Vector the scale of the transform.
     """
 
+    __slots__ = ("_parent", "_children")
+
+    # Declared for pylint, which doesn't see the slots assigned in `__new__`.
+    _parent: Optional[Transform]
+    _children: List[Transform]
+
+    # The orientation is declared before the rotation so that copies assign
+    # the rotation last, which keeps its values exact.
+    position = Field(3, wrap=Vector)
+    orientation = Field(4, default=(1.0, 0.0, 0.0, 0.0), wrap=Quaternion)
+    rotation = Field(3, wrap=Vector)
+    scale = Field(3, default=1.0, wrap=Vector)
+
+    def __new__(cls, *args, **kwargs):
+        """Construct a transform without a parent or children."""
+        transform = super().__new__(cls, *args, **kwargs)
+        transform._parent = None
+        transform._children = []
+        return transform
+
     def __init__(self,
                  position: Vector = Vector(0, 0, 0),
                  rotation: Vector = Vector(0, 0, 0),
@@ -162,6 +714,103 @@ class Transform(Component):  # pylint: disable=unused-argument
         self.rotation = rotation
         self.scale = scale
 
+    @property
+    def model(self) -> np.ndarray:
+        """Return the model matrix of this transform.
+
+        See `TransformArray.model_matrices`.
+        """
+        return self.ARRAY.model_matrices(slice(self.slot, self.slot + 1))[0]
+
+    @property
+    def world_model(self) -> np.ndarray:
+        """Return the world matrix of this transform.
+
+        See `TransformArray.world_matrices`.
+        """
+        rows = slice(self.slot, self.slot + 1)
+        return self.ARRAY.world_matrices(rows)[0]
+
+    @property
+    def world_position(self) -> Vector:
+        """Return the position of this transform in world space."""
+        return Vector(*self.world_model[3, :3].tolist())
+
+    @property
+    def parent(self) -> Optional[Transform]:
+        """Return the transform that this transform is relative to, if any."""
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent: Optional[Transform]) -> None:
+        """Make this transform relative to another transform.
+
+        The position, rotation, and scale of this transform are kept, so they
+        become relative to the new parent.
+
+        Raises:
+            ValueError: If the parent is this transform or a descendant of it.
+        """
+        # pylint: disable=protected-access
+        ancestor = parent
+        while ancestor is not None:
+            if ancestor is self:
+                raise ValueError(
+                    f"Cannot make {parent} the parent of {self} because it is "
+                    f"{self} or one of its descendants.")
+            ancestor = ancestor.parent
+
+        if self._parent is not None:
+            # Transforms compare equal by value, so siblings are removed by
+            # identity rather than with `list.remove`.
+            siblings = self._parent._children
+            index = next(
+                i for i, sibling in enumerate(siblings) if sibling is self)
+            del siblings[index]
+        self._parent = parent
+        if parent is not None:
+            parent._children.append(self)
+
+        depth = parent.depth + 1 if parent is not None else 0
+        rows, depths = zip(*((transform.slot, depth + offset)
+                             for transform, offset in self._subtree()))
+        self.ARRAY.reparent(np.array(rows), np.array(depths),
+                            parent.slot if parent is not None else -1)
+
+    @property
+    def children(self) -> Tuple[Transform, ...]:
+        """Return the transforms whose parent is this transform."""
+        return tuple(self._children)
+
+    @property
+    def depth(self) -> int:
+        """Return the number of ancestors of this transform."""
+        depth, ancestor = 0, self._parent
+        while ancestor is not None:
+            depth, ancestor = depth + 1, ancestor.parent
+        return depth
+
+    def _subtree(self) -> Iterator[Tuple[Transform, int]]:
+        """Yield each descendant of this transform, including itself.
+
+        Returns:
+            An iterator over pairs of descendants and their depth relative to
+            this transform.
+        """
+        stack = [(self, 0)]
+        while stack:
+            transform, depth = stack.pop()
+            yield transform, depth
+            stack.extend((child, depth + 1) for child in transform.children)
+
+    @property
+    def version(self) -> int:
+        """Return a number that changes whenever this transform changes.
+
+        See `TransformArray.version`.
+        """
+        return self.ARRAY.version(self.slot)
+
     def __eq__(self, other: object) -> bool:
         """Return true if other is an equivalent Transform.
 
@@ -197,19 +846,17 @@ class Transform(Component):  # pylint: disable=unused-argument
         Args:
             angles: A vector representing the yaw, pitch, and roll.
         """
-        # TODO (@bveeramani): Use quaternions instead of euler angles.
-        self.rotation += angles
-        self.rotation %= 360
+        self.ARRAY.rotate(self.slot, tuple(angles))
 
     def __repr__(self):
         """Represent the Transform as a string."""
         string = "Transform("
         if self.position != Vector(0, 0, 0):
-            string += f"position={self.position}, "
+            string += f"position={_compact(self.position)}, "
         if self.rotation != Vector(0, 0, 0):
-            string += f"rotation={self.rotation}, "
+            string += f"rotation={_compact(self.rotation)}, "
         if self.scale != Vector(1, 1, 1):
-            string += f"scale={self.scale}, "
+            string += f"scale={_compact(self.scale)}, "
 
         # Remove trailing ', '
         if ", " in string:
@@ -217,3 +864,58 @@ class Transform(Component):  # pylint: disable=unused-argument
 
         string += ")"
         return string
+
+
+def _compact(vector: Vector) -> Vector:
+    """Return a vector with whole-number components converted to ints.
+
+    Transforms store floats, so this keeps `Transform.__repr__` as short as the
+    vectors the transform was created with.
+    """
+    values = (
+        int(value) if float(value).is_integer() else value for value in vector)
+    return Vector(*values)
+
+
+def _quaternions(angles: np.ndarray) -> np.ndarray:
+    """Convert euler angles in degrees to quaternions.
+
+    The quaternions rotate around the x, y, and z axes in that order, like the
+    matrices computed by `TransformArray.model_matrices`.
+
+    Args:
+        angles: An array of euler angles whose last axis has length 3.
+
+    Returns:
+        An array of quaternions whose last axis has length 4 and contains the
+        w, x, y, and z components.
+    """
+    half = np.radians(angles) / 2
+    cos_x, cos_y, cos_z = np.moveaxis(np.cos(half), -1, 0)
+    sin_x, sin_y, sin_z = np.moveaxis(np.sin(half), -1, 0)
+    components = [
+        cos_x * cos_y * cos_z - sin_x * sin_y * sin_z,
+        sin_x * cos_y * cos_z + cos_x * sin_y * sin_z,
+        cos_x * sin_y * cos_z - sin_x * cos_y * sin_z,
+        cos_x * cos_y * sin_z + sin_x * sin_y * cos_z,
+    ]
+    return np.stack(components, axis=-1)
+
+
+def _euler_angles(quaternions: np.ndarray) -> np.ndarray:
+    """Convert unit quaternions to euler angles in degrees.
+
+    This is the inverse of `_quaternions`. The angles are in [0, 360). If the
+    rotation around the y axis is 90 degrees, then the rotations around the x
+    and z axes can't be told apart, so the rotation around the z axis is 0.
+    """
+    w, x, y, z = np.moveaxis(quaternions, -1, 0)
+    sin_y = np.clip(2 * (x * z + w * y), -1, 1)
+    locked = np.isclose(np.abs(sin_y), 1)
+    angle_x = np.where(locked,
+                       np.arctan2(2 * (y * z + w * x), 1 - 2 * (x * x + z * z)),
+                       np.arctan2(2 * (w * x - y * z), 1 - 2 * (x * x + y * y)))
+    angle_z = np.where(locked, 0,
+                       np.arctan2(2 * (w * z - x * y), 1 - 2 * (y * y + z * z)))
+    angles = np.stack([angle_x, np.arcsin(sin_y), angle_z], axis=-1)
+    return np.mod(np.degrees(angles), 360)
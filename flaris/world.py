@@ -0,0 +1,509 @@
+"""Implements the `World` and `Archetype` classes."""
+from __future__ import annotations
+
+import contextlib
+from typing import (Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple,
+                    TYPE_CHECKING, Union)
+
+import numpy as np
+
+from .batch import Batch
+from .commands import ATTACH, DESPAWN, DETACH, SPAWN, Command, CommandBuffer
+from .component import ComponentError, component_keys, component_mask
+from .fields import ArrayComponent, gather
+
+if TYPE_CHECKING:
+    from .component import Component
+    from .entity import Entity
+    from .system import System, SequentialSystem
+
+__all__ = ["Archetype", "World"]
+
+_INDEX_BITS = 32
+_INDEX_MASK = (1 << _INDEX_BITS) - 1
+
+
+class Archetype:
+    """A table of entities that possess the same set of component types.
+
+    Components are stored by type in columns. The i-th component in each column
+    is attached to the i-th entity in `Archetype.entities`. Columns are also
+    kept for the base classes of each component type, so that `columns[Light]`
+    contains the same components as `entity[Light]`.
+
+    The rows that store the array-backed fields of each column are computed
+    when needed and cached until the table changes.
+
+    Attributes:
+        signature: A frozenset of the component types stored in this archetype.
+        mask: A bitmask representing the signature and its base classes.
+        entities: A list of the entities stored in this archetype.
+        columns: A dictionary that maps component types to lists of components.
+        subtypes: A dictionary that maps each key of `columns` to the types in
+            the signature that are subclasses of the key.
+        systems: A list of the registered systems that act on the entities
+            stored in this archetype.
+    """
+
+    def __init__(self, signature: FrozenSet[type]):
+        """Initialize an empty archetype.
+
+        Args:
+            signature: The component types stored in this archetype.
+        """
+        self.signature = signature
+        self.subtypes = {}
+        for component_type in signature:
+            for key in component_keys(component_type):
+                self.subtypes.setdefault(key, []).append(component_type)
+        self.mask = component_mask(*self.subtypes)
+        self.entities = []
+        self.columns = {key: [] for key in self.subtypes}
+        self.systems = []
+        self._slots = {}
+
+    def __len__(self) -> int:
+        """Return the number of entities stored in this archetype."""
+        return len(self.entities)
+
+    def append(self, entity: Entity) -> int:
+        """Append an entity and its components to the end of the table.
+
+        Args:
+            entity: An entity whose component types match the signature.
+
+        Returns:
+            The row that the entity was stored in.
+        """
+        self.entities.append(entity)
+        for key, column in self.columns.items():
+            column.append(entity[key])
+        self._slots.clear()
+        return len(self.entities) - 1
+
+    def pop(self, row: int) -> Optional[Entity]:
+        """Remove the entity stored in a row.
+
+        The last entity in the table is moved into the vacated row so that the
+        columns stay contiguous.
+
+        Args:
+            row: The row to remove.
+
+        Returns:
+            The entity that now occupies the row, or None if the removed entity
+            was stored in the last row.
+        """
+        last = len(self.entities) - 1
+        for column in (self.entities, *self.columns.values()):
+            column[row] = column[last]
+            column.pop()
+        self._slots.clear()
+        return self.entities[row] if row != last else None
+
+    def slots(self, key: type) -> np.ndarray:
+        """Return the rows that store the fields of each component in a column.
+
+        Args:
+            key: A subclass of `ArrayComponent` that is a key of `columns`.
+
+        Returns:
+            An array containing the `ArrayComponent.slot` of each component in
+            `columns[key]`.
+
+        Raises:
+            ComponentError: if the column contains components whose fields are
+                stored in a different array than the fields of `key`.
+        """
+        if key not in self._slots:
+            for subtype in self.subtypes[key]:
+                if subtype.ARRAY is not key.ARRAY:
+                    raise ComponentError(
+                        f"{subtype} declares its own fields, so it can't be "
+                        f"batched as {key}.")
+            self._slots[key] = gather(self.columns[key])
+        return self._slots[key]
+
+
+class World:
+    """Storage for the entities in a game.
+
+    Entities are grouped into archetypes by the types of their components, so
+    systems can iterate over aligned component columns instead of looking up
+    each component on each entity.
+
+    The world also keeps registered systems up to date. When an entity is
+    added, removed, or gains or loses a component, it joins or leaves each
+    system according to the system's `REQUIRED_COMPONENTS`.
+
+    Inside `World.deferred`, these structural changes are recorded in
+    `World.commands` instead of being applied, so that systems can add and
+    remove entities while other systems are iterating over them.
+
+    Each stored entity is assigned a generational handle: an int that combines
+    a reusable slot index with a count of how many times the slot has been
+    reused. Handles can be kept instead of references to entities, and
+    `World.resolve` returns None once the entity has been removed, even if its
+    slot has since been given to another entity.
+
+    Attributes:
+        commands: A `CommandBuffer` of structural changes that are applied the
+            next time the world is flushed.
+        alpha: How far, as a fraction of a fixed timestep, the current frame is
+            past the last simulation step. Renderers can use it to interpolate
+            between simulation states; it's 1.0 if the simulation isn't stepped
+            with a fixed timestep.
+
+    Example:
+        >>> from flaris import Entity, Transform, Vector
+        >>> class Player(Entity):
+        ...     def __init__(self):
+        ...         super().__init__()
+        ...         self.transform = Transform()
+        >>> world = World()
+        >>> world.add(Player())
+        >>> for (transform,) in world.query(Transform):
+        ...     transform.translate(Vector(0, 1, 0))
+    """
+
+    def __init__(self):
+        """Initialize an empty world."""
+        self._archetypes: Dict[FrozenSet[type], Archetype] = {}
+        self._locations: Dict[Entity, Tuple[Archetype, int]] = {}
+        self._queries: Dict[Tuple[type, ...], List[Archetype]] = {}
+        self._transitions: Dict[Tuple[Archetype, Archetype],
+                                Tuple[List[System], List[System]]] = {}
+        self._systems: List[System] = []
+        self._deferring = False
+        self._moved: Dict[Entity, None] = {}
+        self._slots: List[Optional[Entity]] = []
+        self._generations: List[int] = []
+        self._free: List[int] = []
+        self._batches: Dict[Tuple[type, ...], Batch] = {}
+        self.commands = CommandBuffer()
+        self.alpha = 1.0
+
+    def __contains__(self, entity: Entity) -> bool:
+        """Return true if the entity is stored in this world."""
+        return entity in self._locations
+
+    def __len__(self) -> int:
+        """Return the number of entities stored in this world."""
+        return len(self._locations)
+
+    def register(self, system: Union[System, SequentialSystem]) -> None:
+        """Give a system, and any systems it contains, access to this world.
+
+        Entities already stored in the world are added to each registered
+        system that accepts them.
+
+        Args:
+            system: The system to register.
+        """
+        system.world = self
+        if hasattr(system, "systems"):
+            for child in system.systems:
+                self.register(child)
+            return
+
+        self._systems.append(system)
+        self._transitions.clear()
+        for archetype in self._archetypes.values():
+            if archetype.mask & system.mask == system.mask:
+                archetype.systems.append(system)
+                for entity in archetype.entities:
+                    system.add(entity)
+
+    def add(self, entity: Entity) -> None:
+        """Store an entity in this world.
+
+        If the world is deferring structural changes, the entity is stored
+        when the world is next flushed.
+
+        Args:
+            entity: The entity to store.
+
+        Raises:
+            ValueError: If the entity is already stored in a world.
+        """
+        if self._deferring:
+            self.commands.spawn(entity)
+        else:
+            self._spawn(entity)
+
+    def remove(self, entity: Entity) -> None:
+        """Remove an entity from this world.
+
+        If the world is deferring structural changes, the entity is removed
+        when the world is next flushed.
+
+        Raises:
+            ValueError: If the entity is not stored in this world.
+        """
+        if self._deferring:
+            self.commands.despawn(entity)
+        else:
+            self._despawn(entity)
+
+    def update(self, entity: Entity) -> None:
+        """Move an entity to the archetype that matches its components.
+
+        `Entity` calls this method whenever a component is attached or removed.
+        If the world is deferring structural changes, the entity is moved when
+        the world is next flushed, and only once no matter how many of its
+        components changed.
+
+        Args:
+            entity: An entity stored in this world.
+        """
+        if self._deferring:
+            self._moved[entity] = None
+            return
+
+        source = self._delete(entity)
+        destination = self._insert(entity)
+
+        transition = source, destination
+        if transition not in self._transitions:
+            exited = [s for s in source.systems if s not in destination.systems]
+            entered = [
+                s for s in destination.systems if s not in source.systems
+            ]
+            self._transitions[transition] = exited, entered
+        exited, entered = self._transitions[transition]
+
+        for system in exited:
+            system.remove(entity)
+        for system in entered:
+            system.add(entity)
+
+    def resolve(self, handle: int) -> Optional[Entity]:
+        """Return the entity with the given handle.
+
+        Args:
+            handle: The value of `Entity.handle` for an entity stored in this
+                world.
+
+        Returns:
+            The entity, or None if the entity has been removed from the world.
+        """
+        index, generation = handle & _INDEX_MASK, handle >> _INDEX_BITS
+        if index < len(self._slots) and self._generations[index] == generation:
+            return self._slots[index]
+        return None
+
+    @contextlib.contextmanager
+    def deferred(self) -> Iterator[None]:
+        """Defer structural changes until the end of the block.
+
+        Example:
+            >>> from flaris import Entity
+            >>> world = World()
+            >>> with world.deferred():
+            ...     world.add(Entity())
+            ...     len(world)
+            0
+            >>> len(world)
+            1
+        """
+        if self._deferring:
+            yield
+            return
+
+        self._deferring = True
+        try:
+            yield
+        finally:
+            self._deferring = False
+            self.flush()
+
+    def flush(self) -> None:
+        """Apply every structural change that has been deferred.
+
+        The commands in `World.commands` are applied in the order they were
+        recorded. Entities whose components changed are then moved to their new
+        archetypes in a single pass.
+        """
+        deferring, self._deferring = self._deferring, True
+        try:
+            while self.commands:
+                self._apply(self.commands.drain())
+        finally:
+            self._deferring = False
+            moved, self._moved = self._moved, {}
+            for entity in moved:
+                if entity.world is self:
+                    self.update(entity)
+            self._deferring = deferring
+
+    def query(self, *component_types: type) -> Iterator[Tuple[Component, ...]]:
+        """Iterate over the components of entities that have the given types.
+
+        Args:
+            component_types: The component types to retrieve.
+
+        Yields:
+            For each entity that possesses a component of every given type, a
+            tuple containing those components in the order the types were given.
+        """
+        for archetype in self._match(component_types):
+            yield from zip(*(archetype.columns[component_type]
+                             for component_type in component_types))
+
+    def columns(self, *component_types: type) -> Iterator[Tuple[List, ...]]:
+        """Iterate over the component columns of matching archetypes.
+
+        Args:
+            component_types: The component types to retrieve.
+
+        Yields:
+            For each non-empty archetype whose signature contains every given
+            type, a tuple containing the column for each type. The columns are
+            views into the world's storage and must not be modified.
+        """
+        for archetype in self._match(component_types):
+            if archetype:
+                yield tuple(archetype.columns[component_type]
+                            for component_type in component_types)
+
+    def components(self, component_type: type) -> Iterator[Component]:
+        """Iterate over every stored component of the given type.
+
+        Unlike `World.query`, this includes every matching component of an
+        entity, rather than only the one returned by `entity[component_type]`.
+
+        Args:
+            component_type: A component type. Components of subclasses of this
+                type are included.
+
+        Yields:
+            Each component of the given type.
+        """
+        for archetype in self._match((component_type,)):
+            for subtype in archetype.subtypes[component_type]:
+                yield from archetype.columns[subtype]
+
+    def batch(self, *component_types: type) -> Batch:
+        """Return the array-backed fields of entities that have the given types.
+
+        Systems can use the returned `Batch` to update a field of every
+        matching entity with one NumPy operation. Batches are cached until
+        the world's entities or their components change.
+
+        Args:
+            component_types: The component types that entities in the batch
+                must have. The fields of each type that subclasses
+                `ArrayComponent` are available from the batch.
+
+        Returns:
+            A `Batch` containing every entity that possesses a component of
+            each given type.
+        """
+        if component_types not in self._batches:
+            archetypes = [
+                archetype for archetype in self._match(component_types)
+                if archetype
+            ]
+            slots = {}
+            for component_type in component_types:
+                if not issubclass(component_type, ArrayComponent):
+                    continue
+                rows = [
+                    archetype.slots(component_type) for archetype in archetypes
+                ]
+                slots[component_type] = (np.concatenate(rows) if rows else
+                                         np.empty(0, dtype=np.intp))
+            self._batches[component_types] = Batch(archetypes, slots)
+        return self._batches[component_types]
+
+    @property
+    def entities(self) -> Iterable[Entity]:
+        """Return an iterator over the entities stored in this world."""
+        return iter(self._locations)
+
+    def _apply(self, commands: Iterable[Command]) -> None:
+        """Apply a sequence of recorded commands."""
+        for operation, entity, name, component in commands:
+            if operation == SPAWN:
+                self._spawn(entity)
+            elif operation == DESPAWN:
+                self._despawn(entity)
+            elif operation == ATTACH:
+                setattr(entity, name, component)
+            elif operation == DETACH:
+                delattr(entity, name)
+
+    def _spawn(self, entity: Entity) -> None:
+        """Store an entity and add it to the systems that accept it."""
+        if entity.world is not None:
+            raise ValueError(f"Entity {entity} is already part of a world.")
+        archetype = self._insert(entity)
+        entity.world = self
+
+        if self._free:
+            index = self._free.pop()
+        else:
+            index = len(self._slots)
+            self._slots.append(None)
+            self._generations.append(0)
+        self._slots[index] = entity
+        entity.handle = self._generations[index] << _INDEX_BITS | index
+
+        for system in archetype.systems:
+            system.add(entity)
+
+    def _despawn(self, entity: Entity) -> None:
+        """Remove an entity from storage and from the systems it belongs to."""
+        if entity not in self._locations:
+            raise ValueError(f"Entity {entity} is not part of this world.")
+        archetype = self._delete(entity)
+        entity.world = None
+        self._moved.pop(entity, None)
+
+        index = entity.handle & _INDEX_MASK
+        self._slots[index] = None
+        self._generations[index] += 1
+        self._free.append(index)
+        entity.handle = None
+        for system in archetype.systems:
+            system.remove(entity)
+
+    def _insert(self, entity: Entity) -> Archetype:
+        """Append an entity to the archetype that matches its components."""
+        signature = frozenset(
+            type(component) for component in entity.components)
+        if signature not in self._archetypes:
+            self._archetypes[signature] = self._create(signature)
+        archetype = self._archetypes[signature]
+        self._locations[entity] = archetype, archetype.append(entity)
+        self._batches.clear()
+        return archetype
+
+    def _delete(self, entity: Entity) -> Archetype:
+        """Remove an entity from its archetype."""
+        archetype, row = self._locations.pop(entity)
+        moved = archetype.pop(row)
+        self._batches.clear()
+        if moved is not None:
+            self._locations[moved] = archetype, row
+        return archetype
+
+    def _create(self, signature: FrozenSet[type]) -> Archetype:
+        """Construct an archetype and find the systems that act on it."""
+        archetype = Archetype(signature)
+        archetype.systems = [
+            system for system in self._systems
+            if archetype.mask & system.mask == system.mask
+        ]
+        self._queries.clear()
+        return archetype
+
+    def _match(self, component_types: Tuple[type, ...]) -> List[Archetype]:
+        """Return the archetypes that store every given component type."""
+        if component_types not in self._queries:
+            mask = component_mask(*component_types)
+            self._queries[component_types] = [
+                archetype for archetype in self._archetypes.values()
+                if archetype.mask & mask == mask
+            ]
+        return self._queries[component_types]
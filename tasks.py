@@ -103,6 +103,18 @@ def test(c, quick=True):  # pylint: disable=unused-argument
     c.run("pytest -q test")
 
 
+################################## BENCHMARK ###################################
+
+
+@task
+def benchmark(c, output=None, modules=""):
+    """Run performance benchmarks and optionally save the results as JSON."""
+    command = f"python -m test.benchmark {modules}"
+    if output:
+        command += f" --output {output}"
+    c.run(command)
+
+
 ################################################################################
 
 
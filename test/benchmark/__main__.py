@@ -0,0 +1,46 @@
+"""Runs every benchmark and optionally saves the results as JSON.
+
+Run this package from the root of the repository:
+
+    python -m test.benchmark --output results.json
+
+Pass benchmark module names to run a subset, e.g. `python -m test.benchmark
+bench_ecs`. The rendering benchmarks run last because they choose the platform
+PyOpenGL uses when it's first imported.
+"""
+import argparse
+import importlib
+import json
+
+from .harness import environment
+
+MODULES = ("bench_ecs", "bench_transform", "bench_entity", "bench_spatial",
+           "bench_physics", "bench_rendering")
+
+
+def main() -> None:
+    """Run the benchmarks named on the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules",
+                        nargs="*",
+                        default=MODULES,
+                        help="the benchmark modules to run (default: all)")
+    parser.add_argument("--output", help="a path to save the results to")
+    arguments = parser.parse_args()
+    for name in set(arguments.modules) - set(MODULES):
+        parser.error(f"unknown benchmark module '{name}'")
+
+    results = {"environment": environment(), "benchmarks": {}}
+    for name in MODULES:
+        if name in arguments.modules:
+            print(f"{name}:")
+            module = importlib.import_module(f"{__package__}.{name}")
+            results["benchmarks"][name] = module.main()
+
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
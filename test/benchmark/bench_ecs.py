@@ -0,0 +1,127 @@
+"""Benchmarks for creating entities and stepping systems.
+
+Run this module from the root of the repository:
+
+    python -m test.benchmark.bench_ecs
+"""
+from flaris import (ArrayComponent, BatchSystem, Direction, Entity, Field,
+                    SequentialSystem, System, Transform, UpdateSystem, World)
+
+from .harness import measure, report
+
+ENTITY_COUNTS = (1000, 10000, 100000)
+
+
+class Mover(Entity):
+    """An entity that moves right every update."""
+
+    def __init__(self):
+        """Attach a transform."""
+        super().__init__()
+        self.transform = Transform()
+
+    def update(self, delta: float) -> None:
+        """Move right."""
+        self.transform.translate(Direction.RIGHT * delta)
+
+
+class Position(ArrayComponent):
+    """An array-backed position."""
+
+    value = Field(3)
+
+
+class Velocity(ArrayComponent):
+    """An array-backed velocity."""
+
+    value = Field(3, default=(1, 0, 0))
+
+
+class Particle(Entity):
+    """An entity with an array-backed position and velocity."""
+
+    def __init__(self):
+        """Attach a position and velocity."""
+        super().__init__()
+        self.position = Position()
+        self.velocity = Velocity()
+
+
+class MovementSystem(BatchSystem):
+    """A system that integrates velocities in one array operation."""
+
+    REQUIRED_COMPONENTS = (Position, Velocity)
+
+    def update(self, batch, delta: float) -> None:
+        """Move each particle."""
+        batch[Position].value += batch[Velocity].value * delta
+
+
+class TransformSystem(System):
+    """A system that requires a transform and does nothing."""
+
+    REQUIRED_COMPONENTS = (Transform,)
+
+    def step(self, delta: float) -> None:
+        """Do nothing."""
+
+
+def create_entities(count: int) -> list:
+    """Create entities with a transform."""
+    return [Mover() for _ in range(count)]
+
+
+def add_entities(entities: list) -> None:
+    """Add entities to a new sequential system of four systems."""
+    system = SequentialSystem([TransformSystem() for _ in range(4)])
+    for entity in entities:
+        system.add(entity)
+
+
+def add_to_world(entities: list) -> None:
+    """Add entities to a new world with an update system, then remove them."""
+    world = World()
+    world.register(SequentialSystem([UpdateSystem(), TransformSystem()]))
+    for entity in entities:
+        world.add(entity)
+    for entity in entities:
+        world.remove(entity)
+
+
+def main() -> list:
+    """Run every benchmark and print the results."""
+    entities = create_entities(10000)
+    results = [
+        measure("create-entities-10k", lambda: create_entities(10000), 10000),
+        measure("sequential-system-add-10k", lambda: add_entities(entities),
+                10000),
+        measure("world-add-remove-10k", lambda: add_to_world(entities), 10000),
+    ]
+
+    for count in ENTITY_COUNTS:
+        system = UpdateSystem()
+        world = World()
+        world.register(system)
+        for entity in create_entities(count):
+            world.add(entity)
+        results.append(
+            measure(f"update-system-step-{count // 1000}k",
+                    lambda system=system: system.step(1 / 60),
+                    count))
+
+        system = MovementSystem()
+        world = World()
+        world.register(system)
+        for _ in range(count):
+            world.add(Particle())
+        results.append(
+            measure(f"batch-system-step-{count // 1000}k",
+                    lambda system=system: system.step(1 / 60),
+                    count))
+
+    report(results)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Benchmarks for spawning and despawning short-lived entities.
+
+Run this module from the root of the repository:
+
+    python -m test.benchmark.bench_entity
+
+Each benchmark adds a batch of bullets to a world, removes them, and repeats.
+Allocation pressure is reported as the number of generation 0 garbage
+collections triggered and the peak memory traced by `tracemalloc`.
+"""
+import gc
+import timeit
+import tracemalloc
+
+from typing import Optional
+
+from flaris import Entity, EntityPool, Transform, Vector, World
+
+BATCH_SIZE = 1000
+REPEATS = 20
+
+
+class Bullet(Entity):
+    """An entity that declares `__slots__` for its components."""
+
+    __slots__ = ("transform",)
+
+    def __init__(self, transform: Optional[Transform] = None):
+        """Attach a transform, or a new transform at the origin if None."""
+        super().__init__()
+        self.transform = Transform() if transform is None else transform
+
+    def reinitialize(self, *args, **kwargs) -> None:
+        """Reuse the bullet's transform, moved back to the origin."""
+        transform = self.transform
+        transform.position = Vector(0, 0, 0)
+        super().reinitialize(transform)
+
+
+class DictBullet(Entity):
+    """An entity that stores its components in an instance dictionary."""
+
+    def __init__(self, transform: Transform):
+        """Attach a transform."""
+        super().__init__()
+        self.transform = transform
+
+
+def churn(world: World, spawn, despawn) -> None:
+    """Spawn and despawn `BATCH_SIZE` entities `REPEATS` times."""
+    for _ in range(REPEATS):
+        bullets = [spawn() for _ in range(BATCH_SIZE)]
+        for bullet in bullets:
+            world.add(bullet)
+        for bullet in bullets:
+            despawn(bullet)
+
+
+def measure(name: str, spawn, despawn) -> dict:
+    """Run `churn` and report throughput and allocation pressure."""
+    world = World()
+    churn(world, spawn, despawn)  # Warm up pools and caches.
+
+    collections = gc.get_stats()[0]["collections"]
+    tracemalloc.start()
+    churn(world, spawn, despawn)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    collections = gc.get_stats()[0]["collections"] - collections
+
+    seconds = min(
+        timeit.repeat(lambda: churn(world, spawn, despawn), number=1, repeat=5))
+    return {
+        "name": name,
+        "entities_per_second": REPEATS * BATCH_SIZE / seconds,
+        "gen0_collections": collections,
+        "peak_kib": peak / 1024,
+    }
+
+
+def main() -> list:
+    """Run every benchmark and print the results."""
+    pool = EntityPool(Bullet)
+    results = [
+        measure("dict-entity", lambda: DictBullet(Transform()),
+                lambda bullet: bullet.world.remove(bullet)),
+        measure("slots-entity", Bullet,
+                lambda bullet: bullet.world.remove(bullet)),
+        measure("pooled-slots-entity", pool.acquire, pool.release),
+    ]
+    for result in results:
+        print(f"{result['name']:>20}: "
+              f"{result['entities_per_second']:>10.0f} entities/s, "
+              f"{result['gen0_collections']:>4} gen0 collections, "
+              f"{result['peak_kib']:>8.1f} KiB peak")
+    return results
+
+
+if __name__ == "__main__":
+    main()
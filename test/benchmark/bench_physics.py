@@ -0,0 +1,55 @@
+"""Benchmarks for the physics system.
+
+Run this module from the root of the repository:
+
+    python -m test.benchmark.bench_physics
+"""
+import numpy as np
+
+from flaris import (BoxCollider, Entity, PhysicsSystem, RigidBody,
+                    SphereCollider, Transform, Vector, World)
+
+from .harness import measure, report
+
+BODIES = 5000
+
+
+class Body(Entity):
+    """An entity with a transform, a collider, and optionally a body."""
+
+    def __init__(self, position, collider, body=None):
+        """Attach the components."""
+        super().__init__()
+        self.transform = Transform(position)
+        self.collider = collider
+        if body is not None:
+            self.body = body
+
+
+def scene(bodies: int) -> PhysicsSystem:
+    """Return a physics system with balls falling into a walled pit."""
+    random = np.random.default_rng(0)
+    world = World()
+    system = PhysicsSystem(timestep=None)
+    world.register(system)
+    size = bodies**(1 / 3) * 2
+    world.add(Body(Vector(0, -1, 0), BoxCollider(Vector(size, 2, size))))
+    for position in random.uniform(-size / 2, size / 2, (bodies, 3)):
+        world.add(
+            Body(Vector(*position), SphereCollider(0.4),
+                 RigidBody(restitution=0.2)))
+    return system
+
+
+def main() -> list:
+    """Run every benchmark and print the results."""
+    system = scene(BODIES)
+    results = [
+        measure("physics-step", lambda: system.step(1 / 60), BODIES),
+    ]
+    report(results)
+    return results
+
+
+if __name__ == "__main__":
+    main()
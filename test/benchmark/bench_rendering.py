@@ -0,0 +1,206 @@
+"""Benchmarks for the mesh, sprite, and text renderers.
+
+Run this module from the root of the repository:
+
+    python -m test.benchmark.bench_rendering
+
+The renderers draw into an offscreen context created by Mesa's software
+renderer, so results don't depend on a display or a GPU driver. If a context
+can't be created, the benchmarks are skipped.
+"""
+import os
+import tempfile
+
+from PIL import Image
+
+from flaris import Transform, Vector, World
+
+from . import offscreen
+from .harness import measure, report
+
+WIDTH = 640
+HEIGHT = 480
+DRAWS = 500
+TEXT = "The quick brown fox jumps over the lazy dog"
+
+
+def draw(renderer, drawables: list) -> None:
+    """Draw each drawable and wait for OpenGL to finish."""
+    import OpenGL.GL as gl  # pylint: disable=import-outside-toplevel
+    gl.glClear(gl.GL_COLOR_BUFFER_BIT | gl.GL_DEPTH_BUFFER_BIT)
+    for arguments in drawables:
+        renderer.draw(*arguments)
+    gl.glFinish()
+
+
+def step(system) -> None:
+    """Step a rendering system, draw what it queued, and wait for OpenGL."""
+    # pylint: disable=import-outside-toplevel
+    import OpenGL.GL as gl
+    from flaris.rendering import RENDER_QUEUE
+    gl.glClear(gl.GL_COLOR_BUFFER_BIT | gl.GL_DEPTH_BUFFER_BIT)
+    system.step(0)
+    RENDER_QUEUE.flush()
+    gl.glFinish()
+
+
+def meshes(texture, left: float = -10) -> list:
+    """Return textured cubes in rows of 20, starting from the given x."""
+    # pylint: disable=import-outside-toplevel
+    from flaris.rendering import Material, Mesh
+
+    from ..unit.flaris.rendering.conftest import Prop
+
+    return [
+        Prop(mesh=Mesh("cube"),
+             material=Material(),
+             texture=texture,
+             transform=Transform(Vector(i % 20 + left, i // 20 - 10, 0)))
+        for i in range(DRAWS)
+    ]
+
+
+def mesh_system(texture, lights: int, lights_per_pass: int, culled: bool):
+    """Return a mesh rendering system for a grid of cubes.
+
+    Args:
+        texture: The texture of the cubes.
+        lights: The number of lights in the scene.
+        lights_per_pass: The number of lights shaded in each pass.
+        culled: Whether to add as many cubes again far outside of the view.
+    """
+    # pylint: disable=import-outside-toplevel
+    from flaris.rendering import DirectionalLight, OrthographicCamera
+    from flaris.rendering.systems import MeshRenderingSystem
+
+    from ..unit.flaris.rendering.conftest import Prop
+
+    world = World()
+    system = MeshRenderingSystem(lights_per_pass=lights_per_pass)
+    world.register(system)
+    world.add(
+        Prop(camera=OrthographicCamera(), transform=Transform(Vector(0, 0,
+                                                                     10))))
+    for i in range(lights):
+        world.add(
+            Prop(light=DirectionalLight(intensity=1 / lights),
+                 transform=Transform(rotation=Vector(10 * i, 0, 0))))
+    for entity in meshes(texture) + (meshes(texture, 1000) if culled else []):
+        world.add(entity)
+    system.start()
+    return system
+
+
+def mesh_draws(texture) -> tuple:
+    """Return a lit mesh renderer and the arguments of each of its draws."""
+    # pylint: disable=import-outside-toplevel
+    from flaris.rendering import (DirectionalLight, Mesh, MeshRenderer,
+                                  OrthographicCamera)
+
+    from ..unit.flaris.rendering.conftest import Prop
+
+    camera = Prop(camera=OrthographicCamera(),
+                  transform=Transform(Vector(0, 0, 10)))
+    light = Prop(light=DirectionalLight(), transform=Transform())
+    renderer = MeshRenderer(camera[OrthographicCamera])
+    renderer.set_lights([light[DirectionalLight]])
+    return renderer, [(mesh[Mesh], mesh[Transform]) for mesh in meshes(texture)]
+
+
+def sprites(texture) -> list:
+    """Return sprites spread over the screen."""
+    # pylint: disable=import-outside-toplevel
+    from flaris.rendering import Sprite
+
+    from ..unit.flaris.rendering.conftest import Prop
+
+    return [
+        Prop(sprite=Sprite(texture),
+             transform=Transform(Vector(i % WIDTH, i % HEIGHT, 0)))
+        for i in range(DRAWS)
+    ]
+
+
+def sprite_system(texture):
+    """Return a sprite rendering system for a scene of sprites."""
+    # pylint: disable=import-outside-toplevel
+    from flaris.rendering.systems import SpriteRenderingSystem
+
+    world = World()
+    system = SpriteRenderingSystem()
+    world.register(system)
+    for sprite in sprites(texture):
+        world.add(sprite)
+    system.start()
+    return system
+
+
+def sprite_draws(texture) -> tuple:
+    """Return a sprite renderer and the arguments of each of its draws."""
+    # pylint: disable=import-outside-toplevel
+    from flaris.rendering import Sprite, SpriteRenderer
+
+    return SpriteRenderer(), [
+        (sprite[Sprite], sprite[Transform]) for sprite in sprites(texture)
+    ]
+
+
+def text_draws() -> tuple:
+    """Return a text renderer and the arguments of its one draw."""
+    # pylint: disable=import-outside-toplevel
+    from flaris.rendering import Text, TextRenderer
+
+    from ..unit.flaris.rendering.conftest import Prop
+
+    text = Prop(text=Text(TEXT), transform=Transform(Vector(0, HEIGHT / 2, 0)))
+    return TextRenderer(), [(text[Text], text[Transform])]
+
+
+def main() -> list:
+    """Run every benchmark and print the results."""
+    try:
+        renderer_name = offscreen.create_context(WIDTH, HEIGHT)
+    except RuntimeError as error:
+        print(f"Skipping rendering benchmarks: {error}")
+        return []
+
+    # pylint: disable=import-outside-toplevel
+    from flaris.rendering import Texture
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "texture.png")
+        Image.new("RGBA", (32, 32), (255, 128, 0, 255)).save(path)
+        texture = Texture(path)
+
+        # Half of the meshes are far outside of the camera's view.
+        culled = mesh_system(texture, 1, 1, culled=True)
+        # Four lights drawn in one pass, and in one pass per light.
+        single_pass = mesh_system(texture, 4, 4, culled=False)
+        multipass = mesh_system(texture, 4, 1, culled=False)
+        batched = sprite_system(texture)
+        mesh_renderer = mesh_draws(texture)
+        sprite_renderer = sprite_draws(texture)
+        text_renderer = text_draws()
+        results = [
+            measure("mesh-renderer-draw", lambda: draw(*mesh_renderer), DRAWS),
+            measure("mesh-system-step-half-culled", lambda: step(culled),
+                    2 * DRAWS),
+            measure("mesh-system-step-4-lights-single-pass",
+                    lambda: step(single_pass), DRAWS),
+            measure("mesh-system-step-4-lights-multipass",
+                    lambda: step(multipass), DRAWS),
+            measure("sprite-renderer-draw", lambda: draw(*sprite_renderer),
+                    DRAWS),
+            measure("sprite-system-step", lambda: step(batched), DRAWS),
+            measure("text-renderer-draw", lambda: draw(*text_renderer),
+                    len(TEXT)),
+        ]
+
+    for result in results:
+        result["renderer"] = renderer_name
+    report(results)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Benchmarks for spatial indexes.
+
+Run this module from the root of the repository:
+
+    python -m test.benchmark.bench_spatial
+"""
+import numpy as np
+
+from flaris import BVH, Entity, HashGrid, SpatialIndex
+
+from .harness import measure, report
+
+ENTITIES = 10000
+QUERIES = 1000
+SIZE = 1000.0
+
+
+def populate(index: SpatialIndex, positions: np.ndarray) -> SpatialIndex:
+    """Insert an entity at each position."""
+    for position in positions:
+        index.insert(Entity(), position, 1.0)
+    return index
+
+
+def within(index: SpatialIndex, centers: np.ndarray) -> None:
+    """Find the entities near each center."""
+    for center in centers:
+        index.within(center, 20)
+
+
+def within_brute_force(positions: np.ndarray, centers: np.ndarray) -> None:
+    """Find the entities near each center by testing every entity."""
+    for center in centers:
+        np.flatnonzero(np.linalg.norm(positions - center, axis=1) <= 21)
+
+
+def nearest(index: SpatialIndex, centers: np.ndarray) -> None:
+    """Find the 5 entities nearest to each center."""
+    for center in centers:
+        index.nearest(center, 5)
+
+
+def raycast(index: SpatialIndex, centers: np.ndarray) -> None:
+    """Cast a ray from each center."""
+    for center in centers:
+        index.raycast(center, (1, 0.5, 0.25), 100)
+
+
+def move(index: SpatialIndex, positions: np.ndarray) -> None:
+    """Move every entity a little, and then query the index once.
+
+    The query includes the time BVHs take to refit after entities move.
+    """
+    positions += 0.5
+    index.update(positions)
+    index.within(positions[0], 1)
+
+
+def main() -> list:
+    """Run every benchmark and print the results."""
+    random = np.random.default_rng(0)
+    positions = random.uniform(0, SIZE, (ENTITIES, 3))
+    centers = random.uniform(0, SIZE, (QUERIES, 3))
+    indexes = {
+        "grid": populate(HashGrid(cell_size=40), positions),
+        "bvh": populate(BVH(), positions),
+    }
+    results = [
+        measure("within-brute-force",
+                lambda: within_brute_force(positions, centers), QUERIES)
+    ]
+    for name, index in indexes.items():
+        results += [
+            measure(f"within-{name}",
+                    lambda i=index: within(i, centers),
+                    QUERIES),
+            measure(f"nearest-{name}",
+                    lambda i=index: nearest(i, centers),
+                    QUERIES),
+            measure(f"raycast-{name}",
+                    lambda i=index: raycast(i, centers),
+                    QUERIES),
+            measure(f"move-{name}",
+                    lambda i=index: move(i, positions.copy()),
+                    ENTITIES),
+        ]
+    report(results)
+    return results
+
+
+if __name__ == "__main__":
+    main()
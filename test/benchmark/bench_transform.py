@@ -0,0 +1,162 @@
+"""Benchmarks for vector and transform arithmetic.
+
+Run this module from the root of the repository:
+
+    python -m test.benchmark.bench_transform
+"""
+import glm
+import numpy as np
+
+from flaris import Transform, Vector, VectorArray
+from flaris.fields import gather
+
+from .harness import allocations, measure, report
+
+OPERATIONS = 100000
+MATRICES = 10000
+
+
+def create_vectors() -> None:
+    """Construct vectors."""
+    for i in range(OPERATIONS):
+        Vector(i, i, i)
+
+
+def unpack_vectors() -> None:
+    """Unpack the components of vectors."""
+    vector = Vector(1, 2, 3)
+    for _ in range(OPERATIONS):
+        x, y, z = vector  # pylint: disable=unused-variable
+
+
+def add_vectors() -> None:
+    """Add vectors."""
+    vector, step = Vector(0, 0, 0), Vector(1, 2, 3)
+    for _ in range(OPERATIONS):
+        vector = vector + step
+
+
+def scale_vectors() -> None:
+    """Multiply vectors by a scalar."""
+    vector = Vector(1, 2, 3)
+    for _ in range(OPERATIONS):
+        vector * 0.5  # pylint: disable=pointless-statement
+
+
+def add_vector_array(vectors: VectorArray) -> None:
+    """Add a vector to every vector in an array in place."""
+    vectors += Vector(1, 2, 3)
+
+
+def dot_vectors() -> None:
+    """Compute dot products."""
+    vector, other = Vector(1, 2, 3), Vector(4, 5, 6)
+    for _ in range(OPERATIONS):
+        vector @ other  # pylint: disable=pointless-statement
+
+
+def translate_transform() -> None:
+    """Translate a transform."""
+    transform, movement = Transform(), Vector(1, 0, 0)
+    for _ in range(OPERATIONS):
+        transform.translate(movement)
+
+
+def rotate_transform() -> None:
+    """Rotate a transform."""
+    transform, angles = Transform(), Vector(1, 2, 3)
+    for _ in range(OPERATIONS):
+        transform.rotate(angles)
+
+
+def glm_model_matrices(transforms: list) -> None:
+    """Compute model matrices one transform at a time with glm."""
+    for transform in transforms:
+        position, rotation = transform.position, transform.rotation
+        model = glm.translate(glm.mat4(1.0), glm.vec3(*position))
+        model = glm.rotate(model, glm.radians(rotation.x), glm.vec3(1, 0, 0))
+        model = glm.rotate(model, glm.radians(rotation.y), glm.vec3(0, 1, 0))
+        model = glm.rotate(model, glm.radians(rotation.z), glm.vec3(0, 0, 1))
+        glm.scale(model, glm.vec3(*transform.scale))
+
+
+def batched_model_matrices(rows: np.ndarray) -> None:
+    """Compute model matrices of moved transforms in a vectorized pass."""
+    Transform.ARRAY.modified("position", rows)
+    Transform.ARRAY.model_matrices(rows)
+
+
+def cached_model_matrices(rows: np.ndarray) -> None:
+    """Get the cached model matrices of static transforms."""
+    Transform.ARRAY.model_matrices(rows)
+
+
+def hierarchy(roots: int, children: int) -> list:
+    """Create trees of transforms three levels deep.
+
+    Args:
+        roots: The number of trees.
+        children: The number of children of each non-leaf transform.
+
+    Returns:
+        The roots of the trees.
+    """
+    trees = [Transform() for _ in range(roots)]
+    for root in trees:
+        for _ in range(children):
+            child = Transform(position=Vector(1, 0, 0))
+            child.parent = root
+            for _ in range(children):
+                leaf = Transform(position=Vector(0, 1, 0))
+                leaf.parent = child
+    return trees
+
+
+def propagate_world_matrices(moved: list) -> None:
+    """Move transforms and propagate world matrices to their descendants."""
+    for transform in moved:
+        transform.translate(Vector(1, 0, 0))
+    Transform.ARRAY.world_matrices()
+
+
+def main() -> list:
+    """Run every benchmark and print the results."""
+    transforms = [
+        Transform(Vector(i, 0, 0), Vector(0, i % 360, 0))
+        for i in range(MATRICES)
+    ]
+    rows = gather(transforms)
+    trees = hierarchy(100, 10)
+    nodes = len(trees) * (1 + 10 + 10 * 10)
+    vector, other = Vector(1, 2, 3), Vector(4, 5, 6)
+    vectors = VectorArray.zeros(OPERATIONS)
+    results = [
+        dict(measure("vector-create", create_vectors, OPERATIONS),
+             blocks_per_call=allocations(lambda: Vector(1, 2, 3))),
+        measure("vector-unpack", unpack_vectors, OPERATIONS),
+        dict(measure("vector-add", add_vectors, OPERATIONS),
+             blocks_per_call=allocations(lambda: vector + other)),
+        measure("vector-array-add", lambda: add_vector_array(vectors),
+                OPERATIONS),
+        dict(measure("vector-scale", scale_vectors, OPERATIONS),
+             blocks_per_call=allocations(lambda: vector * 0.5)),
+        measure("vector-dot", dot_vectors, OPERATIONS),
+        measure("transform-translate", translate_transform, OPERATIONS),
+        measure("transform-rotate", rotate_transform, OPERATIONS),
+        measure("model-matrices-glm", lambda: glm_model_matrices(transforms),
+                MATRICES),
+        measure("model-matrices-batched", lambda: batched_model_matrices(rows),
+                MATRICES),
+        measure("model-matrices-cached", lambda: cached_model_matrices(rows),
+                MATRICES),
+        measure("hierarchy-propagate-all",
+                lambda: propagate_world_matrices(trees), nodes),
+        measure("hierarchy-propagate-one",
+                lambda: propagate_world_matrices(trees[:1]), nodes),
+    ]
+    report(results)
+    return results
+
+
+if __name__ == "__main__":
+    main()
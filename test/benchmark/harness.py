@@ -0,0 +1,103 @@
+"""Helpers for timing benchmarks and describing the machine they ran on."""
+import gc
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+from typing import Callable
+
+REPEAT = 5
+
+
+def measure(name: str,
+            function: Callable[[], object],
+            items: int = 1,
+            number: int = 1) -> dict:
+    """Time a function and report how many items it processes per second.
+
+    The function is called once to warm up caches, and then `number` times in
+    each of `REPEAT` rounds. The fastest round is used for throughput because
+    it is the least disturbed by the rest of the system.
+
+    Args:
+        name: The name of the benchmark.
+        function: The function to time.
+        items: The number of items the function processes per call
+            (default: 1).
+        number: The number of calls per round (default: 1).
+
+    Returns:
+        A dictionary containing the name of the benchmark, the fastest and mean
+        time per call in seconds, and the number of items processed per second.
+    """
+    function()
+    rounds = [
+        seconds / number
+        for seconds in timeit.repeat(function, number=number, repeat=REPEAT)
+    ]
+    return {
+        "name": name,
+        "best_seconds": min(rounds),
+        "mean_seconds": statistics.mean(rounds),
+        "items_per_second": items / min(rounds),
+    }
+
+
+def allocations(function: Callable[[], object], number: int = 10000) -> float:
+    """Count the memory blocks that a function allocates for its result.
+
+    The result of every call is kept alive while counting, so the blocks of
+    the returned objects are counted, but temporary objects that are freed
+    before the function returns aren't.
+
+    Args:
+        function: The function to call.
+        number: The number of calls to average over (default: 10000).
+
+    Returns:
+        The mean number of blocks allocated per call.
+    """
+    results = [None] * number
+    gc.disable()
+    try:
+        before = sys.getallocatedblocks()
+        for i in range(number):
+            results[i] = function()
+        after = sys.getallocatedblocks()
+    finally:
+        gc.enable()
+    return (after - before) / number
+
+
+def report(results: list) -> None:
+    """Print the results returned by `measure`."""
+    for result in results:
+        line = (f"{result['name']:>40}: "
+                f"{result['items_per_second']:>14.0f} items/s, "
+                f"{result['best_seconds'] * 1000:>10.3f} ms best, "
+                f"{result['mean_seconds'] * 1000:>10.3f} ms mean")
+        if "blocks_per_call" in result:
+            line += f", {result['blocks_per_call']:>5.2f} blocks/call"
+        print(line)
+
+
+def environment() -> dict:
+    """Describe the interpreter and machine running the benchmarks."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"],
+                                check=True,
+                                stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL,
+                                universal_newlines=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "python": sys.version,
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+    }
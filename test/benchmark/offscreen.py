@@ -0,0 +1,109 @@
+"""Creates an offscreen OpenGL context backed by Mesa's software renderer.
+
+PyOpenGL picks its platform when `OpenGL` is first imported, so
+`create_context` must be called before anything imports `flaris.rendering`.
+By default the context is created with EGL on Mesa's surfaceless platform. Set
+`PYOPENGL_PLATFORM=osmesa` to use OSMesa instead.
+"""
+import ctypes
+import os
+import sys
+
+# The context is created with the same version as `flaris.rendering.Window`
+# would need to compile the default shaders.
+MAJOR_VERSION = 4
+MINOR_VERSION = 1
+
+
+def create_context(width: int, height: int) -> str:
+    """Make an offscreen OpenGL context current.
+
+    Args:
+        width: The width of the default framebuffer.
+        height: The height of the default framebuffer.
+
+    Returns:
+        A string naming the OpenGL renderer, for example "llvmpipe".
+
+    Raises:
+        RuntimeError: if a context can't be created.
+    """
+    if "OpenGL" in sys.modules and "PYOPENGL_PLATFORM" not in os.environ:
+        raise RuntimeError("OpenGL was imported before the platform was set.")
+    platform = os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+    os.environ.setdefault("EGL_PLATFORM", "surfaceless")
+    os.environ.setdefault("LIBGL_ALWAYS_SOFTWARE", "1")
+
+    # pylint: disable=import-outside-toplevel
+    try:
+        import OpenGL.GL as gl
+        if platform == "osmesa":
+            _create_osmesa_context(width, height)
+        else:
+            _create_egl_context(width, height)
+    except Exception as error:  # pylint: disable=broad-except
+        raise RuntimeError(f"Failed to create a {platform} context.") from error
+
+    gl.glViewport(0, 0, width, height)
+    gl.glEnable(gl.GL_BLEND)
+    gl.glBlendFunc(gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA)
+    gl.glEnable(gl.GL_DEPTH_TEST)
+    return gl.glGetString(gl.GL_RENDERER).decode()
+
+
+def _create_egl_context(width: int, height: int) -> None:
+    """Make an EGL context with a pbuffer surface current."""
+    from OpenGL import EGL  # pylint: disable=import-outside-toplevel
+
+    display = EGL.eglGetDisplay(EGL.EGL_DEFAULT_DISPLAY)
+    major, minor = EGL.EGLint(), EGL.EGLint()
+    EGL.eglInitialize(display, ctypes.pointer(major), ctypes.pointer(minor))
+
+    config_attributes = _attributes(EGL.EGL_SURFACE_TYPE, EGL.EGL_PBUFFER_BIT,
+                                    EGL.EGL_RED_SIZE, 8, EGL.EGL_GREEN_SIZE, 8,
+                                    EGL.EGL_BLUE_SIZE, 8, EGL.EGL_ALPHA_SIZE, 8,
+                                    EGL.EGL_DEPTH_SIZE, 24,
+                                    EGL.EGL_RENDERABLE_TYPE, EGL.EGL_OPENGL_BIT,
+                                    EGL.EGL_NONE)
+    config, count = EGL.EGLConfig(), EGL.EGLint()
+    EGL.eglChooseConfig(display, config_attributes, ctypes.pointer(config), 1,
+                        ctypes.pointer(count))
+    if not count.value:
+        raise RuntimeError("No EGL config supports OpenGL pbuffers.")
+
+    surface = EGL.eglCreatePbufferSurface(
+        display, config,
+        _attributes(EGL.EGL_WIDTH, width, EGL.EGL_HEIGHT, height, EGL.EGL_NONE))
+    EGL.eglBindAPI(EGL.EGL_OPENGL_API)
+    context = EGL.eglCreateContext(
+        display, config, EGL.EGL_NO_CONTEXT,
+        _attributes(EGL.EGL_CONTEXT_MAJOR_VERSION, MAJOR_VERSION,
+                    EGL.EGL_CONTEXT_MINOR_VERSION, MINOR_VERSION,
+                    EGL.EGL_CONTEXT_OPENGL_PROFILE_MASK,
+                    EGL.EGL_CONTEXT_OPENGL_CORE_PROFILE_BIT, EGL.EGL_NONE))
+    EGL.eglMakeCurrent(display, surface, surface, context)
+
+
+def _create_osmesa_context(width: int, height: int) -> None:
+    """Make an OSMesa context that draws into a buffer in memory current."""
+    # pylint: disable=import-outside-toplevel
+    import OpenGL.GL as gl
+    from OpenGL import arrays, osmesa
+
+    context = osmesa.OSMesaCreateContextAttribs(
+        _attributes(osmesa.OSMESA_FORMAT, osmesa.OSMESA_RGBA,
+                    osmesa.OSMESA_DEPTH_BITS, 24, osmesa.OSMESA_PROFILE,
+                    osmesa.OSMESA_CORE_PROFILE,
+                    osmesa.OSMESA_CONTEXT_MAJOR_VERSION, MAJOR_VERSION,
+                    osmesa.OSMESA_CONTEXT_MINOR_VERSION, MINOR_VERSION, 0),
+        None)
+    # The buffer must outlive the context, so it's kept on the function.
+    _create_osmesa_context.buffer = arrays.GLubyteArray.zeros(
+        (height, width, 4))
+    osmesa.OSMesaMakeCurrent(context, _create_osmesa_context.buffer,
+                             gl.GL_UNSIGNED_BYTE, width, height)
+
+
+def _attributes(*values: int):
+    """Return a zero-terminated C array of context attributes."""
+    return (ctypes.c_int * len(values))(*values)
@@ -0,0 +1,79 @@
+"""Fixtures shared by the rendering tests."""
+import itertools
+
+import OpenGL.GL as gl
+import pytest
+
+from flaris import Entity
+from flaris.rendering import RENDER_STATE
+
+# OpenGL functions that are recorded instead of called.
+_RECORDED = ("glActiveTexture", "glBindBuffer", "glBindBufferRange",
+             "glBindTexture", "glBindVertexArray", "glBlendFunc",
+             "glBufferData", "glDepthFunc", "glDisable", "glDrawArrays",
+             "glDrawArraysInstanced", "glEnable", "glEnableVertexAttribArray",
+             "glGenerateMipmap", "glPixelStorei", "glTexImage2D",
+             "glTexParameteri", "glUniformBlockBinding", "glUseProgram",
+             "glVertexAttribDivisor", "glVertexAttribPointer")
+
+# OpenGL functions that create objects, which return a new name each call.
+_GENERATORS = ("glGenBuffers", "glGenTextures", "glGenVertexArrays")
+
+
+class Prop(Entity):
+    """An entity built from the given components."""
+
+    def __init__(self, **components):
+        """Attach each component."""
+        super().__init__()
+        for name, component in components.items():
+            setattr(self, name, component)
+
+
+class FakeShader:
+    """A shader that records the values of its uniforms."""
+
+    # pylint: disable=too-few-public-methods
+
+    program = 7
+
+    def __init__(self):
+        """Initialize an empty record of uniforms."""
+        self.uniforms = {}
+
+    def set_int(self, name, value):
+        """Record the value of a uniform."""
+        self.uniforms[name] = value
+
+    set_float = set_vec2 = set_vec3 = set_mat4 = set_int
+
+
+@pytest.fixture(name="gl_calls")
+def fixture_gl_calls(monkeypatch):
+    """Record OpenGL calls instead of making them, so no context is needed.
+
+    The viewport is 640 by 480 pixels.
+    """
+    calls = []
+    names = itertools.count(1)
+
+    def record(name):
+        return lambda *args: calls.append((name, *args))
+
+    for name in _RECORDED:
+        monkeypatch.setattr(gl, name, record(name))
+    for name in _GENERATORS:
+        monkeypatch.setattr(gl, name, lambda _: next(names))
+    monkeypatch.setattr(
+        gl, "glGetIntegerv", lambda parameter: (0, 0, 640, 480)
+        if parameter == gl.GL_VIEWPORT else 256)
+    monkeypatch.setattr(gl, "glGetUniformBlockIndex", lambda *args: 0)
+    RENDER_STATE.invalidate()
+    yield calls
+    RENDER_STATE.invalidate()
+
+
+@pytest.fixture(name="fake_shader")
+def fixture_fake_shader():
+    """Return a shader that records its uniforms instead of uploading them."""
+    return FakeShader()
@@ -0,0 +1,77 @@
+"""Unit tests for the `flaris.rendering.atlas` module."""
+import numpy as np
+import pytest
+from PIL import Image
+
+from flaris.rendering import Texture, TextureAtlas
+
+
+@pytest.fixture(name="make_texture")
+def fixture_make_texture(tmp_path):
+    """Return a function that creates a texture of random pixels."""
+    generator = np.random.default_rng(0)
+
+    def make_texture(width, height):
+        pixels = generator.integers(0, 256, (height, width, 4), dtype=np.uint8)
+        path = tmp_path / f"{len(list(tmp_path.iterdir()))}.png"
+        Image.fromarray(pixels).save(path)
+        return Texture(str(path))
+
+    return make_texture
+
+
+def _pixels(atlas, region):
+    """Return the pixels of a region of an atlas page."""
+    # pylint: disable=protected-access
+    page = atlas._pages[region.page]
+    u0, v0, u1, v1 = (np.array(region.uvs) * page.size).round().astype(int)
+    return page.pixels[v0:v1, u0:u1]
+
+
+class TestTextureAtlas:
+    """Unit tests for the `TextureAtlas` class."""
+
+    def testRegion_StoresTexturePixels(self, make_texture):
+        atlas = TextureAtlas(size=64)
+        textures = [make_texture(10 + i, 2 + i) for i in range(8)]
+
+        regions = [atlas.region(texture) for texture in textures]
+
+        assert len(atlas) == 1
+        for texture, region in zip(textures, regions):
+            expected = np.frombuffer(texture.data, dtype=np.uint8)
+            assert np.array_equal(_pixels(atlas, region).ravel(), expected)
+
+    def testRegion_SamePath_SameRegion(self, make_texture):
+        atlas = TextureAtlas(size=64)
+        texture = make_texture(4, 4)
+
+        assert atlas.region(texture) == atlas.region(Texture(texture.path))
+
+    def testRegion_PageFull_AddsPage(self, make_texture):
+        atlas = TextureAtlas(size=32)
+
+        regions = [atlas.region(make_texture(20, 20)) for _ in range(2)]
+
+        assert [region.page for region in regions] == [0, 1]
+
+    def testRegion_LargerThanPage_OwnPage(self, make_texture):
+        atlas = TextureAtlas(size=16)
+        texture = make_texture(40, 3)
+
+        region = atlas.region(texture)
+
+        expected = np.frombuffer(texture.data, dtype=np.uint8)
+        assert np.array_equal(_pixels(atlas, region).ravel(), expected)
+
+    def testRegion_Padding_CopiesEdges(self, make_texture):
+        atlas = TextureAtlas(size=16, padding=1)
+        texture = make_texture(3, 3)
+
+        region = atlas.region(texture)
+
+        # pylint: disable=protected-access
+        pixels = atlas._pages[region.page].pixels
+        image = np.frombuffer(texture.data, dtype=np.uint8).reshape(3, 3, 4)
+        assert np.array_equal(pixels[0, 1:4], image[0])
+        assert np.array_equal(pixels[1:4, 0], image[:, 0])
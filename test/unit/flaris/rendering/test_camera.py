@@ -0,0 +1,49 @@
+"""Unit tests for the `flaris.rendering.camera` module."""
+import glm
+import numpy as np
+
+from flaris import Transform, Vector
+from flaris.rendering import OrthographicCamera
+
+from .conftest import Prop
+
+
+def _look_at(eye, center):
+    """Return a view matrix looking from `eye` at `center`."""
+    return np.array(
+        glm.lookAt(glm.vec3(*eye), glm.vec3(*center), glm.vec3(0, 1, 0)))
+
+
+class TestCamera:
+    """Unit tests for the `Camera` class."""
+
+    def testView_NoParent_LooksDownNegativeZ(self):
+        camera = Prop(camera=OrthographicCamera(),
+                      transform=Transform(Vector(1, 2, 10)))
+
+        view = camera[OrthographicCamera].view
+
+        assert np.allclose(view, _look_at((1, 2, 10), (1, 2, 0)))
+
+    def testView_Parented_FollowsParent(self):
+        parent = Prop(transform=Transform(Vector(5, 0, 0)))
+        camera = Prop(camera=OrthographicCamera(),
+                      transform=Transform(Vector(0, 0, 10)))
+        camera[Transform].parent = parent[Transform]
+
+        assert np.allclose(camera[OrthographicCamera].view,
+                           _look_at((5, 0, 10), (5, 0, 0)))
+
+        parent[Transform].position = Vector(0, 3, 0)
+
+        assert np.allclose(camera[OrthographicCamera].view,
+                           _look_at((0, 3, 10), (0, 3, 0)))
+
+    def testView_ParentRotated_TurnsWithParent(self):
+        parent = Prop(transform=Transform(rotation=Vector(0, 90, 0)))
+        camera = Prop(camera=OrthographicCamera(), transform=Transform())
+        camera[Transform].parent = parent[Transform]
+
+        view = camera[OrthographicCamera].view
+
+        assert np.allclose(view, _look_at((0, 0, 0), (-1, 0, 0)), atol=1e-6)
@@ -0,0 +1,88 @@
+"""Unit tests for the `flaris.rendering.culling` module."""
+import glm
+import numpy as np
+import pytest
+
+from flaris import Transform, Vector
+from flaris.fields import gather
+from flaris.rendering import Mesh
+from flaris.rendering.culling import (bounding_spheres, frustum_planes,
+                                      in_frustum, view_depths)
+
+
+def _planes():
+    """Return the frustum of a camera at z = 10 looking down the z-axis."""
+    projection = glm.ortho(-2, 2, -1, 1, 0.1, 100)
+    view = glm.lookAt(glm.vec3(0, 0, 10), glm.vec3(0, 0, 0), glm.vec3(0, 1, 0))
+    return frustum_planes(projection * view)
+
+
+class TestFrustumPlanes:
+    """Unit tests for the `frustum_planes` function."""
+
+    def testFrustumPlanes_Normalized(self):
+        planes = _planes()
+        assert planes.shape == (6, 4)
+        assert np.allclose(np.linalg.norm(planes[:, :3], axis=1), 1)
+
+    @pytest.mark.parametrize("point, inside", [
+        ((0, 0, 0), True),
+        ((1.9, -0.9, 9), True),
+        ((2.1, 0, 0), False),
+        ((0, -1.1, 0), False),
+        ((0, 0, 9.95), False),
+        ((0, 0, -91), False),
+    ])
+    def testFrustumPlanes_Point(self, point, inside):
+        distances = _planes() @ np.array([*point, 1])
+        assert np.all(distances >= 0) == inside
+
+
+class TestInFrustum:
+    """Unit tests for the `in_frustum` function."""
+
+    def testInFrustum(self):
+        centers = np.array([[0, 0, 0], [3, 0, 0], [2.5, 0, 0], [0, 0, -200]])
+        radii = np.array([0.1, 0.5, 0.6, 1])
+
+        visible = in_frustum(_planes(), centers, radii)
+
+        assert list(visible) == [True, False, True, False]
+
+
+class TestViewDepths:
+    """Unit tests for the `view_depths` function."""
+
+    def testViewDepths(self):
+        points = np.array([[0, 0, 9.9], [1, 1, 0], [0, 0, -90]])
+
+        depths = view_depths(_planes(), points)
+
+        assert np.allclose(depths, [0, 9.9 / 99.9, 1])
+
+
+class TestBoundingSpheres:
+    """Unit tests for the `bounding_spheres` function."""
+
+    def testBoundingSpheres(self):
+        transforms = [
+            Transform(),
+            Transform(Vector(5, 0, 0), Vector(0, 0, 90), Vector(1, 3, 1)),
+        ]
+        matrices = Transform.ARRAY.world_matrices(gather(transforms))
+        lower = np.array([[-0.5, -0.5, -0.5], [0, 0, 0]])
+        upper = np.array([[0.5, 0.5, 0.5], [2, 0, 0]])
+
+        centers, radii = bounding_spheres(lower, upper, matrices)
+
+        assert np.allclose(centers, [[0, 0, 0], [5, 1, 0]], atol=1e-6)
+        assert np.allclose(radii, [np.sqrt(3) / 2, 3])
+
+
+class TestMesh:
+    """Unit tests for the bounds of the `Mesh` class."""
+
+    def testBounds_Default_UnitCube(self):
+        lower, upper = Mesh("cube").bounds
+        assert lower == Vector(-0.5, -0.5, -0.5)
+        assert upper == Vector(0.5, 0.5, 0.5)
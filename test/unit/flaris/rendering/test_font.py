@@ -1,6 +1,8 @@
 """Unit tests for the `flaris.rendering.font` module."""
+import numpy as np
 import pytest
 
+from flaris import assets
 from flaris.rendering import Font
 
 
@@ -10,3 +12,27 @@ class TestFont:
     def testInit_InvalidPath_RaisesValueError(self):
         with pytest.raises(ValueError):
             Font("some-non-existant-image.png")
+
+    def testGlyphs_RegionsDoNotOverlap(self):
+        glyphs = Font(assets.path("fonts/Moon Light.otf"), size=20).glyphs
+
+        height, width = glyphs.pixels.shape
+        corners = (glyphs.uvs * (width, height, width, height)).round()
+        covered = np.zeros((height, width), dtype=int)
+        for u0, v0, u1, v1 in corners.astype(int):
+            covered[v0:v1, u0:u1] += 1
+
+        assert covered.max() == 1
+        assert np.array_equal(corners[:, 2:] - corners[:, :2], glyphs.sizes)
+
+    def testGlyphs_PaddingIsEmpty(self):
+        glyphs = Font(assets.path("fonts/Moon Light.otf"), size=20).glyphs
+
+        height, width = glyphs.pixels.shape
+        corners = (glyphs.uvs * (width, height, width, height)).round()
+        inside = np.zeros((height, width), dtype=bool)
+        for u0, v0, u1, v1 in corners.astype(int):
+            inside[v0:v1, u0:u1] = True
+
+        assert glyphs.pixels[~inside].max() == 0
+        assert glyphs.pixels[inside].max() > 0
@@ -0,0 +1,37 @@
+"""Unit tests for the `flaris.rendering.light` module."""
+import numpy as np
+
+from flaris import Transform, Vector
+from flaris.rendering import DirectionalLight
+
+from .conftest import Prop
+
+
+class TestLight:
+    """Unit tests for the `Light` class."""
+
+    def testDirection_NoRotation_ShinesDownPositiveZ(self):
+        light = Prop(light=DirectionalLight(), transform=Transform())
+
+        assert np.allclose(light[DirectionalLight].direction, (0, 0, 1))
+
+    def testDirection_Parented_TurnsWithParent(self):
+        parent = Prop(transform=Transform())
+        light = Prop(light=DirectionalLight(),
+                     transform=Transform(rotation=Vector(90, 0, 0)))
+        light[Transform].parent = parent[Transform]
+
+        assert np.allclose(light[DirectionalLight].direction, (0, -1, 0),
+                           atol=1e-6)
+
+        parent[Transform].rotation = Vector(0, 0, 90)
+
+        assert np.allclose(light[DirectionalLight].direction, (1, 0, 0),
+                           atol=1e-6)
+
+    def testDirection_ScaledParent_UnitLength(self):
+        parent = Prop(transform=Transform(scale=Vector(3, 3, 3)))
+        light = Prop(light=DirectionalLight(), transform=Transform())
+        light[Transform].parent = parent[Transform]
+
+        assert np.isclose(np.linalg.norm(light[DirectionalLight].direction), 1)
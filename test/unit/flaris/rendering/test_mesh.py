@@ -0,0 +1,111 @@
+"""Unit tests for the `flaris.rendering.renderers.mesh` module."""
+import numpy as np
+import OpenGL.GL as gl
+import pytest
+from PIL import Image
+
+from flaris import Transform, Vector
+from flaris.rendering import (Color, DirectionalLight, Material, Mesh,
+                              MeshRenderer, OrthographicCamera, Texture)
+
+from .conftest import Prop
+
+
+@pytest.fixture(name="make_mesh")
+def fixture_make_mesh(tmp_path):
+    """Return a function that creates a textured cube."""
+
+    def make_mesh(texture="texture", albedo=Color(1, 1, 1), position=(0, 0, 0)):
+        path = tmp_path / f"{texture}.png"
+        if not path.exists():
+            Image.new("RGBA", (2, 2)).save(path)
+        prop = Prop(mesh=Mesh("cube"),
+                    material=Material(albedo=albedo),
+                    texture=Texture(str(path)),
+                    transform=Transform(Vector(*position)))
+        return prop[Mesh]
+
+    return make_mesh
+
+
+@pytest.fixture(name="renderer")
+def fixture_renderer(gl_calls, fake_shader):
+    """Return a mesh renderer whose camera looks down from above the origin."""
+    # pylint: disable=unused-argument
+    camera = Prop(camera=OrthographicCamera(),
+                  transform=Transform(Vector(0, 0, 10)))
+    return MeshRenderer(camera[OrthographicCamera], shader=fake_shader)
+
+
+def _instances(gl_calls, renderer):
+    """Return the data uploaded to a renderer's instance buffer."""
+    uploads, bound = [], None
+    for name, target, *args in gl_calls:
+        if target != gl.GL_ARRAY_BUFFER:
+            continue
+        if name == "glBindBuffer":
+            bound = args[0]
+        elif name == "glBufferData" and bound == renderer.instances:
+            uploads.append(args[1])
+    return uploads
+
+
+class TestMeshRenderer:
+    """Unit tests for the `MeshRenderer` class."""
+
+    def testDrawInstances_OneInstancedDrawCall(self, renderer, make_mesh,
+                                               gl_calls):
+        models = np.stack([np.eye(4, dtype=np.float32)] * 3)
+        models[:, 3, :3] = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+        albedos = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+
+        renderer.draw_instances(make_mesh(), models, albedos)
+
+        draws = [call for call in gl_calls if "Draw" in call[0]]
+        assert draws == [("glDrawArraysInstanced", gl.GL_TRIANGLES, 0, 36, 3)]
+        instances = _instances(gl_calls, renderer)[-1]
+        assert np.array_equal(instances[:, :16], models.reshape(3, 16))
+        assert np.array_equal(instances[:, 16:], albedos)
+
+    def testDraw_SingleMesh_DrawsOneInstance(self, renderer, make_mesh,
+                                             gl_calls, fake_shader):
+        mesh = make_mesh(albedo=Color(0.5, 0.25, 1), position=(1, 2, 3))
+
+        del gl_calls[:]
+
+        renderer.draw(mesh, mesh.entity[Transform])
+
+        draws = [call for call in gl_calls if "Draw" in call[0]]
+        assert draws == [("glDrawArraysInstanced", gl.GL_TRIANGLES, 0, 36, 1)]
+        # The lights are uploaded by set_lights, not by each draw.
+        assert not [
+            call for call in gl_calls
+            if call[:2] == ("glBufferData", gl.GL_UNIFORM_BUFFER)
+        ]
+        instances = _instances(gl_calls, renderer)[-1]
+        model = mesh.entity[Transform].world_model
+        assert np.array_equal(instances[0, :16], model.ravel())
+        assert np.array_equal(instances[0, 16:], [0.5, 0.25, 1])
+        assert fake_shader.uniforms["material.diffuse"] == 1
+
+    def testSetLights_SplitsLightsIntoPasses(self, renderer, gl_calls):
+        lights = [
+            Prop(light=DirectionalLight(intensity=i),
+                 transform=Transform())[DirectionalLight] for i in range(3)
+        ]
+
+        passes = renderer.set_lights(lights, lights_per_pass=2)
+
+        assert passes == 2
+        data = [
+            call[3]
+            for call in gl_calls
+            if call[:2] == ("glBufferData", gl.GL_UNIFORM_BUFFER)
+        ][-1]
+        assert len(data) == 2
+        # Each light is a direction, an ambient color, and a diffuse color,
+        # and the lights past the end of a pass are zero.
+        assert np.array_equal(data[0, :3], [0, 0, 1])
+        assert np.array_equal(data[0, 20:23], [1, 1, 1])
+        assert np.array_equal(data[1, 8:11], [2, 2, 2])
+        assert not data[1, 12:].any()
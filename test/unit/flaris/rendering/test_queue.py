@@ -0,0 +1,63 @@
+"""Unit tests for the `flaris.rendering.queue` module."""
+import numpy as np
+import pytest
+
+from flaris.rendering import RenderQueue, sort_keys
+
+
+def _order(**properties):
+    """Return the order that draw calls with the given properties are made."""
+    count = len(next(iter(properties.values())))
+    defaults = {
+        "layers": np.zeros(count),
+        "transparent": np.zeros(count, dtype=bool),
+        "shaders": np.zeros(count),
+        "materials": np.zeros(count),
+        "depths": np.zeros(count),
+    }
+    defaults.update(properties)
+    return list(np.argsort(sort_keys(**defaults), kind="stable"))
+
+
+class TestSortKeys:
+    """Unit tests for the `sort_keys` function."""
+
+    def testSortKeys_Layers_LowerLayersFirst(self):
+        assert _order(layers=[2, 0, 1], depths=[0, 1, 0.5]) == [1, 2, 0]
+
+    def testSortKeys_Transparent_OpaqueFirst(self):
+        assert _order(transparent=[True, False], shaders=[0, 4095]) == [1, 0]
+
+    def testSortKeys_Opaque_StateBeforeDepth(self):
+        order = _order(shaders=[2, 1, 2, 1], depths=[0.1, 0.9, 0.2, 0.3])
+        assert order == [3, 1, 0, 2]
+
+    def testSortKeys_Transparent_BackToFront(self):
+        order = _order(transparent=[True] * 3,
+                       materials=[1, 2, 3],
+                       depths=[0.2, 0.8, 0.5])
+        assert order == [1, 2, 0]
+
+    def testSortKeys_DepthOutOfRange_Clipped(self):
+        assert _order(depths=[1.5, -1, 0.5]) == [1, 2, 0]
+
+
+class TestRenderQueue:
+    """Unit tests for the `RenderQueue` class."""
+
+    def testFlush_MakesCallsInKeyOrder(self):
+        queue = RenderQueue()
+        calls = []
+        queue.submit([3, 1],
+                     [lambda: calls.append("a"), lambda: calls.append("b")])
+        queue.submit([1], [lambda: calls.append("c")])
+
+        count = queue.flush()
+
+        assert count == 3
+        assert calls == ["b", "c", "a"]
+        assert not queue
+
+    def testSubmit_MismatchedLengths_RaisesValueError(self):
+        with pytest.raises(ValueError):
+            RenderQueue().submit([1, 2], [print])
@@ -1,7 +1,25 @@
 """Unit tests for the `flaris.rendering.shader` module."""
+import OpenGL.GL as gl
 import pytest
 
 from flaris.rendering import Shader
+from flaris.rendering import shader as shader_module
+
+
+@pytest.fixture(name="shader")
+def fixture_shader(tmp_path, monkeypatch):
+    """Return a shader whose program has an int uniform at location 3."""
+    # pylint: disable=protected-access
+    vertex, fragment = tmp_path / "shader.vs", tmp_path / "shader.fs"
+    vertex.write_text("")
+    fragment.write_text("")
+    shader = Shader(str(vertex), str(fragment))
+    # Pretend the program is already linked, so that no context is needed.
+    monkeypatch.setitem(shader_module._SHADERS, (str(vertex), str(fragment)),
+                        42)
+    monkeypatch.setitem(shader_module._UNIFORMS, 42,
+                        shader_module._Uniforms({"count": 3}))
+    return shader
 
 
 class TestShader:
@@ -11,3 +29,24 @@ class TestShader:
         with pytest.raises(ValueError):
             Shader("some-non-existant-vertex-shader.glsl",
                    "some-non-existant-fragment-shader.glsl")
+
+    def testSetInt_SameValue_UploadsOnce(self, shader, monkeypatch):
+        calls = []
+        monkeypatch.setattr(gl, "glUniform1i", lambda *args: calls.append(args))
+
+        shader.set_int("count", 1)
+        shader.set_int("count", 1)
+        shader.set_int("count", 2)
+
+        assert calls == [(3, 1), (3, 2)]
+        assert shader.stats == (2, 1)
+        assert shader.stats.avoided == 4
+
+    def testSetInt_InactiveUniform_Skipped(self, shader, monkeypatch):
+        calls = []
+        monkeypatch.setattr(gl, "glUniform1i", lambda *args: calls.append(args))
+
+        shader.set_int("unused", 1)
+
+        assert not calls
+        assert shader.stats.skipped == 1
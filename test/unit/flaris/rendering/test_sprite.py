@@ -0,0 +1,55 @@
+"""Unit tests for the `flaris.rendering.renderers.sprite` module."""
+from types import SimpleNamespace
+
+import numpy as np
+
+from flaris import Transform, Vector
+from flaris.rendering.renderers.sprite import (sprite_matrices, sprite_sizes,
+                                               sprite_vertices)
+
+
+class TestSpriteVertices:
+    """Unit tests for the `sprite_vertices` function."""
+
+    def testSpriteVertices_MatchesSpriteMatrices(self):
+        positions = np.array([[10, 20], [0, 5]])
+        sizes = np.array([[4, 8], [-2, 3]])
+        uvs = np.array([[0, 0, 1, 1], [0, 0, 1, 1]])
+        colors = np.ones((2, 4))
+
+        vertices = sprite_vertices(positions, sizes, uvs, colors)
+
+        corners = vertices[:, 2:4].reshape(2, 6, 2)
+        points = np.concatenate(
+            [corners, np.zeros(
+                (2, 6, 1)), np.ones((2, 6, 1))], axis=2)
+        expected = np.einsum("nvi,nij->nvj", points,
+                             sprite_matrices(positions, sizes))[..., :2]
+        assert np.allclose(vertices[:, :2].reshape(2, 6, 2), expected)
+
+    def testSpriteVertices_ScalesTextureCoordinates(self):
+        uvs = np.array([[0.25, 0.5, 0.75, 1.0]])
+
+        vertices = sprite_vertices(np.zeros((1, 2)), np.ones((1, 2)), uvs,
+                                   np.array([[1, 0, 0, 0.5]]))
+
+        assert np.allclose(vertices[:, 2:4].min(axis=0), [0.25, 0.5])
+        assert np.allclose(vertices[:, 2:4].max(axis=0), [0.75, 1.0])
+        assert np.allclose(vertices[:, 4:], [1, 0, 0, 0.5])
+
+
+class TestSpriteSizes:
+    """Unit tests for the `sprite_sizes` function."""
+
+    def testSpriteSizes_ScaledParent_ScalesSprite(self):
+        sprite = SimpleNamespace(texture=SimpleNamespace(width=4, height=8))
+        parent = Transform(scale=Vector(2, 3, 1))
+        child = Transform(rotation=Vector(0, 0, 90), scale=Vector(5, 1, 1))
+        child.parent = parent
+        rows = np.array([parent.slot, child.slot])
+
+        sizes = sprite_sizes([sprite, sprite],
+                             Transform.ARRAY.world_matrices(rows))
+
+        # The child is rotated, so its x axis is stretched by the parent's y.
+        assert np.allclose(sizes, [[8, 24], [60, 16]])
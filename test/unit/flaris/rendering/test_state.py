@@ -0,0 +1,84 @@
+"""Unit tests for the `flaris.rendering.state` module."""
+import OpenGL.GL as gl
+import pytest
+
+from flaris.rendering import RenderState
+
+
+@pytest.fixture(name="calls")
+def fixture_calls(monkeypatch):
+    """Record OpenGL state changes instead of making them."""
+    calls = []
+    for name in ("glUseProgram", "glBindVertexArray", "glActiveTexture",
+                 "glBindTexture", "glEnable", "glDisable", "glBlendFunc",
+                 "glDepthFunc"):
+        monkeypatch.setattr(gl,
+                            name,
+                            lambda *args, name=name: calls.append(
+                                (name, *args)))
+    return calls
+
+
+class TestRenderState:
+    """Unit tests for the `RenderState` class."""
+
+    def testUseProgram_SameProgram_Skipped(self, calls):
+        state = RenderState()
+
+        state.use_program(1)
+        state.use_program(1)
+        state.use_program(2)
+
+        assert calls == [("glUseProgram", 1), ("glUseProgram", 2)]
+        assert (state.issued, state.skipped) == (2, 1)
+
+    def testBindTexture_OtherUnit_ActivatesUnit(self, calls):
+        state = RenderState()
+
+        state.bind_texture(0, 5)
+        state.bind_texture(1, 6)
+        state.bind_texture(0, 5)
+        state.bind_texture(1, 7)
+
+        assert calls == [
+            ("glActiveTexture", gl.GL_TEXTURE0),
+            ("glBindTexture", gl.GL_TEXTURE_2D, 5),
+            ("glActiveTexture", gl.GL_TEXTURE1),
+            ("glBindTexture", gl.GL_TEXTURE_2D, 6),
+            ("glBindTexture", gl.GL_TEXTURE_2D, 7),
+        ]
+
+    def testSetBlend_ToggledBack_KeepsFactors(self, calls):
+        state = RenderState()
+        factors = gl.GL_ONE, gl.GL_ONE
+
+        state.set_blend(factors)
+        state.set_blend(None)
+        state.set_blend(factors)
+
+        assert calls == [
+            ("glEnable", gl.GL_BLEND),
+            ("glBlendFunc", *factors),
+            ("glDisable", gl.GL_BLEND),
+            ("glEnable", gl.GL_BLEND),
+        ]
+
+    def testInvalidate_SameDepth_Issued(self, calls):
+        state = RenderState()
+
+        state.set_depth(gl.GL_LESS)
+        state.invalidate()
+        state.set_depth(gl.GL_LESS)
+
+        assert len(calls) == 4
+
+    def testBeginFrame_ResetsCounts(self, calls):
+        del calls
+        state = RenderState()
+        state.bind_vertex_array(3)
+        state.bind_vertex_array(3)
+
+        state.begin_frame()
+
+        assert state.stats == (1, 1)
+        assert (state.issued, state.skipped) == (0, 0)
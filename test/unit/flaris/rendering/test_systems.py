@@ -0,0 +1,90 @@
+"""Unit tests for the `flaris.rendering.systems` module."""
+import OpenGL.GL as gl
+import pytest
+from PIL import Image
+
+from flaris import Transform, Vector, World, assets
+from flaris.rendering import (RENDER_QUEUE, Color, DirectionalLight, Font,
+                              Material, Mesh, MeshRenderer, OrthographicCamera,
+                              Text, TextRenderer, Texture)
+from flaris.rendering.renderers.mesh import MAX_LIGHTS
+from flaris.rendering.systems import MeshRenderingSystem, TextRenderingSystem
+
+from .conftest import Prop
+
+
+class TestMeshRenderingSystem:
+    """Unit tests for the `MeshRenderingSystem` class."""
+
+    @pytest.mark.parametrize("lights_per_pass", [0, MAX_LIGHTS + 1])
+    def testInit_InvalidLightsPerPass_RaisesValueError(self, lights_per_pass):
+        with pytest.raises(ValueError):
+            MeshRenderingSystem(lights_per_pass=lights_per_pass)
+
+    def testInit_DefaultLightsPerPass_MaxLights(self):
+        assert MeshRenderingSystem().lights_per_pass == MAX_LIGHTS
+
+    def testStep_SharedMeshAndMaterial_OneDrawCallPerGroup(
+            self, tmp_path, gl_calls, fake_shader):
+        textures = []
+        for name in ("first", "second"):
+            Image.new("RGBA", (2, 2)).save(tmp_path / f"{name}.png")
+            textures.append(str(tmp_path / f"{name}.png"))
+        world = World()
+        system = MeshRenderingSystem()
+        world.register(system)
+        world.add(
+            Prop(camera=OrthographicCamera(),
+                 transform=Transform(Vector(0, 0, 10))))
+        world.add(Prop(light=DirectionalLight(), transform=Transform()))
+        for i in range(5):
+            world.add(
+                Prop(mesh=Mesh("cube"),
+                     material=Material(albedo=Color(i / 4, 0, 0)),
+                     texture=Texture(textures[i % 2]),
+                     transform=Transform(Vector(i, 0, 0))))
+        system.renderer = MeshRenderer(None, shader=fake_shader)
+
+        system.step(0)
+        RENDER_QUEUE.flush()
+
+        draws = [call for call in gl_calls if "Draw" in call[0]]
+        assert sorted(draws) == [
+            ("glDrawArraysInstanced", gl.GL_TRIANGLES, 0, 36, 2),
+            ("glDrawArraysInstanced", gl.GL_TRIANGLES, 0, 36, 3),
+        ]
+        uploads = [
+            call[3]
+            for call in gl_calls
+            if call[:2] == ("glBufferData", gl.GL_ARRAY_BUFFER)
+        ]
+        albedos = sorted(tuple(upload[:, 16]) for upload in uploads[-2:])
+        assert albedos == [(0, 0.5, 1), (0.25, 0.75)]
+        positions = sorted(tuple(upload[:, 12]) for upload in uploads[-2:])
+        assert positions == [(0, 2, 4), (1, 3)]
+
+
+class TestTextRenderingSystem:
+    """Unit tests for the `TextRenderingSystem` class."""
+
+    def testStep_ChildTransform_DrawsAtWorldPosition(self, monkeypatch,
+                                                     gl_calls, fake_shader):
+        # pylint: disable=unused-argument
+        world = World()
+        system = TextRenderingSystem()
+        world.register(system)
+        system.renderer = TextRenderer(fake_shader)
+        font = Font(assets.path("fonts/Moon Light.otf"), size=20)
+        text = Prop(text=Text("Hi", font=font),
+                    transform=Transform(Vector(1, 2, 0)))
+        text[Transform].parent = Transform(Vector(10, 20, 0))
+        world.add(text)
+        # The system computes every world matrix at once, so the renderer
+        # must not compute its own.
+        monkeypatch.delattr(Transform, "world_model")
+
+        system.step(0)
+        RENDER_QUEUE.flush()
+
+        origin = fake_shader.uniforms["origin"]
+        assert (origin.x, origin.y) == (11, 22)
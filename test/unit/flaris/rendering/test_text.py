@@ -0,0 +1,70 @@
+"""Unit tests for the `flaris.rendering.renderers.text` module."""
+import numpy as np
+import OpenGL.GL as gl
+import pytest
+
+from flaris import Transform, Vector, assets
+from flaris.rendering import Font, Text, TextRenderer
+from flaris.rendering.renderers.text import text_vertices
+
+
+@pytest.fixture(name="font", scope="module")
+def fixture_font():
+    """Return a small font, loaded once for every test."""
+    return Font(assets.path("fonts/Moon Light.otf"), size=20)
+
+
+class TestTextRenderer:
+    """Unit tests for the `TextRenderer` class."""
+
+    def testDraw_OneDrawCall(self, font, gl_calls, fake_shader):
+        renderer = TextRenderer(fake_shader)
+
+        renderer.draw(Text("Hello", font=font), Transform())
+
+        draws = [call for call in gl_calls if call[0] == "glDrawArrays"]
+        assert draws == [("glDrawArrays", gl.GL_TRIANGLES, 0, 5 * 6)]
+
+    def testDraw_ChildTransform_StartsAtWorldPosition(self, font, gl_calls,
+                                                      fake_shader):
+        # pylint: disable=unused-argument
+        renderer = TextRenderer(fake_shader)
+        parent = Transform(Vector(10, 20, 0))
+        child = Transform(Vector(1, 2, 0))
+        child.parent = parent
+
+        renderer.draw(Text("Hi", font=font), child)
+
+        origin = fake_shader.uniforms["origin"]
+        assert (origin.x, origin.y) == (11, 22)
+
+
+class TestTextVertices:
+    """Unit tests for the `text_vertices` function."""
+
+    def testTextVertices_OneQuadPerCharacter(self, font):
+        vertices = text_vertices(font, "Hello")
+
+        assert vertices.shape == (5 * 6, 4)
+
+    def testTextVertices_QuadsFollowAdvances(self, font):
+        glyphs = font.glyphs
+        code = ord("o")
+
+        vertices = text_vertices(font, "oo").reshape(2, 6, 4)
+
+        advance = glyphs.advances[code] >> 6
+        assert np.allclose(vertices[1, :, 0] - vertices[0, :, 0], advance)
+        assert np.allclose(vertices[0, :, 0].min(), glyphs.bearings[code, 0])
+        assert np.allclose(vertices[0, :, 1].max(), glyphs.bearings[code, 1])
+        assert np.allclose(vertices[0, :, 2:].min(axis=0), glyphs.uvs[code, :2])
+
+    def testTextVertices_SameString_ReturnsCachedVertices(self, font):
+        vertices = text_vertices(font, "cached")
+
+        assert text_vertices(font, "cached") is vertices
+        assert not vertices.flags.writeable
+
+    def testTextVertices_NonAsciiCharacter_RaisesUnicodeEncodeError(self, font):
+        with pytest.raises(UnicodeEncodeError):
+            text_vertices(font, "café")
@@ -1,8 +1,66 @@
 """Unit tests for flaris.rendering.window."""
+import OpenGL.GL as gl
+import pytest
+
+from flaris.rendering import RENDER_STATE, Window
+from flaris.rendering import window
+
+
+class FakeGlfw:
+    """A stand-in for GLFW that opens windows without a display."""
+
+    # pylint: disable=missing-function-docstring, unused-argument
+
+    @staticmethod
+    def init():
+        return True
+
+    @staticmethod
+    def create_window(*args):
+        return object()
+
+    @staticmethod
+    def window_hint(*args):
+        pass
+
+    make_context_current = set_framebuffer_size_callback = window_hint
+    set_window_icon = terminate = get_primary_monitor = window_hint
+    CONTEXT_VERSION_MAJOR = CONTEXT_VERSION_MINOR = None
+    OPENGL_FORWARD_COMPAT = OPENGL_PROFILE = OPENGL_CORE_PROFILE = None
+
+
+@pytest.fixture(name="calls")
+def fixture_calls(monkeypatch):
+    """Open windows with a fake GLFW and record OpenGL state changes."""
+    monkeypatch.setattr(window, "glfw", FakeGlfw)
+    calls = []
+    for name in ("glUseProgram", "glEnable", "glBlendFunc", "glDepthFunc"):
+        monkeypatch.setattr(gl,
+                            name,
+                            lambda *args, name=name: calls.append(
+                                (name, *args)))
+    yield calls
+    RENDER_STATE.invalidate()
 
 
 class TestWindow:
     """Unit tests for flaris.rendering.window.Window."""
 
-    def testInit(self):
-        pass
+    def testEnter_SetsStateThroughCache(self, calls):
+        with Window("test", 64, 64, fullscreen=False):
+            RENDER_STATE.set_depth(gl.GL_LESS)
+
+        assert calls == [
+            ("glEnable", gl.GL_BLEND),
+            ("glBlendFunc", gl.GL_SRC_ALPHA, gl.GL_ONE_MINUS_SRC_ALPHA),
+            ("glEnable", gl.GL_DEPTH_TEST),
+            ("glDepthFunc", gl.GL_LESS),
+        ]
+
+    def testEnter_NewContext_ForgetsCachedState(self, calls):
+        with Window("first", 64, 64, fullscreen=False):
+            RENDER_STATE.use_program(3)
+        with Window("second", 64, 64, fullscreen=False):
+            RENDER_STATE.use_program(3)
+
+        assert calls.count(("glUseProgram", 3)) == 2
@@ -0,0 +1,147 @@
+"""Unit tests for the `flaris.batch` module."""
+import numpy as np
+import pytest
+
+from flaris.component import Component, ComponentError
+from flaris.entity import Entity
+from flaris.fields import ArrayComponent, Field
+from flaris.system import BatchSystem
+from flaris.world import World
+
+
+class Position(ArrayComponent):
+    """A component that stores a position used for testing."""
+
+    value = Field(3)
+
+    def __init__(self, x: float = 0):
+        self.value = (x, 0, 0)
+
+
+class Velocity(ArrayComponent):
+    """A component that stores a velocity used for testing."""
+
+    value = Field(3)
+
+    def __init__(self, x: float = 0):
+        self.value = (x, 0, 0)
+
+
+class ExtendedVelocity(Velocity):
+    """A component that stores its fields separately from its base class."""
+
+    extra = Field()
+
+
+class TagComponent(Component):
+    """A component without fields used for testing."""
+
+
+class StubEntity(Entity):
+    """A simple entity used for testing."""
+
+    def __init__(self, *components: Component):
+        super().__init__()
+        for i, component in enumerate(components):
+            setattr(self, f"component{i}", component)
+
+
+class MovementSystem(BatchSystem):
+    """A system that integrates velocities used for testing."""
+
+    REQUIRED_COMPONENTS = (Position, Velocity)
+
+    def update(self, batch, delta):
+        batch[Position].value += batch[Velocity].value * delta
+
+
+class TestBatch:
+    """Unit tests for the `Batch` class."""
+
+    def testGetItem(self):
+        world = World()
+        entities = [StubEntity(Position(i), Velocity(1)) for i in range(3)]
+        for entity in entities:
+            world.add(entity)
+
+        batch = world.batch(Position, Velocity)
+        batch[Position].value += batch[Velocity].value
+
+        assert len(batch) == 3
+        assert list(batch.entities) == entities
+        assert [entity.component0.value[0] for entity in entities] == [1, 2, 3]
+
+    def testGetItem_SpansArchetypes(self):
+        world = World()
+        moving = StubEntity(Position(), Velocity(2))
+        tagged = StubEntity(Position(), Velocity(3), TagComponent())
+        still = StubEntity(Position())
+        for entity in (moving, tagged, still):
+            world.add(entity)
+
+        batch = world.batch(Position, Velocity)
+        batch[Position].value = batch[Velocity].value
+
+        assert set(batch.entities) == {moving, tagged}
+        assert moving.component0.value[0] == 2
+        assert tagged.component0.value[0] == 3
+        assert still.component0.value[0] == 0
+
+    def testGetItem_ComponentWithoutFields(self):
+        world = World()
+        world.add(StubEntity(Position(), TagComponent()))
+        batch = world.batch(Position, TagComponent)
+
+        assert len(batch) == 1
+        with pytest.raises(ComponentError):
+            batch[TagComponent]  # pylint: disable=pointless-statement
+
+    def testGetItem_UnknownField_RaisesAttributeError(self):
+        world = World()
+        world.add(StubEntity(Position()))
+        view = world.batch(Position)[Position]
+        with pytest.raises(AttributeError):
+            view.speed  # pylint: disable=pointless-statement
+
+    def testRows(self):
+        world = World()
+        entities = [StubEntity(Position(i)) for i in range(3)]
+        for entity in entities:
+            world.add(entity)
+
+        rows = world.batch(Position).rows(Position)
+
+        assert list(Position.ARRAY["value"][rows, 0]) == [0, 1, 2]
+
+    def testBatch_EntityAdded_Invalidated(self):
+        world = World()
+        world.add(StubEntity(Position()))
+        assert len(world.batch(Position)) == 1
+
+        world.add(StubEntity(Position()))
+
+        assert len(world.batch(Position)) == 2
+
+    def testBatch_SubclassWithOwnFields_RaisesComponentError(self):
+        world = World()
+        world.add(StubEntity(ExtendedVelocity()))
+        with pytest.raises(ComponentError):
+            world.batch(Velocity)
+
+
+class TestBatchSystem:
+    """Unit tests for the `BatchSystem` class."""
+
+    def testStep(self):
+        world = World()
+        system = MovementSystem()
+        world.register(system)
+        entities = [StubEntity(Position(), Velocity(i)) for i in range(4)]
+        for entity in entities:
+            world.add(entity)
+        world.remove(entities[1])  # Leave a gap in the rows.
+
+        system.step(0.5)
+
+        positions = [entity.component0.value[0] for entity in entities]
+        assert np.allclose(positions, [0, 0, 1, 1.5])
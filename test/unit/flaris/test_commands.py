@@ -0,0 +1,44 @@
+"""Unit tests for the `flaris.commands` module."""
+from flaris.commands import CommandBuffer
+from flaris.component import Component
+from flaris.entity import Entity
+from flaris.world import World
+
+
+class StubComponent(Component):
+    """A simple component used for testing."""
+
+
+class StubEntity(Entity):
+    """A simple entity used for testing."""
+
+
+class TestCommandBuffer:
+    """Unit tests for the `CommandBuffer` class."""
+
+    def testDrain(self):
+        commands = CommandBuffer()
+        entity, component = StubEntity(), StubComponent()
+        commands.spawn(entity)
+        commands.attach(entity, "component", component)
+
+        assert list(commands.drain()) == [
+            ("spawn", entity, None, None),
+            ("attach", entity, "component", component),
+        ]
+        assert not commands
+
+    def testFlush_AppliesCommandsInOrder(self):
+        world = World()
+        entity, component = StubEntity(), StubComponent()
+        world.commands.spawn(entity)
+        world.commands.attach(entity, "component", component)
+        world.commands.detach(entity, "component")
+        world.commands.despawn(entity)
+        assert entity not in world
+
+        world.flush()
+
+        assert entity not in world
+        assert component.entity is None
+        assert not world.commands
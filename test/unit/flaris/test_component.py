@@ -1,4 +1,6 @@
 """Unit tests for the `flaris.component` module."""
+import dataclasses
+
 from flaris.component import Component
 from flaris.entity import Entity
 
@@ -7,6 +9,13 @@ class StubComponent(Component):
     """A simple component used for testing."""
 
 
+@dataclasses.dataclass(frozen=True)
+class FrozenStubComponent(Component):
+    """A simple immutable component used for testing."""
+
+    value: int = 0
+
+
 class StubEntity(Entity):
     """A simple entity used for testing."""
 
@@ -23,3 +32,8 @@ class TestComponent:
         assert not component.entity
         entity = StubEntity(component)
         assert component.entity is entity
+
+    def testEntity_FrozenDataclass(self):
+        component = FrozenStubComponent()
+        entity = StubEntity(component)
+        assert component.entity is entity
@@ -0,0 +1,161 @@
+"""Unit tests for the `flaris.entity` module."""
+import pytest
+
+from flaris.component import Component, ComponentError
+from flaris.entity import Entity, EntityPool
+from flaris.world import World
+
+
+class BaseStubComponent(Component):
+    """A simple component base class used for testing."""
+
+
+class StubComponent(BaseStubComponent):
+    """A simple component used for testing."""
+
+
+class OtherStubComponent(BaseStubComponent):
+    """Another simple component used for testing."""
+
+
+class StubEntity(Entity):
+    """A simple entity used for testing."""
+
+
+class SlottedStubEntity(Entity):
+    """A simple entity without an instance dictionary used for testing."""
+
+    __slots__ = ("component",)
+
+    def __init__(self, component: Component):
+        super().__init__()
+        self.component = component
+
+
+class TestEntity:
+    """Unit tests for the `Entity` class."""
+
+    # The tests attach components by assigning attributes to entities.
+    # pylint: disable=attribute-defined-outside-init
+
+    def testGetItem(self):
+        entity = StubEntity()
+        entity.component = StubComponent()
+        assert entity[StubComponent] is entity.component
+
+    def testGetItem_BaseClass(self):
+        entity = StubEntity()
+        entity.component = StubComponent()
+        assert entity[BaseStubComponent] is entity.component
+
+    def testGetItem_MultipleSubclasses_ReturnsFirstAttached(self):
+        entity = StubEntity()
+        entity.component = OtherStubComponent()
+        entity.other_component = StubComponent()
+        assert entity[BaseStubComponent] is entity.component
+
+    def testGetItem_MissingComponent_RaisesComponentError(self):
+        entity = StubEntity()
+        entity.component = OtherStubComponent()
+        with pytest.raises(ComponentError):
+            entity[StubComponent]  # pylint: disable=pointless-statement
+
+    def testContains(self):
+        entity = StubEntity()
+        entity.component = StubComponent()
+        assert StubComponent in entity
+        assert BaseStubComponent in entity
+        assert OtherStubComponent not in entity
+
+    def testSetAttr_DuplicateType_RaisesComponentError(self):
+        entity = StubEntity()
+        entity.component = StubComponent()
+        with pytest.raises(ComponentError):
+            entity.other_component = StubComponent()
+
+    def testDelAttr(self):
+        entity = StubEntity()
+        entity.component = StubComponent()
+        entity.other_component = OtherStubComponent()
+
+        del entity.component
+
+        assert StubComponent not in entity
+        assert entity[BaseStubComponent] is entity.other_component
+        assert list(entity.components) == [entity.other_component]
+
+    def testSlots(self):
+        component = StubComponent()
+        entity = SlottedStubEntity(component)
+        assert not hasattr(entity, "__dict__")
+        assert entity[StubComponent] is component
+        assert component.entity is entity
+
+    def testReinitialize_DetachesComponentsAndRunsConstructor(self):
+        old_component, new_component = StubComponent(), OtherStubComponent()
+        entity = SlottedStubEntity(old_component)
+
+        entity.reinitialize(new_component)
+
+        assert old_component.entity is None
+        assert StubComponent not in entity
+        assert entity[BaseStubComponent] is new_component
+        assert list(entity.components) == [new_component]
+
+
+class TestEntityPool:
+    """Unit tests for the `EntityPool` class."""
+
+    def testAcquire_EmptyPool_ConstructsEntity(self):
+        pool = EntityPool(SlottedStubEntity)
+        component = StubComponent()
+        entity = pool.acquire(component)
+        assert isinstance(entity, SlottedStubEntity)
+        assert entity.component is component
+
+    def testAcquire_ReleasedEntity_ReinitializesEntity(self):
+        world = World()
+        pool = EntityPool(SlottedStubEntity)
+        old_component, new_component = StubComponent(), StubComponent()
+        entity = pool.acquire(old_component)
+        world.add(entity)
+
+        pool.release(entity)
+        reused = pool.acquire(new_component)
+
+        assert reused is entity
+        assert entity not in world
+        assert entity[StubComponent] is new_component
+        assert old_component.entity is None
+
+    def testAcquire_ReleasedEntity_CallsReinitialize(self):
+        calls = []
+
+        class ReusingEntity(SlottedStubEntity):
+            """An entity that keeps its component when it's reused."""
+
+            __slots__ = ()
+
+            def reinitialize(self, *args, **kwargs):
+                calls.append((args, kwargs))
+
+        pool = EntityPool(ReusingEntity)
+        component, unused = StubComponent(), StubComponent()
+        pool.release(pool.acquire(component))
+
+        entity = pool.acquire(unused)
+
+        assert calls == [((unused,), {})]
+        assert entity.component is component
+
+    def testAcquire_ReleasedWhileDeferring_WaitsForFlush(self):
+        world = World()
+        pool = EntityPool(SlottedStubEntity)
+        entity = pool.acquire(StubComponent())
+        world.add(entity)
+
+        with world.deferred():
+            pool.release(entity)
+            assert pool.acquire(StubComponent()) is not entity
+
+        assert pool.acquire(StubComponent()) is entity
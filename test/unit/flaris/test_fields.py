@@ -0,0 +1,114 @@
+"""Unit tests for the `flaris.fields` module."""
+import copy
+import gc
+
+import numpy as np
+
+from flaris.fields import ArrayComponent, ComponentArray, Field
+
+
+class StubComponent(ArrayComponent):
+    """A simple component with fields used for testing."""
+
+    scalar = Field(default=1.0)
+    vector = Field(3)
+    pair = Field(2, wrap=lambda x, y: (x, y))
+
+
+class SubStubComponent(StubComponent):
+    """A component that shares the fields of its base class."""
+
+
+class ExtendedStubComponent(StubComponent):
+    """A component that declares additional fields."""
+
+    extra = Field()
+
+
+class TestField:
+    """Unit tests for the `Field` class."""
+
+    def testGet_Default(self):
+        component = StubComponent()
+        assert component.scalar == 1.0
+        assert isinstance(component.scalar, float)
+        assert np.array_equal(component.vector, [0, 0, 0])
+
+    def testSet(self):
+        component = StubComponent()
+        component.vector = (1, 2, 3)
+        component.vector += np.array([1, 1, 1])
+        assert np.array_equal(component.vector, [2, 3, 4])
+
+    def testGet_Wrap(self):
+        component = StubComponent()
+        component.pair = [1, 2]
+        assert component.pair == (1.0, 2.0)
+
+    def testGet_ReturnsCopy(self):
+        component = StubComponent()
+        component.vector[0] = 5
+        assert component.vector[0] == 0
+
+    def testSet_StoresValueInArray(self):
+        component = StubComponent()
+        component.scalar = 7
+        assert StubComponent.ARRAY["scalar"][component.slot] == 7
+
+
+class TestComponentArray:
+    """Unit tests for the `ComponentArray` class."""
+
+    def testAllocate_Full_GrowsAndKeepsValues(self):
+        array = ComponentArray({"value": Field()}, capacity=2)
+        slots = [array.allocate() for _ in range(2)]
+        array["value"][slots] = [1, 2]
+
+        slot = array.allocate()
+
+        assert array.capacity == 4
+        assert len(array) == 3
+        assert list(array["value"][slots]) == [1, 2]
+        assert slot not in slots
+
+    def testRelease_ReusesLowestSlot(self):
+        array = ComponentArray({"value": Field(default=3)})
+        slots = [array.allocate() for _ in range(3)]
+        array["value"][slots[0]] = 5
+
+        array.release(slots[0])
+
+        assert array.allocate() == slots[0]
+        assert array["value"][slots[0]] == 3
+
+
+class TestArrayComponent:
+    """Unit tests for the `ArrayComponent` class."""
+
+    def testDel_ReleasesSlot(self):
+        component = StubComponent()
+        slot = component.slot
+        del component
+        gc.collect()
+        assert StubComponent().slot == slot
+
+    def testCopy_UsesOwnSlot(self):
+        component = StubComponent()
+        component.vector = (1, 2, 3)
+
+        component_copy = copy.copy(component)
+        component_copy.vector = (4, 5, 6)
+
+        assert component_copy.slot != component.slot
+        assert np.array_equal(component.vector, [1, 2, 3])
+
+    def testArray_SubclassWithoutFields_SharesArray(self):
+        assert SubStubComponent.ARRAY is StubComponent.ARRAY
+
+    def testArray_SubclassWithFields_HasOwnArray(self):
+        component = ExtendedStubComponent()
+        assert ExtendedStubComponent.ARRAY is not StubComponent.ARRAY
+        assert set(ExtendedStubComponent.ARRAY.fields) == {
+            "scalar", "vector", "pair", "extra"
+        }
+        assert component.scalar == 1.0
@@ -0,0 +1,122 @@
+"""Unit tests for the `flaris.game` module."""
+import subprocess
+import sys
+
+import pytest
+
+from flaris.game import Game
+from flaris.system import System
+
+
+class DeltaRecordingSystem(System):
+    """A system that records the delta of each step."""
+
+    READS = WRITES = ()
+
+    def __init__(self):
+        super().__init__()
+        self.deltas = []
+
+    def step(self, delta: float) -> None:
+        self.deltas.append(delta)
+
+
+class StoppingSystem(System):
+    """A system that stops the game after a number of steps."""
+
+    READS = WRITES = ()
+
+    def __init__(self, game: Game, steps: int):
+        super().__init__()
+        self.game = game
+        self.steps = steps
+
+    def step(self, delta: float) -> None:
+        self.steps -= 1
+        if not self.steps:
+            self.game.stop()
+
+
+def create_game(**kwargs) -> Game:
+    return Game("Test", headless=True, **kwargs)
+
+
+class TestGame:
+    """Unit tests for the `Game` class."""
+
+    def testStep_NoTimestep_StepsOncePerFrame(self):
+        game = create_game()
+        system = DeltaRecordingSystem()
+        game.add_system(system)
+
+        game.step(0.05)
+
+        assert system.deltas == [0.05]
+        assert game.world.alpha == 1.0
+
+    def testStep_FixedTimestep_StepsInFixedIncrements(self):
+        game = create_game(timestep=0.02)
+        system = DeltaRecordingSystem()
+        game.add_system(system)
+
+        game.step(0.05)
+
+        assert system.deltas == [0.02, 0.02]
+        assert game.world.alpha == pytest.approx(0.5)
+
+    def testStep_FixedTimestep_CarriesRemainderToNextFrame(self):
+        game = create_game(timestep=0.25)
+        system = DeltaRecordingSystem()
+        game.add_system(system)
+
+        game.step(0.375)
+        game.step(0.125)
+
+        assert system.deltas == [0.25, 0.25]
+        assert game.world.alpha == 0.0
+
+    def testStep_SlowFrame_LimitsStepsAndDropsBacklog(self):
+        game = create_game(timestep=0.01, max_steps=3)
+        system = DeltaRecordingSystem()
+        game.add_system(system)
+
+        game.step(1.005)
+        assert len(system.deltas) == 3
+        assert game.world.alpha == pytest.approx(0.5)
+
+        game.step(0.0)
+        assert len(system.deltas) == 3
+
+    def testInit_Headless_DoesNotImportGraphicsModules(self):
+        code = ("import sys, flaris; flaris.Game('Test', headless=True); "
+                "print(sorted({name.split('.')[0] for name in sys.modules}))")
+        output = subprocess.run([sys.executable, "-c", code],
+                                check=True,
+                                stdout=subprocess.PIPE,
+                                universal_newlines=True).stdout
+
+        for module in ("OpenGL", "glfw", "freetype", "openal"):
+            assert f"'{module}'" not in output
+
+    def testRun_Headless_RaisesRuntimeError(self):
+        with pytest.raises(RuntimeError):
+            create_game().run(640, 480)
+
+    def testRunHeadless_Rate_StepsByTickDuration(self):
+        game = create_game()
+        system = DeltaRecordingSystem()
+        game.add_system(system)
+
+        game.run_headless(steps=3, rate=1000)
+
+        assert system.deltas == [0.001] * 3
+
+    def testRunHeadless_Stop_StopsAfterCurrentTick(self):
+        game = create_game(timestep=0.01)
+        system = DeltaRecordingSystem()
+        game.add_system(system)
+        game.add_system(StoppingSystem(game, steps=4))
+
+        game.run_headless(rate=100)
+
+        assert system.deltas == [0.01] * 4
@@ -0,0 +1,159 @@
+"""Unit tests for the `flaris.physics` module."""
+import numpy as np
+import pytest
+
+from flaris import (BoxCollider, CircleCollider, Entity, PhysicsSystem,
+                    RigidBody, SphereCollider, Transform, Vector, World)
+
+
+class Body(Entity):
+    """An entity with a transform, a collider, and optionally a body."""
+
+    def __init__(self, position, collider=None, body=None):
+        super().__init__()
+        self.transform = Transform(position)
+        if collider is not None:
+            self.collider = collider
+        if body is not None:
+            self.body = body
+
+
+def _world(*entities, **kwargs):
+    """Return a physics system registered with a world of entities."""
+    world = World()
+    system = PhysicsSystem(**kwargs)
+    world.register(system)
+    for entity in entities:
+        world.add(entity)
+    return system
+
+
+class TestPhysicsSystem:
+    """Unit tests for the `PhysicsSystem` class."""
+
+    def testStep_Gravity_Integrated(self):
+        ball = Body(Vector(0, 10, 0), body=RigidBody())
+        system = _world(ball, timestep=None)
+
+        system.step(0.5)
+
+        assert ball.body.velocity == Vector(0, -9.81 / 2, 0)
+        assert ball.transform.position.y == pytest.approx(10 - 9.81 / 4)
+
+    def testStep_Kinematic_IgnoresGravity(self):
+        platform = Body(Vector(0, 0, 0),
+                        body=RigidBody(mass=0, velocity=Vector(1, 0, 0)))
+        system = _world(platform, timestep=None)
+
+        system.step(2)
+
+        assert platform.transform.position == Vector(2, 0, 0)
+
+    def testStep_FixedTimestep_AccumulatesTime(self):
+        ball = Body(Vector(0, 0, 0),
+                    body=RigidBody(velocity=Vector(1, 0, 0), gravity_scale=0))
+        system = _world(ball, timestep=0.1)
+
+        system.step(0.05)
+        assert ball.transform.position.x == 0
+
+        system.step(0.2)
+        assert ball.transform.position.x == pytest.approx(0.2)
+
+    @pytest.mark.parametrize("collider", [
+        SphereCollider(0.5),
+        BoxCollider(Vector(1, 1, 1)),
+        CircleCollider(0.5),
+    ])
+    def testStep_Falling_RestsOnFloor(self, collider):
+        ball = Body(Vector(0, 3, 0), collider, RigidBody())
+        floor = Body(Vector(0, 0, 0), BoxCollider(Vector(10, 1, 10)))
+        system = _world(ball, floor)
+
+        for _ in range(180):
+            system.step(1 / 60)
+
+        assert ball.transform.position.y == pytest.approx(1, abs=0.02)
+        assert abs(ball.body.velocity.y) < 0.2
+        assert len(system.contacts.first) == 1
+        # Normals point from the first entity of a pair to the second.
+        upwards = 1 if system.contacts.first[0] is floor else -1
+        assert {*system.contacts.first,
+                *system.contacts.second} == {ball, floor}
+        assert np.allclose(system.contacts.normals * upwards, [[0, 1, 0]])
+
+    def testStep_HeadOnCollision_ExchangesVelocities(self):
+        left = Body(
+            Vector(-0.45, 0, 0), SphereCollider(0.5),
+            RigidBody(velocity=Vector(1, 0, 0), restitution=1, gravity_scale=0))
+        right = Body(
+            Vector(0.45, 0, 0), SphereCollider(0.5),
+            RigidBody(velocity=Vector(-1, 0, 0), restitution=1,
+                      gravity_scale=0))
+        system = _world(left, right, timestep=None)
+
+        system.step(0)
+
+        assert left.body.velocity.x == pytest.approx(-1)
+        assert right.body.velocity.x == pytest.approx(1)
+        assert left.transform.position.x < -0.45
+        assert right.transform.position.x > 0.45
+
+    def testStep_Trigger_ReportedWithoutResolving(self):
+        ball = Body(Vector(0, 0, 0), SphereCollider(0.5),
+                    RigidBody(gravity_scale=0))
+        zone = Body(Vector(0.5, 0, 0), BoxCollider(trigger=True))
+        system = _world(ball, zone, timestep=None)
+        events = []
+        system.on_trigger = events.append
+
+        system.step(0)
+
+        assert ball.transform.position == Vector(0, 0, 0)
+        assert not system.contacts.first
+        assert len(events) == 1
+        assert {*events[0].first, *events[0].second} == {ball, zone}
+
+    def testStep_Circles_IgnoreZ(self):
+        first = Body(Vector(0, 0, 0), CircleCollider(1),
+                     RigidBody(gravity_scale=0))
+        second = Body(Vector(1, 0, 50), CircleCollider(1),
+                      RigidBody(gravity_scale=0))
+        system = _world(first, second, timestep=None)
+
+        system.step(0)
+
+        assert len(system.contacts.first) == 1
+        assert np.allclose(np.abs(system.contacts.normals), [[1, 0, 0]])
+        assert system.contacts.depths[0] == pytest.approx(1)
+
+    def testStep_Separated_NoContacts(self):
+        bodies = [
+            Body(Vector(i * 2, 0, 0), SphereCollider(0.5),
+                 RigidBody(gravity_scale=0)) for i in range(10)
+        ]
+        system = _world(*bodies, timestep=None)
+
+        system.step(0)
+
+        assert not system.contacts.first
+
+    def testStep_ManyBodies_MatchesBruteForce(self):
+        random = np.random.default_rng(0)
+        positions = random.uniform(0, 20, (300, 3))
+        bodies = [
+            Body(Vector(*position), SphereCollider(0.5),
+                 RigidBody(gravity_scale=0)) for position in positions
+        ]
+        system = _world(*bodies, timestep=None)
+
+        system.step(0)
+
+        distances = np.linalg.norm(positions[:, np.newaxis] - positions, axis=2)
+        expected = {(i, j) for i, j in zip(*np.nonzero(distances < 1)) if i < j}
+        index = {body: i for i, body in enumerate(bodies)}
+        found = {
+            tuple(sorted((index[a], index[b])))
+            for a, b in zip(system.contacts.first, system.contacts.second)
+        }
+        assert found == expected
@@ -0,0 +1,112 @@
+"""Unit tests for the `flaris.profiler` module."""
+import json
+
+import pytest
+
+from flaris.profiler import PROFILER, Profiler
+from flaris.scheduler import ParallelSystem
+from flaris.system import SequentialSystem, System
+
+
+class StubSystem(System):
+    """A simple system used for testing."""
+
+    READS = WRITES = ()
+
+    def step(self, delta: float) -> None:
+        pass
+
+
+class OtherStubSystem(StubSystem):
+    """Another simple system used for testing."""
+
+
+@pytest.fixture(name="profiler")
+def fixture_profiler():
+    PROFILER.reset()
+    PROFILER.enable()
+    yield PROFILER
+    PROFILER.disable()
+    PROFILER.reset()
+
+
+class TestProfiler:
+    """Unit tests for the `Profiler` class."""
+
+    def testStats(self):
+        profiler = Profiler()
+        system = StubSystem()
+        for duration in range(1, 101):
+            profiler.record(system, 0, duration)
+
+        (stats,) = profiler.stats()
+
+        assert stats.name == "StubSystem"
+        assert stats.count == 100
+        assert stats.min == 1
+        assert stats.mean == pytest.approx(50.5)
+        assert stats.p95 == 95
+        assert stats.p99 == 99
+
+    def testStats_KeepsRollingWindow(self):
+        profiler = Profiler(window=10)
+        system = StubSystem()
+        for duration in range(100):
+            profiler.record(system, 0, duration)
+
+        (stats,) = profiler.stats()
+
+        assert stats.count == 10
+        assert stats.min == 90
+
+    def testSequentialSystemStep_Enabled_TimesNestedSystems(self, profiler):
+        system = SequentialSystem(
+            [StubSystem(), SequentialSystem([OtherStubSystem()])])
+
+        system.step(0)
+
+        names = [stats.name for stats in profiler.stats()]
+        assert names == ["StubSystem", "OtherStubSystem", "SequentialSystem"]
+
+    def testParallelSystemStep_Enabled_TimesSystems(self, profiler):
+        system = ParallelSystem([StubSystem(), OtherStubSystem()])
+
+        system.step(0)
+        system.exit()
+
+        names = {stats.name for stats in profiler.stats()}
+        assert names == {"StubSystem", "OtherStubSystem"}
+
+    def testSequentialSystemStep_Disabled_RecordsNothing(self):
+        SequentialSystem([StubSystem()]).step(0)
+        assert not PROFILER.stats()
+
+    def testCapture_StopsAfterFrames(self, profiler):
+        system = SequentialSystem([StubSystem()])
+        profiler.capture(frames=2)
+
+        for _ in range(3):
+            system.step(0)
+            profiler.end_frame()
+
+        events = [
+            event for event in profiler.trace()["traceEvents"]
+            if event["ph"] == "X"
+        ]
+        assert len(events) == 2
+        assert not profiler.capturing
+
+    def testExport(self, profiler, tmp_path):
+        profiler.capture(frames=1)
+        SequentialSystem([StubSystem()]).step(0)
+
+        path = tmp_path / "trace.json"
+        profiler.export(str(path))
+
+        with open(path, encoding="utf-8") as file:
+            trace = json.load(file)
+        (event,) = [
+            event for event in trace["traceEvents"] if event["ph"] == "X"
+        ]
+        assert event["name"] == "StubSystem"
+        assert event["dur"] >= 0
@@ -0,0 +1,131 @@
+"""Unit tests for the `flaris.scheduler` module."""
+import threading
+import time
+
+from flaris.component import Component
+from flaris.scheduler import ParallelSystem
+from flaris.system import System
+
+
+class StubComponent(Component):
+    """A simple component used for testing."""
+
+
+class OtherStubComponent(Component):
+    """Another simple component used for testing."""
+
+
+class RecordingSystem(System):
+    """A system that records when and where it was stepped."""
+
+    def __init__(self, log: list, callback=None):
+        super().__init__()
+        self.log = log
+        self.callback = callback
+        self.thread = None
+
+    def step(self, delta: float) -> None:
+        self.thread = threading.current_thread()
+        if self.callback:
+            self.callback()
+        self.log.append(self)
+
+
+class UndeclaredSystem(RecordingSystem):
+    """A system that doesn't declare the components it accesses."""
+
+
+class ReadingSystem(RecordingSystem):
+    """A system that reads `StubComponent`."""
+
+    READS = (StubComponent,)
+    WRITES = ()
+
+
+class WritingSystem(RecordingSystem):
+    """A system that writes `StubComponent`."""
+
+    READS = ()
+    WRITES = (StubComponent,)
+
+
+class OtherWritingSystem(RecordingSystem):
+    """A system that writes `OtherStubComponent`."""
+
+    READS = ()
+    WRITES = (OtherStubComponent,)
+
+
+class MainThreadSystem(RecordingSystem):
+    """A system that must run on the main thread."""
+
+    READS = WRITES = ()
+    MAIN_THREAD = True
+
+
+class TestParallelSystem:
+    """Unit tests for the `ParallelSystem` class."""
+
+    def testStep_UndeclaredSystems_RunInOrderOnMainThread(self):
+        log = []
+        systems = [UndeclaredSystem(log) for _ in range(5)]
+        scheduler = ParallelSystem(systems)
+
+        scheduler.step(0)
+        scheduler.exit()
+
+        assert log == systems
+        assert all(
+            system.thread is threading.main_thread() for system in systems)
+
+    def testStep_ConflictingSystems_RunInOrder(self):
+        log = []
+        systems = [
+            WritingSystem(log),
+            ReadingSystem(log),
+            WritingSystem(log),
+        ]
+        scheduler = ParallelSystem(systems)
+
+        for _ in range(10):
+            log.clear()
+            scheduler.step(0)
+            assert log == systems
+        scheduler.exit()
+
+    def testStep_IndependentSystems_RunConcurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+        log = []
+        systems = [
+            WritingSystem(log, barrier.wait),
+            OtherWritingSystem(log, barrier.wait)
+        ]
+        scheduler = ParallelSystem(systems, workers=2)
+
+        scheduler.step(0)
+        scheduler.exit()
+
+        assert set(log) == set(systems)
+        assert not barrier.broken
+
+    def testStep_MainThreadSystem_RunsOnMainThread(self):
+        log = []
+        system = MainThreadSystem(log)
+        scheduler = ParallelSystem([WritingSystem(log), system])
+
+        scheduler.step(0)
+        scheduler.exit()
+
+        assert system.thread is threading.main_thread()
+
+    def testStep_CriticalPath(self):
+        log = []
+        first = WritingSystem(log, lambda: time.sleep(0.05))
+        second = ReadingSystem(log)
+        scheduler = ParallelSystem([first, OtherWritingSystem(log), second])
+
+        scheduler.step(0)
+        scheduler.exit()
+
+        assert scheduler.critical_path == [first, second]
+        assert scheduler.critical_path_time >= 0.05
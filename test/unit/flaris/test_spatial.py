@@ -0,0 +1,249 @@
+"""Unit tests for the `flaris.spatial` module."""
+import numpy as np
+import pytest
+
+from flaris import BVH, Entity, HashGrid, SpatialSystem, Transform, Vector
+from flaris import World
+
+
+class StubEntity(Entity):
+    """A simple entity with a transform used for testing."""
+
+    def __init__(self, position: Vector = Vector(0, 0, 0)):
+        super().__init__()
+        self.transform = Transform(position)
+
+
+INDEXES = [
+    lambda: HashGrid(cell_size=2),
+    lambda: HashGrid(cell_size=0.5, dimensions=2),
+    lambda: BVH(leaf_size=4),
+    lambda: BVH(dimensions=2),
+]
+
+
+def _populate(index, count=200, seed=0):
+    """Insert entities at random positions with random radii."""
+    random = np.random.default_rng(seed)
+    positions = random.uniform(-10, 10, (count, 3))
+    radii = random.uniform(0, 1, count)
+    entities = [Entity() for _ in range(count)]
+    for entity, position, radius in zip(entities, positions, radii):
+        index.insert(entity, position, radius)
+    return entities, positions[:, :index.dimensions], radii
+
+
+@pytest.mark.parametrize("make_index", INDEXES)
+class TestSpatialIndex:
+    """Unit tests comparing each index with a brute-force search."""
+
+    def testWithin(self, make_index):
+        index = make_index()
+        entities, positions, radii = _populate(index)
+        center = np.array([1.0, -2.0, 0.5])[:index.dimensions]
+
+        found = index.within(center, 3)
+
+        distances = np.linalg.norm(positions - center, axis=1)
+        expected = {e for e, d in zip(entities, distances - radii) if d <= 3}
+        assert set(found) == expected
+        assert len(found) == len(expected)
+
+    def testOverlapping(self, make_index):
+        index = make_index()
+        entities, positions, radii = _populate(index)
+        lower = np.array([-4.0, 0.0, -10.0])[:index.dimensions]
+        upper = np.array([2.0, 5.0, 10.0])[:index.dimensions]
+
+        found = index.overlapping(lower, upper)
+
+        closest = np.clip(positions, lower, upper)
+        distances = np.linalg.norm(positions - closest, axis=1)
+        assert set(found) == {
+            e for e, d, r in zip(entities, distances, radii) if d <= r
+        }
+
+    def testNearest(self, make_index):
+        index = make_index()
+        entities, positions, radii = _populate(index)
+        point = np.array([20.0, 3.0, -1.0])[:index.dimensions]
+
+        found = index.nearest(point, 5)
+
+        distances = np.maximum(
+            np.linalg.norm(positions - point, axis=1) - radii, 0)
+        assert found == [entities[i] for i in np.argsort(distances)[:5]]
+
+    def testNearest_MoreThanLength_ReturnsAll(self, make_index):
+        index = make_index()
+        entities, _, _ = _populate(index, count=3)
+        assert set(index.nearest((0, 0, 0), 10)) == set(entities)
+
+    def testRaycast(self, make_index):
+        index = make_index()
+        entities, positions, radii = _populate(index)
+        origin = np.array([-12.0, 0.5, 0.0])[:index.dimensions]
+        direction = np.array([1.0, 0.1, 0.0])[:index.dimensions]
+
+        hits = index.raycast(origin, direction, max_distance=15)
+
+        unit = direction / np.linalg.norm(direction)
+        offsets = positions - origin
+        along = offsets @ unit
+        squared = np.sum(offsets**2, axis=1) - along**2
+        entering = along - np.sqrt(np.maximum(radii**2 - squared, 0))
+        expected = [
+            entities[i]
+            for i in np.argsort(entering)
+            if squared[i] < radii[i]**2 and 0 <= entering[i] <= 15
+        ]
+        assert [entity for entity, _ in hits] == expected
+        assert [d for _, d in hits] == sorted(d for _, d in hits)
+
+    def testRaycast_SphereBehindOrigin_Missed(self, make_index):
+        index = make_index()
+        behind, around = Entity(), Entity()
+        index.insert(behind, np.array([-0.8, 0.9, 0.0])[:index.dimensions], 1)
+        index.insert(around, np.array([0.1, -0.2, 0.0])[:index.dimensions], 1)
+
+        hits = index.raycast(np.zeros(index.dimensions),
+                             np.array([1.0, 0.0, 0.0])[:index.dimensions])
+
+        assert hits == [(around, 0.0)]
+
+    def testRemove(self, make_index):
+        index = make_index()
+        entities, _, _ = _populate(index, count=20)
+        assert index.within((0, 0, 0), 100)
+
+        for entity in entities[::2]:
+            index.remove(entity)
+
+        assert len(index) == 10
+        assert set(index.within((0, 0, 0), 100)) == set(entities[1::2])
+        assert entities[0] not in index
+
+    def testUpdate(self, make_index):
+        index = make_index()
+        entities, positions, _ = _populate(index, count=50)
+        positions = positions.copy()
+        positions[7] = 100
+
+        index.update(positions)
+
+        assert index.nearest((100, 100, 100)) == [entities[7]]
+        assert entities[7] not in index.within((0, 0, 0), 20)
+
+    def testMove(self, make_index):
+        index = make_index()
+        entity = Entity()
+        index.insert(entity, (0, 0, 0))
+
+        index.move(entity, (5, 5, 5), radius=1)
+
+        assert index.within((5, 6, 5), 0) == [entity]
+        assert not index.within((0, 0, 0), 1)
+
+    def testInsert_AlreadyAdded_RaisesValueError(self, make_index):
+        index = make_index()
+        entity = Entity()
+        index.insert(entity, (0, 0, 0))
+        with pytest.raises(ValueError):
+            index.insert(entity, (1, 0, 0))
+
+    def testQueries_Empty(self, make_index):
+        index = make_index()
+        assert index.within((0, 0, 0), 1) == []
+        assert index.nearest((0, 0, 0)) == []
+        assert index.raycast((0, 0, 0), (1, 0, 0)) == []
+
+
+class TestSpatialIndexArguments:
+    """Unit tests for invalid arguments to spatial indexes."""
+
+    def testInit_InvalidDimensions_RaisesValueError(self):
+        with pytest.raises(ValueError):
+            HashGrid(dimensions=4)
+
+    def testRaycast_ZeroDirection_RaisesValueError(self):
+        with pytest.raises(ValueError):
+            BVH().raycast((0, 0, 0), (0, 0, 0))
+
+    def testRemove_Missing_RaisesValueError(self):
+        with pytest.raises(ValueError):
+            HashGrid().remove(Entity())
+
+
+class TestSpatialSystem:
+    """Unit tests for the `SpatialSystem` class."""
+
+    def testStep_EntityMoved_Updated(self):
+        world = World()
+        system = SpatialSystem(HashGrid(cell_size=4))
+        world.register(system)
+        entity = StubEntity(Vector(1, 1, 1))
+        world.add(entity)
+        assert system.index.within(Vector(0, 0, 0), 2) == [entity]
+
+        entity.transform.translate(Vector(10, 0, 0))
+        system.step(0)
+
+        assert not system.index.within(Vector(0, 0, 0), 2)
+        assert system.index.within(Vector(11, 1, 1), 0) == [entity]
+
+    def testStep_ParentMoved_ChildUpdated(self):
+        world = World()
+        system = SpatialSystem(BVH())
+        world.register(system)
+        parent, child = StubEntity(), StubEntity(Vector(1, 0, 0))
+        child.transform.parent = parent.transform
+        world.add(parent)
+        world.add(child)
+
+        parent.transform.translate(Vector(0, 5, 0))
+        system.step(0)
+
+        assert system.index.nearest(Vector(1, 5, 0)) == [child]
+
+    def testRemove(self):
+        world = World()
+        system = SpatialSystem()
+        world.register(system)
+        entities = [StubEntity(Vector(i, 0, 0)) for i in range(3)]
+        for entity in entities:
+            world.add(entity)
+
+        world.remove(entities[0])
+        entities[2].transform.translate(Vector(0, 3, 0))
+        system.step(0)
+
+        assert entities[0] not in system.index
+        assert system.index.nearest(Vector(2, 3, 0)) == [entities[2]]
+
+    def testAdd_ManyEntities_WorldMatricesComputedOnce(self, monkeypatch):
+        world = World()
+        system = SpatialSystem()
+        world.register(system)
+        calls = []
+        world_matrices = Transform.ARRAY.world_matrices
+        monkeypatch.setattr(
+            Transform.ARRAY, "world_matrices",
+            lambda rows: calls.append(rows) or world_matrices(rows))
+
+        for i in range(3):
+            world.add(StubEntity(Vector(i, 0, 0)))
+
+        assert len(system.index) == 3
+        assert len(calls) == 1
+
+    def testRemove_BeforeInserted_NeverInserted(self):
+        world = World()
+        system = SpatialSystem()
+        world.register(system)
+        entities = [StubEntity(Vector(i, 0, 0)) for i in range(2)]
+        for entity in entities:
+            world.add(entity)
+
+        world.remove(entities[0])
+
+        assert system.index.entities == [entities[1]]
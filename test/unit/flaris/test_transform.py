@@ -1,8 +1,12 @@
 """Unit tests for flaris.transform."""
 import copy
+from dataclasses import FrozenInstanceError
+
+import glm
+import numpy as np
 import pytest
 
-from flaris import Vector, Transform
+from flaris import Entity, Quaternion, Vector, VectorArray, Transform, World
 
 
 class TestVector:
@@ -67,6 +71,65 @@ class TestVector:
     def testRepr(self, vector, expected_string):
         assert repr(vector) == expected_string
 
+    def testHash_EqualVectors_Equal(self):
+        assert hash(Vector(1, 2, 3)) == hash(Vector(1, 2, 3))
+
+    def testIter_Unpack(self):
+        x, y, z = Vector(1, 2, 3)
+        assert (x, y, z) == (1, 2, 3)
+
+    def testSetAttr_RaisesFrozenInstanceError(self):
+        vector = Vector(1, 2, 3)
+        with pytest.raises(FrozenInstanceError):
+            vector.x = 5
+        assert vector == Vector(1, 2, 3)
+
+    def testSetAttr_TransformField_RaisesFrozenInstanceError(self):
+        transform = Transform()
+        with pytest.raises(FrozenInstanceError):
+            transform.position.x = 5
+        assert transform.position == Vector(0, 0, 0)
+
+
+class TestVectorArray:
+    """Unit tests for flaris.transform.VectorArray."""
+
+    def testAdd(self):
+        vectors = VectorArray([Vector(1, 6, 3), Vector(3, 9, 4)])
+        result = vectors + VectorArray([Vector(-7, -4, 2), Vector(1, 1, 1)])
+        assert list(result) == [Vector(-6, 2, 5), Vector(4, 10, 5)]
+        difference = vectors - Vector(1, 1, 1)
+        assert list(difference) == [Vector(0, 5, 2), Vector(2, 8, 3)]
+
+    def testMul(self):
+        vectors = VectorArray([Vector(1, 2, 3)])
+        assert (2 * vectors)[0] == Vector(2, 4, 6)
+        assert (vectors * Vector(0, 1, 2))[0] == Vector(0, 2, 6)
+
+    def testMatmul(self):
+        vectors = VectorArray([Vector(1, 0, 0), Vector(1, 2, 3)])
+        assert list(vectors @ Vector(1, 1, 1)) == [1, 6]
+
+    def testMod_NotInt_RaisesValueError(self):
+        with pytest.raises(ValueError):
+            VectorArray([Vector(1, 2, 3)]) % 2.5  # pylint: disable=expression-not-assigned  # noqa: E501
+
+    def testIAdd_WrappedColumn_ModifiesColumn(self):
+        column = np.zeros((2, 3))
+        vectors = VectorArray(column)
+
+        vectors += Vector(1, 2, 3)
+        # Slices are vector arrays, but pylint infers a `Vector`.
+        vectors[1:].imul(2)  # pylint: disable=no-member
+
+        assert vectors.array is column
+        assert np.array_equal(column, [[1, 2, 3], [2, 4, 6]])
+
+    def testEq(self):
+        assert VectorArray([Vector(1, 2, 3)]) == VectorArray([(1, 2, 3)])
+        assert VectorArray([Vector(1, 2, 3)]) != VectorArray()
+        assert VectorArray() != Vector(0, 0, 0)
+
 
 class TestTransform:
     """Unit tests for flaris.transform.Transform."""
@@ -110,6 +173,33 @@ class TestTransform:
         transform.rotate(angles)
         assert transform.rotation == expected_rotation
 
+    def testRotation_Set_UpdatesOrientation(self):
+        transform = Transform(rotation=Vector(90, 0, 0))
+        assert np.allclose(transform.orientation,
+                           [np.sqrt(0.5), np.sqrt(0.5), 0, 0])
+
+    @pytest.mark.parametrize("rotation", [
+        Vector(30, 45, 60),
+        Vector(350, 10, 200),
+        Vector(0, 0, 0),
+    ])
+    def testOrientation_Set_UpdatesRotation(self, rotation):
+        orientation = Transform(rotation=rotation).orientation
+        transform = Transform()
+
+        transform.orientation = orientation
+
+        assert isinstance(transform.orientation, Quaternion)
+        assert np.allclose(list(transform.rotation), list(rotation))
+
+    def testVersion_Modified_Changes(self):
+        transform = Transform()
+        version = transform.version
+
+        transform.translate(Vector(1, 0, 0))
+
+        assert transform.version != version
+
     # pylint: disable=line-too-long
     @pytest.mark.parametrize("transform, expected_string", [
         (Transform(), "Transform()"),
@@ -122,3 +212,127 @@ class TestTransform:
     ])
     def testRepr(self, transform, expected_string):
         assert repr(transform) == expected_string
+
+
+class StubEntity(Entity):
+    """An entity with a transform used for testing."""
+
+    def __init__(self):
+        super().__init__()
+        self.transform = Transform()
+
+
+def _glm_model(transform):
+    """Return the column-major model matrix of a transform computed by glm."""
+    model = glm.translate(glm.mat4(1.0), glm.vec3(*transform.position))
+    for angle, axis in zip(transform.rotation, glm.mat3(1.0)):
+        model = glm.rotate(model, glm.radians(angle), axis)
+    return np.array(glm.scale(model, glm.vec3(*transform.scale))).T
+
+
+class TestTransformArray:
+    """Unit tests for flaris.transform.TransformArray."""
+
+    def testModelMatrices(self):
+        transforms = [
+            Transform(),
+            Transform(position=Vector(1, -2, 3)),
+            Transform(rotation=Vector(30, 45, 60)),
+            Transform(Vector(4, 5, 6), Vector(-10, 200, 75), Vector(1, 2, 3)),
+        ]
+        rows = [transform.slot for transform in transforms]
+
+        matrices = Transform.ARRAY.model_matrices(rows)
+
+        assert matrices.shape == (4, 4, 4)
+        assert matrices.dtype == np.float32
+        for transform, matrix in zip(transforms, matrices):
+            assert np.allclose(matrix, _glm_model(transform), atol=1e-5)
+
+    def testModelMatrices_Unmodified_Cached(self):
+        transform = Transform(position=Vector(1, 2, 3))
+        rows = slice(transform.slot, transform.slot + 1)
+        matrices = Transform.ARRAY.model_matrices(rows)
+
+        # Writing to the column directly isn't tracked, so the cached matrix
+        # is returned.
+        Transform.ARRAY["position"][transform.slot] = (4, 5, 6)
+
+        assert np.array_equal(Transform.ARRAY.model_matrices(rows), matrices)
+
+    def testModelMatrices_BatchModified_Recomputed(self):
+        world = World()
+        entity = StubEntity()
+        world.add(entity)
+        assert np.allclose(entity.transform.model[3, :3], [0, 0, 0])
+
+        world.batch(Transform)[Transform].position += [1, 2, 3]
+
+        assert np.allclose(entity.transform.model[3, :3], [1, 2, 3])
+
+    def testModel(self):
+        transform = Transform(Vector(1, 2, 3), Vector(0, 90, 0))
+        assert np.allclose(transform.model, _glm_model(transform), atol=1e-5)
+
+
+class TestTransformHierarchy:
+    """Unit tests for parent-child relationships between transforms."""
+
+    def testWorldPosition_Child_RelativeToParent(self):
+        parent = Transform(Vector(1, 0, 0), Vector(0, 0, 90), Vector(2, 2, 2))
+        child = Transform(position=Vector(1, 0, 0))
+
+        child.parent = parent
+
+        assert np.allclose(list(child.world_position), [1, 2, 0])
+        # The matrices are transposed, so the parent's matrix is on the right.
+        expected = np.matmul(_glm_model(child), _glm_model(parent))
+        assert np.allclose(child.world_model, expected, atol=1e-5)
+
+    def testWorldPosition_AncestorMoved_Updated(self):
+        root, child, grandchild = Transform(), Transform(), Transform()
+        child.parent = root
+        grandchild.parent = child
+        assert grandchild.world_position == Vector(0, 0, 0)
+
+        root.translate(Vector(0, 3, 0))
+
+        assert grandchild.world_position == Vector(0, 3, 0)
+
+    def testWorldMatrices_DeepHierarchy(self):
+        nodes = [Transform()]
+        for _ in range(100):
+            node = Transform(position=Vector(1, 0, 0))
+            node.parent = nodes[-1]
+            nodes.append(node)
+
+        nodes[0].translate(Vector(0, 0, 1))
+
+        assert nodes[-1].depth == 100
+        assert nodes[-1].world_position == Vector(100, 0, 1)
+
+    def testParent_None_Detached(self):
+        parent = Transform(position=Vector(5, 0, 0))
+        child = Transform(position=Vector(1, 0, 0))
+        child.parent = parent
+
+        child.parent = None
+
+        assert not parent.children
+        assert child.world_position == Vector(1, 0, 0)
+
+    def testParent_EqualSiblings_RemovesSameTransform(self):
+        parent = Transform()
+        first, second = Transform(), Transform()
+        first.parent = second.parent = parent
+
+        second.parent = None
+
+        assert len(parent.children) == 1
+        assert parent.children[0] is first
+
+    def testParent_Descendant_RaisesValueError(self):
+        parent, child = Transform(), Transform()
+        child.parent = parent
+        with pytest.raises(ValueError):
+            parent.parent = child
@@ -0,0 +1,294 @@
+"""Unit tests for the `flaris.world` module."""
+import pytest
+
+from flaris.component import Component
+from flaris.entity import Entity
+from flaris.system import SequentialSystem, System, UpdateSystem
+from flaris.world import World
+
+
+class BaseStubComponent(Component):
+    """A simple component base class used for testing."""
+
+
+class StubComponent(BaseStubComponent):
+    """A simple component used for testing."""
+
+
+class OtherStubComponent(BaseStubComponent):
+    """Another simple component used for testing."""
+
+
+class StubSystem(System):
+    """A simple system used for testing."""
+
+    REQUIRED_COMPONENTS = (StubComponent,)
+
+    def step(self, delta: float) -> None:
+        pass
+
+
+class BaseStubSystem(StubSystem):
+    """A simple system that requires a component base class."""
+
+    REQUIRED_COMPONENTS = (BaseStubComponent,)
+
+
+class StubEntity(Entity):
+    """A simple entity used for testing."""
+
+    def __init__(self, *components: Component):
+        super().__init__()
+        for i, component in enumerate(components):
+            setattr(self, f"component{i}", component)
+
+
+class SpawningEntity(Entity):
+    """An entity that spawns another entity every update."""
+
+    def update(self, delta: float):
+        self.world.add(StubEntity(StubComponent()))
+
+
+class TestWorld:
+    """Unit tests for the `World` class."""
+
+    def testAdd(self):
+        world = World()
+        entity = StubEntity(StubComponent())
+        world.add(entity)
+        assert entity in world
+        assert entity.world is world
+
+    def testAdd_EntityAlreadyAdded_RaisesValueError(self):
+        world = World()
+        entity = StubEntity()
+        world.add(entity)
+        with pytest.raises(ValueError):
+            World().add(entity)
+
+    def testRemove(self):
+        world = World()
+        entity = StubEntity(StubComponent())
+        world.add(entity)
+        world.remove(entity)
+        assert entity not in world
+        assert entity.world is None
+        assert not list(world.query(StubComponent))
+
+    def testRemove_EntityNotAdded_RaisesValueError(self):
+        with pytest.raises(ValueError):
+            World().remove(StubEntity())
+
+    def testRemove_KeepsColumnsAligned(self):
+        world = World()
+        entities = [
+            StubEntity(StubComponent(), OtherStubComponent()) for _ in range(5)
+        ]
+        for entity in entities:
+            world.add(entity)
+
+        world.remove(entities[1])
+        world.remove(entities[4])
+
+        for stub, other in world.query(StubComponent, OtherStubComponent):
+            assert stub.entity is other.entity
+        assert len(world) == 3
+
+    def testQuery(self):
+        world = World()
+        stub, stub_with_other = StubComponent(), StubComponent()
+        other = OtherStubComponent()
+        world.add(StubEntity(stub))
+        world.add(StubEntity(stub_with_other, other))
+
+        assert set(world.query(StubComponent)) == {(stub,), (stub_with_other,)}
+        assert list(world.query(OtherStubComponent,
+                                StubComponent)) == [(other, stub_with_other)]
+
+    def testQuery_BaseClass(self):
+        world = World()
+        stub, other = StubComponent(), OtherStubComponent()
+        world.add(StubEntity(stub))
+        world.add(StubEntity(other))
+
+        assert set(world.query(BaseStubComponent)) == {(stub,), (other,)}
+
+    def testComponents_BaseClass(self):
+        world = World()
+        stub, other = StubComponent(), OtherStubComponent()
+        world.add(StubEntity(stub, other))
+
+        assert set(world.components(BaseStubComponent)) == {stub, other}
+        assert list(world.components(OtherStubComponent)) == [other]
+
+    def testQuery_ComponentAttachedAfterAdd(self):
+        world = World()
+        entity = StubEntity(StubComponent())
+        world.add(entity)
+        assert not list(world.query(OtherStubComponent))
+
+        entity.other = OtherStubComponent()
+        assert list(world.query(OtherStubComponent)) == [(entity.other,)]
+
+    def testQuery_ComponentRemovedAfterAdd(self):
+        world = World()
+        entity = StubEntity(StubComponent(), OtherStubComponent())
+        world.add(entity)
+
+        del entity.component1
+        assert not list(world.query(OtherStubComponent))
+        assert list(world.query(StubComponent)) == [(entity.component0,)]
+
+    def testColumns(self):
+        world = World()
+        components = [StubComponent() for _ in range(3)]
+        for component in components:
+            world.add(StubEntity(component))
+        world.add(StubEntity(OtherStubComponent()))
+
+        assert list(world.columns(StubComponent)) == [(components,)]
+
+    def testRegister_ExistingEntities_AddedToSystem(self):
+        world = World()
+        accepted, rejected = StubEntity(StubComponent()), StubEntity()
+        world.add(accepted)
+        world.add(rejected)
+
+        system = StubSystem()
+        world.register(SequentialSystem([system]))
+
+        assert system.world is world
+        assert accepted in system
+        assert rejected not in system
+
+    def testAdd_RegisteredSystem(self):
+        world = World()
+        system = StubSystem()
+        world.register(system)
+        accepted, rejected = StubEntity(StubComponent()), StubEntity()
+
+        world.add(accepted)
+        world.add(rejected)
+
+        assert accepted in system
+        assert rejected not in system
+
+    def testAdd_SystemRequiresBaseClass(self):
+        world = World()
+        system = BaseStubSystem()
+        world.register(system)
+        entity = StubEntity(OtherStubComponent())
+
+        world.add(entity)
+
+        assert entity in system
+
+    def testRemove_RegisteredSystem(self):
+        world = World()
+        system = StubSystem()
+        world.register(system)
+        entity = StubEntity(StubComponent())
+        world.add(entity)
+
+        world.remove(entity)
+
+        assert entity not in system
+
+    def testUpdate_ComponentAttached_JoinsSystem(self):
+        world = World()
+        system = StubSystem()
+        world.register(system)
+        entity = StubEntity(OtherStubComponent())
+        world.add(entity)
+        assert entity not in system
+
+        entity.stub = StubComponent()
+
+        assert entity in system
+
+    def testUpdate_ComponentRemoved_LeavesSystem(self):
+        world = World()
+        system = StubSystem()
+        world.register(system)
+        entity = StubEntity(StubComponent(), OtherStubComponent())
+        world.add(entity)
+
+        del entity.component1
+        assert entity in system
+        del entity.component0
+        assert entity not in system
+
+    def testDeferred_AddAndRemove_AppliedOnExit(self):
+        world = World()
+        removed = StubEntity(StubComponent())
+        world.add(removed)
+        added = StubEntity(StubComponent())
+
+        with world.deferred():
+            world.add(added)
+            world.remove(removed)
+            assert added not in world
+            assert removed in world
+
+        assert added in world
+        assert removed not in world
+
+    def testDeferred_ComponentAttached_JoinsSystemOnExit(self):
+        world = World()
+        system = StubSystem()
+        world.register(system)
+        entity = StubEntity(OtherStubComponent())
+        world.add(entity)
+
+        with world.deferred():
+            entity.stub = StubComponent()
+            assert StubComponent in entity
+            assert entity not in system
+
+        assert entity in system
+        assert list(world.query(StubComponent)) == [(entity.stub,)]
+
+    def testDeferred_EntitySpawnsDuringStep(self):
+        world = World()
+        system = UpdateSystem()
+        world.register(system)
+        world.add(SpawningEntity())
+
+        for _ in range(3):
+            with world.deferred():
+                system.step(0)
+
+        assert len(world) == 4
+
+    def testResolve(self):
+        world = World()
+        entity = StubEntity()
+        world.add(entity)
+        assert world.resolve(entity.handle) is entity
+
+    def testResolve_RemovedEntity_ReturnsNone(self):
+        world = World()
+        entity = StubEntity()
+        world.add(entity)
+        handle = entity.handle
+
+        world.remove(entity)
+        world.add(StubEntity())
+
+        assert entity.handle is None
+        assert world.resolve(handle) is None
+
+    def testAdd_ReusesHandleSlots(self):
+        world = World()
+        entities = [StubEntity() for _ in range(3)]
+        for entity in entities:
+            world.add(entity)
+        handles = {entity.handle for entity in entities}
+
+        for entity in entities:
+            world.remove(entity)
+            world.add(entity)
+
+        assert len({entity.handle for entity in entities} | handles) == 6
+        assert {handle & 0xFFFFFFFF for handle in handles} == {0, 1, 2}